@@ -0,0 +1,70 @@
+"""
+accounts/authentication.py
+JWT 인증 (폐기 목록 확인 포함).
+
+JWT_CLAIMS_AUTH 가 켜져 있으면 읽기 요청(GET/HEAD/OPTIONS)은 토큰 claims 로
+ClaimsPrincipal 을 만들어 User/UserRole 조회 없이 처리한다.
+쓰기 요청, claims 가 없는 예전 토큰, pv 가 바뀐 토큰은 기존처럼 DB 에서 User 를 읽는다.
+"""
+from django.conf import settings
+from django.utils.functional import cached_property
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from .revocation import registry
+from .tokens import current_permissions_version
+
+
+class ClaimsPrincipal(TokenUser):
+    """토큰 claims 기반의 가벼운 사용자 객체. 필요할 때만 .user 로 실제 User 로드."""
+
+    @cached_property
+    def role_codes(self):
+        return list(self.token.get("roles", []))
+
+    @cached_property
+    def department_id(self):
+        return self.token.get("deptId")
+
+    @cached_property
+    def user(self):
+        from .models import User
+
+        return User.objects.select_related("department").get(pk=self.id)
+
+    def profile(self):
+        """UserProfileSerializer 와 같은 형태."""
+        return {
+            "id": self.id,
+            "name": self.token.get("name"),
+            "email": self.token.get("email"),
+            "roles": self.role_codes,
+            "dept": self.token.get("dept"),
+            "position": self.token.get("position"),
+            "status": self.token.get("status"),
+        }
+
+
+class PortalJWTAuthentication(JWTAuthentication):
+
+    def authenticate(self, request):
+        self._safe_method = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        if registry.is_revoked(validated_token):
+            raise InvalidToken("폐기된 토큰입니다.")
+        if self._use_claims(validated_token):
+            return ClaimsPrincipal(validated_token)
+        return super().get_user(validated_token)
+
+    def _use_claims(self, validated_token):
+        if not (settings.JWT_CLAIMS_AUTH and getattr(self, "_safe_method", False)):
+            return False
+        if "pv" not in validated_token:
+            return False
+        latest = current_permissions_version(validated_token[api_settings.USER_ID_CLAIM])
+        return latest is None or validated_token["pv"] >= latest
@@ -0,0 +1,247 @@
+"""
+accounts/directory_sync.py
+인사 디렉터리 스냅샷 → Department / User / UserRole 증분 동기화.
+
+  스냅샷(JSON):
+    {"departments": ["영업", ...],
+     "users": [{"email", "name", "department", "position", "status", "roles": [...]}]}
+  스냅샷(CSV): email,name,department,position,status,roles  (roles 는 | 또는 ; 구분)
+
+현재 DB 상태를 한 번에 읽어 메모리에서 diff 를 계산하고,
+바뀐 행만 배치 트랜잭션으로 반영한다 (변경 없는 행은 updated_at 도 그대로).
+status / roles 가 없거나 비어 있는 항목은 해당 값을 건드리지 않는다.
+신규 사용자는 사용 불가 비밀번호로 생성 (비밀번호 재설정 후 로그인).
+"""
+import io
+import json
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import provisioning
+from .models import Department, Role, User, UserRole
+from .revocation import registry
+from .tokens import bump_permissions_versions
+
+SYNC_FIELDS = ("name", "department_id", "position", "status")
+
+
+@dataclass
+class SyncReport:
+    dry_run: bool = False
+    departments_created: list = field(default_factory=list)
+    users_created: int = 0
+    users_updated: int = 0
+    users_deactivated: int = 0
+    users_unchanged: int = 0
+    roles_added: int = 0
+    roles_removed: int = 0
+    errors: list = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def as_dict(self):
+        return {
+            "dryRun": self.dry_run,
+            "departmentsCreated": self.departments_created,
+            "usersCreated": self.users_created,
+            "usersUpdated": self.users_updated,
+            "usersDeactivated": self.users_deactivated,
+            "usersUnchanged": self.users_unchanged,
+            "rolesAdded": self.roles_added,
+            "rolesRemoved": self.roles_removed,
+            "errors": self.errors,
+            "elapsedSeconds": round(self.elapsed_seconds, 3),
+        }
+
+
+# ──────────────────────────────────────────────
+# 스냅샷 로드
+# ──────────────────────────────────────────────
+def load_snapshot(source):
+    """파일 경로 또는 http(s) URL(HR 서비스) → {"departments": [...], "users": [...]}"""
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=60) as resp:
+            raw = resp.read()
+            is_csv = "csv" in resp.headers.get("Content-Type", "") or source.endswith(".csv")
+    else:
+        raw = Path(source).read_bytes()
+        is_csv = source.endswith(".csv")
+
+    if is_csv:
+        users = provisioning.read_csv(io.BytesIO(raw))
+        for row in users:
+            # roles 열이 없는 CSV 는 역할을 건드리지 않는다
+            if "roles" in row:
+                row["roles"] = provisioning.split_roles(row["roles"])
+        return {"departments": [], "users": users}
+
+    data = json.loads(raw.decode("utf-8-sig"))
+    return {"departments": data.get("departments", []), "users": data.get("users", [])}
+
+
+def _normalize(entry):
+    user = {
+        "email": User.objects.normalize_email((entry.get("email") or "").strip()),
+        "name": (entry.get("name") or "").strip(),
+        "department": (entry.get("department") or "").strip(),
+        "position": (entry.get("position") or "").strip(),
+        "line": entry.get("line"),
+    }
+    # 상태가 없는 스냅샷(일부 HR 시스템)은 현재 상태 유지 — 비활성 사용자를 되살리지 않는다
+    status = (entry.get("status") or "").strip().upper()
+    if status:
+        user["status"] = status
+    if "roles" in entry:
+        user["roles"] = {c.strip().upper() for c in entry["roles"] if c and c.strip()}
+    return user
+
+
+# ──────────────────────────────────────────────
+# 동기화
+# ──────────────────────────────────────────────
+def sync_directory(snapshot, dry_run=False, deactivate_missing=False, batch_size=1000):
+    started = time.perf_counter()
+    report = SyncReport(dry_run=dry_run)
+
+    entries = {}
+    for raw in snapshot["users"]:
+        entry = _normalize(raw)
+        if not entry["email"]:
+            report.errors.append({"line": entry["line"], "email": "", "message": "이메일이 없습니다."})
+            continue
+        if "status" in entry and entry["status"] not in User.Status.values:
+            report.errors.append({"line": entry["line"], "email": entry["email"], "message": "알 수 없는 상태"})
+            continue
+        entries[entry["email"].lower()] = entry
+
+    # ── 부서 ──
+    wanted = {d.strip() for d in snapshot["departments"] if d and d.strip()}
+    wanted |= {e["department"] for e in entries.values() if e["department"]}
+    depts = dict(Department.objects.values_list("name", "id"))
+    missing = sorted(wanted - depts.keys())
+    report.departments_created = missing
+    if missing and not dry_run:
+        for d in Department.objects.bulk_create([Department(name=n) for n in missing]):
+            depts[d.name] = d.id
+    elif missing:
+        # dry-run: 새 부서로 옮겨지는 사용자도 변경으로 집계되도록 임시 키 부여
+        depts.update({n: f"new:{n}" for n in missing})
+
+    # ── 현재 상태 (한 번에 로드) ──
+    current = {
+        u["email"].lower(): u
+        for u in User.objects.values("id", "email", "is_superuser", *SYNC_FIELDS)
+    }
+    roles = dict(Role.objects.values_list("code", "id"))
+    current_roles = {}
+    for link_id, user_id, code in UserRole.objects.values_list("id", "user_id", "role__code"):
+        current_roles.setdefault(user_id, {})[code] = link_id
+
+    # ── diff ──
+    now = timezone.now()
+    to_update, to_create = [], []
+    links_add, links_remove = [], []
+    claims_changed, access_changed = set(), set()
+
+    for key, entry in entries.items():
+        row = current.get(key)
+        if row is None:
+            to_create.append(entry)
+            continue
+
+        desired = {
+            "name": entry["name"] or row["name"],
+            "department_id": depts.get(entry["department"]) if entry["department"] else None,
+            "position": entry["position"],
+            "status": entry.get("status", row["status"]),
+        }
+        diff = {f: v for f, v in desired.items() if row[f] != v}
+        roles_diff = False
+        if diff:
+            to_update.append(User(id=row["id"], updated_at=now, **{**{f: row[f] for f in SYNC_FIELDS}, **diff}))
+            claims_changed.add(row["id"])
+            if "status" in diff:
+                access_changed.add(row["id"])
+
+        if "roles" in entry:
+            unknown = entry["roles"] - roles.keys()
+            if unknown:
+                report.errors.append({
+                    "line": entry["line"], "email": entry["email"],
+                    "message": f"알 수 없는 역할: {', '.join(sorted(unknown))}",
+                })
+            have = current_roles.get(row["id"], {})
+            add = (entry["roles"] & roles.keys()) - have.keys()
+            remove = have.keys() - entry["roles"]
+            links_add += [UserRole(user_id=row["id"], role_id=roles[c]) for c in add]
+            links_remove += [have[c] for c in remove]
+            if add or remove:
+                roles_diff = True
+                claims_changed.add(row["id"])
+                access_changed.add(row["id"])
+
+        if not diff and not roles_diff:
+            report.users_unchanged += 1
+
+    if deactivate_missing:
+        for key, row in current.items():
+            if key not in entries and row["status"] == User.Status.ACTIVE and not row["is_superuser"]:
+                to_update.append(User(
+                    id=row["id"], updated_at=now,
+                    **{**{f: row[f] for f in SYNC_FIELDS}, "status": User.Status.INACTIVE},
+                ))
+                claims_changed.add(row["id"])
+                access_changed.add(row["id"])
+                report.users_deactivated += 1
+
+    report.users_updated = len(to_update) - report.users_deactivated
+    report.roles_added = len(links_add)
+    report.roles_removed = len(links_remove)
+
+    if dry_run:
+        report.users_created = len(to_create)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    # ── 반영 (배치 트랜잭션) ──
+    for i in range(0, len(to_update), batch_size):
+        with transaction.atomic():
+            User.objects.bulk_update(
+                to_update[i:i + batch_size], [*SYNC_FIELDS, "updated_at"],
+            )
+    for i in range(0, max(len(links_add), len(links_remove)), batch_size):
+        with transaction.atomic():
+            UserRole.objects.filter(id__in=links_remove[i:i + batch_size]).delete()
+            UserRole.objects.bulk_create(links_add[i:i + batch_size], ignore_conflicts=True)
+
+    if to_create:
+        created = provisioning.import_users(
+            [
+                {
+                    **{k: e[k] for k in ("email", "name", "department", "position", "line")},
+                    "roles": "|".join(sorted(e.get("roles", ()))),
+                }
+                for e in to_create
+            ],
+            default_password=None,
+            workers=1,  # 해시 계산이 없으므로 프로세스 풀 불필요
+            batch_size=batch_size,
+        )
+        report.users_created = created.created
+        report.errors += created.errors
+        # import_users 는 ACTIVE 로 생성 → 스냅샷에서 비활성인 신규 사용자 보정
+        inactive = [e["email"] for e in to_create if e.get("status", User.Status.ACTIVE) != User.Status.ACTIVE]
+        if inactive:
+            User.objects.filter(email__in=inactive).update(status=User.Status.INACTIVE, updated_at=now)
+
+    # 토큰 claims 무효화 / 상태·역할 변경 사용자 토큰 폐기
+    bump_permissions_versions(claims_changed)
+    if access_changed:
+        registry.revoke_users(access_changed)
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,31 @@
+"""
+python manage.py build_schema [--output openapi.json] [--check]
+→ OpenAPI 스키마를 파일로 생성 (배포 단계에서 실행, GET /api/schema/ 가 이 파일을 서빙)
+"""
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from config.schema import render_schema, write_schema
+
+
+class Command(BaseCommand):
+    help = "OpenAPI 스키마 파일 생성 (config/schema.py)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=None, help="기본: settings.SCHEMA_FILE")
+        parser.add_argument("--check", action="store_true", help="기존 파일이 코드와 다르면 실패 (쓰지 않음)")
+
+    def handle(self, *args, **options):
+        path = Path(options["output"] or settings.SCHEMA_FILE)
+        content = render_schema()
+
+        if options["check"]:
+            if not path.exists() or path.read_bytes() != content:
+                raise CommandError(f"스키마 파일이 최신이 아닙니다: {path} (build_schema 로 다시 생성)")
+            self.stdout.write(self.style.SUCCESS(f"스키마 파일 최신: {path}"))
+            return
+
+        write_schema(path, content)
+        self.stdout.write(self.style.SUCCESS(f"스키마 생성: {path} ({len(content):,} bytes)"))
@@ -0,0 +1,238 @@
+"""
+python manage.py check_query_budgets [--sizes 1 100] [--keepdb] [--only asset]
+→ 테스트 DB 에 관련 데이터를 1행/100행씩 만들고 GET 엔드포인트마다 쿼리 수를 잰다
+  (관리자 / 일반 사용자 각각, 결과 표 출력용 — CI 는 manage.py test 의 test_query_budgets)
+
+실패 조건 (하나라도 있으면 종료 코드 1):
+  - settings.QUERY_BUDGETS 의 예산 초과
+  - 같은 모양의 SQL 반복 (N+1, config/querybudget.py)
+  - 행 수가 늘 때 쿼리 수도 늘어남
+  - 4xx/5xx 응답 (관리자 전용 엔드포인트는 일반 사용자에게 403 이 아니면), 예산이 없는 엔드포인트
+"""
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext, setup_databases, teardown_databases
+from django.urls import reverse
+
+from apps.accounts.models import Department, Role, User, UserRole
+from apps.accounts.tokens import PortalRefreshToken
+from apps.announcements import cache as announcement_cache
+from apps.announcements.models import Announcement
+from apps.assets import grants
+from apps.assets.models import Asset, AssetPermission, AssetTag, AssetVersion, Category, Tag
+from apps.logs.models import AccessLog
+from apps.sharing import counters
+from apps.sharing.models import ShareRequest
+from config.querybudget import BudgetReport
+from config.schema import write_schema
+
+# (URL 이름, kwargs, 쿼리 문자열) — {asset}, {view_grant}, {download_grant} 는 populate() 값
+ENDPOINTS = [
+    ("auth-me", {}, ""),
+    ("user-list-create", {}, ""),
+    ("asset-list-create", {}, ""),
+    ("asset-detail", {"pk": "{asset}"}, "?include=versions,permissions,shareRequests,stats"),
+    ("asset-versions", {"pk": "{asset}"}, ""),
+    ("asset-permissions", {"pk": "{asset}"}, ""),
+    ("asset-view", {"pk": "{asset}"}, "?grant={view_grant}"),
+    ("asset-download", {"pk": "{asset}"}, "?grant={download_grant}"),
+    ("share-request-list-create", {}, ""),
+    ("share-request-inbox", {}, ""),
+    ("share-request-mine", {}, ""),
+    ("share-request-by-asset", {"asset_id": "{asset}"}, ""),
+    ("share-request-summary", {}, ""),
+    ("log-list", {}, ""),
+    ("log-export", {}, ""),
+    ("announcement-latest", {}, ""),
+    ("dashboard-summary", {}, ""),
+    ("schema", {}, ""),
+]
+ROLES = ("admin", "member")  # 관리자는 권한 확인을 건너뛰므로 일반 사용자 경로도 따로 잰다
+# 관리자 전용 (IsAdmin) — 일반 사용자는 403 이어야 한다
+ADMIN_ONLY = {"share-request-inbox", "share-request-by-asset", "dashboard-summary"}
+SIZES = (1, 100)
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextmanager
+def budget_environment():
+    """프로세스 로컬 캐시 + 미리 만든 스키마 파일 (운영과 같은 서빙 경로)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        schema_file = Path(tmp) / "openapi.json"
+        with override_settings(
+            CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+            SCHEMA_LIVE=False,
+            SCHEMA_FILE=str(schema_file),
+        ):
+            write_schema(schema_file)
+            yield
+
+
+def measure(size, endpoints=ENDPOINTS):
+    """
+    size 행 데이터를 만들고 역할/엔드포인트별로 한 번씩 요청 → {(역할, URL 이름): (상태 코드, BudgetReport)}
+    데이터는 savepoint 로 되돌린다.
+    """
+    results = {}
+    try:
+        with transaction.atomic():
+            context = populate(size)
+            for role in ROLES:
+                token = PortalRefreshToken.for_user(context[role]).access_token
+                client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+                for name, kwargs, query in endpoints:
+                    path = reverse(name, kwargs={k: v.format(**context) for k, v in kwargs.items()})
+                    path += query.format(**context)
+                    client.get(path)  # 워밍업 (토큰 폐기 목록 등 프로세스 단위 로드)
+                    # 캐시가 빈 상태(최악)의 쿼리 수를 잰다
+                    cache.clear()
+                    announcement_cache.invalidate()
+                    with CaptureQueriesContext(connection) as captured:
+                        response = client.get(path)
+                    results[role, name] = (response.status_code, BudgetReport(name, captured.captured_queries))
+            raise _Rollback
+    except _Rollback:
+        pass
+    return results
+
+
+def problems(results, role, name):
+    """SIZES 순서의 측정 결과 → 문제 목록"""
+    found = []
+    reports = [results[size][role, name] for size in results]
+    if reports[0][1].budget is None:
+        found.append("QUERY_BUDGETS 에 예산이 없습니다")
+    denied = role == "member" and name in ADMIN_ONLY
+    for size, (status_code, report) in zip(results, reports):
+        if denied and status_code != 403:
+            found.append(f"{size}행: 관리자 전용인데 HTTP {status_code}")
+        elif not denied and status_code >= 400:
+            found.append(f"{size}행: HTTP {status_code}")
+        found += [f"{size}행: {p}" for p in report.problems]
+    counts = [report.count for _, report in reports]
+    if max(counts) > counts[0]:
+        found.append(f"행 수에 따라 쿼리 수 증가: {counts}")
+    return found
+
+
+class Command(BaseCommand):
+    help = "엔드포인트별 쿼리 예산 / N+1 검사"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+        parser.add_argument("--keepdb", action="store_true", help="테스트 DB 를 지우지 않고 재사용")
+        parser.add_argument("--only", nargs="+", default=None, help="URL 이름에 이 문자열이 들어간 것만")
+
+    def handle(self, *args, **options):
+        endpoints = [
+            e for e in ENDPOINTS
+            if not options["only"] or any(o in e[0] for o in options["only"])
+        ]
+        old_config = setup_databases(verbosity=0, interactive=False, keepdb=options["keepdb"])
+        try:
+            with budget_environment():
+                results = {size: measure(size, endpoints) for size in options["sizes"]}
+        finally:
+            teardown_databases(old_config, verbosity=0, keepdb=options["keepdb"])
+
+        failures = self._report(results, endpoints)
+        if failures:
+            raise CommandError(f"쿼리 예산 검사 실패 {failures}건")
+        self.stdout.write(self.style.SUCCESS("쿼리 예산 검사 통과"))
+
+    def _report(self, results, endpoints):
+        failures = 0
+        self.stdout.write(
+            f"{'endpoint':<28}{'역할':<8}" + "".join(f"{f'{s}행':>8}" for s in results) + f"{'예산':>6}"
+        )
+        for name, _, _ in endpoints:
+            for role in ROLES:
+                found = problems(results, role, name)
+                counts = [results[size][role, name][1].count for size in results]
+                budget = results[next(iter(results))][role, name][1].budget
+                style = self.style.ERROR if found else (lambda s: s)
+                self.stdout.write(style(
+                    f"{name:<28}{role:<8}" + "".join(f"{c:>8}" for c in counts)
+                    + f"{budget if budget is not None else '-':>6}"
+                ))
+                for problem in found:
+                    self.stdout.write(self.style.ERROR(f"    {problem}"))
+                failures += bool(found)
+        return failures
+
+
+def populate(n):
+    """엔드포인트가 읽는 모든 관계에 n 행씩 → measure() 가 쓰는 값"""
+    dept = Department.objects.create(name="영업")
+    roles = {code: Role.objects.create(code=code, name=label) for code, label in Role.Code.choices}
+    admin = User.objects.create_superuser(
+        email="budget-admin@example.com", password="budget1234", name="관리자", department=dept,
+    )
+    UserRole.objects.create(user=admin, role=roles[Role.Code.SUPER_ADMIN])
+
+    users = User.objects.bulk_create([
+        User(email=f"budget{i}@example.com", name=f"사용자{i}", department=dept) for i in range(n)
+    ])
+    UserRole.objects.bulk_create([UserRole(user=u, role=roles[Role.Code.USER]) for u in users])
+
+    category = Category.objects.create(name="제안서")
+    assets = Asset.objects.bulk_create([
+        Asset(
+            type=Asset.Type.DOCUMENT, category=category, title=f"자산 {i}", owner=admin,
+            publish_status=Asset.PublishStatus.PUBLISHED,
+        )
+        for i in range(n)
+    ])
+    asset = assets[0]
+    versions = AssetVersion.objects.bulk_create([
+        AssetVersion(
+            asset=asset, version_no=i + 1, source_type=AssetVersion.SourceType.URL,
+            source_url=f"https://files.example.com/{i}", created_by=admin,
+        )
+        for i in range(n)
+    ])
+    asset.latest_version = versions[-1]
+    asset.save(update_fields=["latest_version"])
+
+    tags = Tag.objects.bulk_create([Tag(name=f"태그{i}") for i in range(n)])
+    AssetTag.objects.bulk_create([AssetTag(asset=asset, tag=t) for t in tags])
+    AssetPermission.objects.bulk_create([
+        AssetPermission(
+            asset=asset, subject_type=AssetPermission.SubjectType.USER,
+            subject_id=str(u.pk), can_view=True,
+        )
+        for u in users
+    ])
+    ShareRequest.objects.bulk_create([
+        ShareRequest(
+            asset=asset, requested_by=admin if i % 2 else users[0], reason="고객 미팅",
+            status=ShareRequest.Status.PENDING if i % 2 else ShareRequest.Status.APPROVED,
+            approved_by=None if i % 2 else admin,
+        )
+        for i in range(n)
+    ])
+    counters.rebuild()
+    AccessLog.objects.bulk_create([
+        AccessLog(user=users[i % len(users)], asset=assets[i % len(assets)], action=AccessLog.Action.VIEW)
+        for i in range(n)
+    ])
+    Announcement.objects.bulk_create([
+        Announcement(title=f"공지 {i}", body="내용", created_by=admin) for i in range(n)
+    ])
+    member = users[0]
+    return {
+        "admin": admin,
+        "member": member,
+        "asset": asset.pk,
+        "view_grant": grants.issue(asset, member, grants.SCOPE_VIEW)["grant"],
+        "download_grant": grants.issue(asset, member, grants.SCOPE_DOWNLOAD)["grant"],
+    }
@@ -0,0 +1,49 @@
+"""
+python manage.py import_users users.csv [--workers 8] [--batch-size 1000]
+→ CSV 로 사용자 일괄 등록 (비밀번호 해시 병렬 처리)
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.provisioning import import_users, read_csv
+
+
+class Command(BaseCommand):
+    help = "CSV(email,name,department,position,roles[,password]) 로 사용자 일괄 등록"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV 파일 경로")
+        parser.add_argument(
+            "--password", default=None,
+            help="password 열이 비었을 때 기본값 (생략하면 사용 불가 비밀번호 — 재설정 후 로그인)",
+        )
+        parser.add_argument("--workers", type=int, default=None, help="해시 프로세스 수 (기본: CPU 코어 수)")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--no-create-departments", action="store_true",
+            help="없는 부서는 생성하지 않고 오류로 처리",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], "rb") as f:
+                rows = read_csv(f)
+        except OSError as e:
+            raise CommandError(f"파일을 열 수 없습니다: {e}")
+
+        report = import_users(
+            rows,
+            default_password=options["password"],
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+            create_departments=not options["no_create_departments"],
+        )
+
+        for err in report.errors:
+            self.stdout.write(self.style.WARNING(f"  {err['line']}행 [{err['email']}] {err['message']}"))
+        self.stdout.write(
+            f"\n  전체 {report.total} / 생성 {report.created} / 실패 {len(report.errors)}"
+            f" / 비밀번호 미설정 {report.password_unset}"
+            f"\n  해시 {report.hash_seconds:.2f}s, 전체 {report.elapsed_seconds:.2f}s"
+            f" ({report.rows_per_second} rows/s)"
+        )
+        self.stdout.write(self.style.SUCCESS("\n✅ 사용자 등록 완료!"))
@@ -0,0 +1,275 @@
+"""
+python manage.py seed_bench [--scale 0.01] [--assets 200000 --logs 50000000 ...] [--truncate]
+→ 성능 측정용 대량 데이터 생성 (PostgreSQL COPY, 벤치 전용 DB 에서 실행)
+
+기본 규모: 사용자 2만, 자산 20만, 버전 100만, 태그 연결 500만, 접근 로그 5천만, 공유 요청 20만.
+--scale 로 전체를 비율 조정 (0.01 → 로컬 확인용 1%). 같은 --seed 면 같은 데이터.
+조회 편중을 흉내 내도록 로그/공유 요청의 자산·사용자는 앞쪽 일부에 몰리게 고른다.
+"""
+import io
+import itertools
+import random
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.accounts.models import Department, Role, User, UserRole
+from apps.assets.models import Asset, AssetTag, AssetVersion, Category, Tag
+from apps.logs.models import AccessLog
+from apps.sharing import counters
+from apps.sharing.models import ShareRequest
+
+BENCH_DOMAIN = "bench.local"
+BENCH_PASSWORD = "bench1234"
+
+VOLUMES = {
+    "users": 20_000,
+    "assets": 200_000,
+    "versions": 1_000_000,
+    "tags": 5_000,
+    "tag_links": 5_000_000,
+    "logs": 50_000_000,
+    "share_requests": 200_000,
+}
+
+# (액션, 결과, 가중치)
+LOG_ACTIONS = [
+    (AccessLog.Action.VIEW, AccessLog.Result.SUCCESS, 60),
+    (AccessLog.Action.PLAY, AccessLog.Result.SUCCESS, 15),
+    (AccessLog.Action.DOWNLOAD, AccessLog.Result.SUCCESS, 10),
+    (AccessLog.Action.SEARCH, AccessLog.Result.SUCCESS, 10),
+    (AccessLog.Action.DENIED, AccessLog.Result.DENIED, 5),
+]
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/126.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) Safari/605.1.15",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_5 like Mac OS X) Mobile/15E148",
+]
+TRUNCATE_TABLES = [
+    AccessLog, ShareRequest, AssetTag, AssetVersion, Asset, Tag,
+]
+
+
+class Command(BaseCommand):
+    help = "성능 측정용 대량 데이터 생성 (COPY)"
+
+    def add_arguments(self, parser):
+        for name, default in VOLUMES.items():
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default)
+        parser.add_argument("--scale", type=float, default=1.0, help="모든 건수에 곱할 비율")
+        parser.add_argument("--days", type=int, default=365, help="생성 시각 분포 기간(일)")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--chunk", type=int, default=100_000, help="COPY 트랜잭션당 행 수")
+        parser.add_argument(
+            "--truncate", action="store_true",
+            help="자산/버전/태그/로그/공유 요청 전체와 벤치 사용자를 지우고 다시 생성",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("COPY 를 사용하므로 PostgreSQL 에서만 실행할 수 있습니다.")
+
+        self.rng = random.Random(options["seed"])
+        self.chunk = options["chunk"]
+        self.now = timezone.now()
+        self.span = timedelta(days=options["days"]).total_seconds()
+        n = {name: max(1, int(options[name] * options["scale"])) for name in VOLUMES}
+
+        call_command("seed", stdout=io.StringIO())  # 부서/역할/관리자/카테고리
+        bench_users = User.objects.filter(email__endswith=f"@{BENCH_DOMAIN}")
+        if options["truncate"]:
+            self._truncate(bench_users)
+        elif bench_users.exists():
+            raise CommandError("이미 벤치 데이터가 있습니다. --truncate 로 지우고 다시 생성하세요.")
+
+        user_ids = self._users(n["users"])
+        asset_ids = self._assets(n["assets"], user_ids)
+        self._versions(asset_ids, n["versions"], user_ids)
+        self._tags(asset_ids, n["tags"], n["tag_links"])
+        self._share_requests(asset_ids, user_ids, n["share_requests"])
+        self._logs(asset_ids, user_ids, n["logs"])
+
+        counters.rebuild()
+        self.stdout.write("  ANALYZE ...")
+        with connection.cursor() as cursor:
+            for model in (User, UserRole, *TRUNCATE_TABLES):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+        self.stdout.write(self.style.SUCCESS(
+            f"완료 — 로그인: bench0@{BENCH_DOMAIN} / {BENCH_PASSWORD}"
+        ))
+
+    # ── 공통 ──
+    def _uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _past(self):
+        return self.now - timedelta(seconds=self.rng.random() * self.span)
+
+    def _skewed(self, items):
+        # 앞쪽 항목일수록 자주 (상위 10% 가 약 30% 차지)
+        return items[int(len(items) * self.rng.random() ** 2)]
+
+    def _copy(self, model, fields, rows):
+        """rows: fields 순서의 튜플 iterable → chunk 행마다 COPY + 커밋"""
+        opts = model._meta
+        columns = ", ".join(opts.get_field(name).column for name in fields)
+        sql = f"COPY {opts.db_table} ({columns}) FROM STDIN"
+        total = 0
+        rows = iter(rows)
+        while batch := list(itertools.islice(rows, self.chunk)):
+            with transaction.atomic(), connection.cursor() as cursor:
+                with cursor.copy(sql) as copy:
+                    for row in batch:
+                        copy.write_row(row)
+            total += len(batch)
+            self.stdout.write(f"\r  {opts.db_table}: {total:,}", ending="")
+            self.stdout.flush()
+        self.stdout.write("")
+
+    def _truncate(self, bench_users):
+        tables = ", ".join(model._meta.db_table for model in TRUNCATE_TABLES)
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {tables} CASCADE")
+        counters.rebuild()
+        deleted, _ = bench_users.delete()
+        self.stdout.write(f"  기존 데이터 삭제 (벤치 사용자 관련 {deleted:,}행)")
+
+    # ── 사용자 ──
+    def _users(self, count):
+        dept_ids = list(Department.objects.values_list("id", flat=True))
+        role_ids = dict(Role.objects.values_list("code", "id"))
+        password = make_password(BENCH_PASSWORD)  # 해시는 1번만
+        ids = [self._uuid() for _ in range(count)]
+
+        def rows():
+            for i, user_id in enumerate(ids):
+                created = self._past()
+                yield (
+                    user_id, password, False, f"bench{i}@{BENCH_DOMAIN}", f"벤치사용자{i}",
+                    self.rng.choice(dept_ids), "", User.Status.ACTIVE, 1,
+                    False, True, created, created,
+                )
+
+        self._copy(User, [
+            "id", "password", "is_superuser", "email", "name",
+            "department_id", "position", "status", "permissions_version",
+            "is_staff", "is_active", "created_at", "updated_at",
+        ], rows())
+
+        def links():
+            for i, user_id in enumerate(ids):
+                # 1% 관리자, 나머지 일반 사용자
+                code = Role.Code.ADMIN if i % 100 == 0 else Role.Code.USER
+                yield user_id, role_ids[code], self.now
+
+        self._copy(UserRole, ["user_id", "role_id", "created_at"], links())
+        return ids
+
+    # ── 자산 / 버전 / 태그 ──
+    def _assets(self, count, user_ids):
+        category_ids = [None, *Category.objects.values_list("id", flat=True)]
+        ids = [self._uuid() for _ in range(count)]
+        statuses = [Asset.PublishStatus.PUBLISHED] * 8 + [Asset.PublishStatus.DRAFT, Asset.PublishStatus.ARCHIVED]
+
+        def rows():
+            for i, asset_id in enumerate(ids):
+                created = self._past()
+                asset_type = self.rng.choice(Asset.Type.values)
+                yield (
+                    asset_id, asset_type, self.rng.choice(category_ids),
+                    f"벤치 자산 {i} ({asset_type.lower()})", "성능 측정용 자산 설명. " * 5,
+                    self.rng.choice(statuses), Asset.ViewScope.ALL_USERS, bool(i % 2),
+                    self.rng.choice(Asset.SecurityLabel.values), self.rng.choice(user_ids),
+                    created, created + timedelta(seconds=self.rng.random() * (self.now - created).total_seconds()),
+                )
+
+        # latest_version 은 버전 생성 후 UPDATE (자산 ↔ 버전 순환 FK)
+        self._copy(Asset, [
+            "id", "type", "category_id", "title", "description", "publish_status", "view_scope",
+            "download_allowed", "security_label", "owner_id", "created_at", "updated_at",
+        ], rows())
+        return ids
+
+    def _versions(self, asset_ids, count, user_ids):
+        per_asset, extra = divmod(count, len(asset_ids))
+
+        def rows():
+            for i, asset_id in enumerate(asset_ids):
+                for no in range(1, max(1, per_asset + (i < extra)) + 1):
+                    yield (
+                        self._uuid(), asset_id, no, AssetVersion.SourceType.URL,
+                        f"https://files.example.com/bench/{asset_id}/v{no}", "",
+                        self.rng.choice(user_ids), "", self._past(),
+                    )
+
+        self._copy(AssetVersion, [
+            "id", "asset_id", "version_no", "source_type", "source_url", "source_file_id",
+            "created_by_id", "note", "created_at",
+        ], rows())
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"""
+                UPDATE {Asset._meta.db_table} a SET latest_version_id = v.id
+                FROM (
+                    SELECT DISTINCT ON (asset_id) asset_id, id FROM {AssetVersion._meta.db_table}
+                    ORDER BY asset_id, version_no DESC
+                ) v
+                WHERE v.asset_id = a.id AND a.latest_version_id IS NULL
+            """)
+
+    def _tags(self, asset_ids, count, links):
+        tag_ids = [self._uuid() for _ in range(count)]
+        self._copy(Tag, ["id", "name", "created_at"], (
+            (tag_id, f"bench-{i:05d}", self.now) for i, tag_id in enumerate(tag_ids)
+        ))
+        per_asset = min(max(1, links // len(asset_ids)), len(tag_ids))
+
+        def rows():
+            for asset_id in asset_ids:
+                for tag_id in self.rng.sample(tag_ids, per_asset):
+                    yield asset_id, tag_id, self.now
+
+        self._copy(AssetTag, ["asset_id", "tag_id", "created_at"], rows())
+
+    # ── 공유 요청 / 접근 로그 ──
+    def _share_requests(self, asset_ids, user_ids, count):
+        Status = ShareRequest.Status
+        statuses = [Status.PENDING] * 4 + [Status.APPROVED] * 12 + [Status.REJECTED] * 3 + [Status.CANCELLED]
+        approver_id = User.objects.filter(is_superuser=True).values_list("id", flat=True).first()
+
+        def rows():
+            for _ in range(count):
+                created = self._past()
+                status_code = self.rng.choice(statuses)
+                handled = status_code != Status.PENDING
+                yield (
+                    self._uuid(), self._skewed(asset_ids), self._skewed(user_ids), "고객사 미팅 자료",
+                    status_code, approver_id if handled else None, "",
+                    created + timedelta(hours=self.rng.random() * 48) if handled else None, created,
+                )
+
+        self._copy(ShareRequest, [
+            "id", "asset_id", "requested_by_id", "reason", "status",
+            "approved_by_id", "comment", "approved_at", "created_at",
+        ], rows())
+
+    def _logs(self, asset_ids, user_ids, count):
+        actions = [(a, r) for a, r, w in LOG_ACTIONS for _ in range(w)]
+
+        def rows():
+            for _ in range(count):
+                action, result = self.rng.choice(actions)
+                yield (
+                    self._uuid(), self._past(), self._skewed(user_ids),
+                    None if action == AccessLog.Action.SEARCH else self._skewed(asset_ids),
+                    action, f"10.{self.rng.randrange(256)}.{self.rng.randrange(256)}.{self.rng.randrange(1, 255)}",
+                    self.rng.choice(USER_AGENTS), result,
+                )
+
+        self._copy(AccessLog, [
+            "id", "occurred_at", "user_id", "asset_id", "action", "ip", "user_agent", "result",
+        ], rows())
@@ -0,0 +1,116 @@
+"""
+python manage.py startup_profile [--runs 5] [--top 25] [--no-urls] [--json out.json]
+→ 새 인터프리터에서 워커 부팅(get_wsgi_application + URLconf 로드)을 재현해
+  모듈별 import 시간(-X importtime), 부팅 시간, RSS 를 출력
+
+  - 부팅 시간/RSS 는 --runs 회의 중앙값 (디스크 캐시가 데워진 상태 기준)
+  - 패키지별 합계는 self 시간 합 (apps.*/config.* 는 두 단계까지 묶는다)
+  - --json 결과를 남겨 두고 --compare 로 이전 결과와 비교
+"""
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+_BOOT = """
+import json, os, resource, sys, time
+started = time.perf_counter()
+os.environ["DJANGO_SETTINGS_MODULE"] = {settings_module!r}
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+booted = time.perf_counter()
+if {urls!r}:
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+done = time.perf_counter()
+print(json.dumps({{
+    "setupMs": (booted - started) * 1000,
+    "urlsMs": (done - booted) * 1000,
+    "totalMs": (done - started) * 1000,
+    "rssKb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+}}))
+"""
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+_LOCAL = ("apps", "config", "benchmarks")
+
+
+def _package(module):
+    parts = module.split(".")
+    return ".".join(parts[:2]) if parts[0] in _LOCAL else parts[0]
+
+
+class Command(BaseCommand):
+    help = "워커 부팅 시간 / 모듈별 import 시간 / RSS 측정"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--top", type=int, default=25)
+        parser.add_argument("--no-urls", action="store_true", help="URLconf(뷰/Serializer) 로드 제외")
+        parser.add_argument("--json", default=None, help="결과 저장 경로")
+        parser.add_argument("--compare", default=None, help="이전 --json 결과와 비교")
+
+    def handle(self, *args, **options):
+        source = _BOOT.format(settings_module=settings.SETTINGS_MODULE, urls=not options["no_urls"])
+        runs = [self._run(source) for _ in range(max(options["runs"], 1))]
+        _, imports = self._run(source, importtime=True)
+
+        result = {
+            key: round(statistics.median(r[key] for r, _ in runs), 1)
+            for key in ("setupMs", "urlsMs", "totalMs", "rssKb", "modules")
+        }
+        result["importMs"] = round(sum(self_us for self_us, _ in imports.values()) / 1000, 1)
+        packages = defaultdict(int)
+        for module, (self_us, _) in imports.items():
+            packages[_package(module)] += self_us
+        result["packages"] = {p: round(us / 1000, 1) for p, us in sorted(packages.items(), key=lambda i: -i[1])}
+        result["slowest"] = {
+            m: round(cumulative / 1000, 1)
+            for m, (_, cumulative) in sorted(imports.items(), key=lambda i: -i[1][1])[:options["top"]]
+        }
+
+        self._print(result, options["top"])
+        if options["compare"]:
+            with open(options["compare"], encoding="utf-8") as f:
+                self._print_compare(json.load(f), result)
+        if options["json"]:
+            with open(options["json"], "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+
+    def _run(self, source, importtime=False):
+        cmd = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", source]
+        proc = subprocess.run(cmd, capture_output=True, text=True, cwd=settings.BASE_DIR, env=os.environ.copy())
+        if proc.returncode != 0:
+            raise CommandError(f"부팅 실패:\n{proc.stderr[-2000:]}")
+        imports = {}
+        for line in proc.stderr.splitlines():
+            match = _LINE.match(line)
+            if match:
+                imports[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+        return json.loads(proc.stdout.strip().splitlines()[-1]), imports
+
+    def _print(self, result, top):
+        self.stdout.write(
+            f"부팅 {result['totalMs']:.0f}ms (setup {result['setupMs']:.0f} + urls {result['urlsMs']:.0f}), "
+            f"import 합계 {result['importMs']:.0f}ms, 모듈 {result['modules']:.0f}개, "
+            f"RSS {result['rssKb'] / 1024:.1f}MB"
+        )
+        self.stdout.write("\n패키지별 import 시간 (self 합, ms)")
+        for package, ms in list(result["packages"].items())[:top]:
+            self.stdout.write(f"  {ms:>8.1f}  {package}")
+        self.stdout.write("\n느린 모듈 (하위 import 포함, ms)")
+        for module, ms in result["slowest"].items():
+            self.stdout.write(f"  {ms:>8.1f}  {module}")
+
+    def _print_compare(self, before, after):
+        self.stdout.write("\n이전 결과 대비")
+        for key, unit in (("totalMs", "ms"), ("importMs", "ms"), ("rssKb", "KB"), ("modules", "")):
+            delta = after[key] - before[key]
+            pct = f" ({delta / before[key] * 100:+.1f}%)" if before[key] else ""
+            self.stdout.write(f"  {key:<9} {before[key]:>10.1f} → {after[key]:>10.1f} {unit}{pct}")
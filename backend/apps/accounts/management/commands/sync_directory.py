@@ -0,0 +1,53 @@
+"""
+python manage.py sync_directory <파일 경로 | HR 서비스 URL> [--dry-run] [--deactivate-missing]
+→ 인사 디렉터리 스냅샷과 부서/사용자/역할 증분 동기화
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.directory_sync import load_snapshot, sync_directory
+
+
+class Command(BaseCommand):
+    help = "디렉터리 스냅샷(JSON/CSV)과 부서/사용자/역할 동기화 (변경분만 반영)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "source", nargs="?", default=None,
+            help="스냅샷 파일 경로 또는 URL (기본: DIRECTORY_SYNC_SOURCE)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="변경 사항만 계산하고 반영하지 않음")
+        parser.add_argument(
+            "--deactivate-missing", action="store_true",
+            help="스냅샷에 없는 사용자를 비활성화 (슈퍼유저 제외)",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        source = options["source"] or settings.DIRECTORY_SYNC_SOURCE
+        if not source:
+            raise CommandError("스냅샷 경로/URL 을 지정하거나 DIRECTORY_SYNC_SOURCE 를 설정하세요.")
+        try:
+            snapshot = load_snapshot(source)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"스냅샷을 읽을 수 없습니다: {e}")
+
+        report = sync_directory(
+            snapshot,
+            dry_run=options["dry_run"],
+            deactivate_missing=options["deactivate_missing"],
+            batch_size=options["batch_size"],
+        )
+
+        for err in report.errors:
+            self.stdout.write(self.style.WARNING(f"  {err['line'] or '-'} [{err['email']}] {err['message']}"))
+        for name in report.departments_created:
+            self.stdout.write(f"  부서 [{name}] 생성")
+        self.stdout.write(
+            f"\n  사용자 생성 {report.users_created} / 수정 {report.users_updated}"
+            f" / 비활성화 {report.users_deactivated} / 변경 없음 {report.users_unchanged}"
+            f"\n  역할 추가 {report.roles_added} / 삭제 {report.roles_removed}"
+            f"\n  소요 {report.elapsed_seconds:.2f}s"
+        )
+        tag = " (dry-run, 반영 안 함)" if report.dry_run else ""
+        self.stdout.write(self.style.SUCCESS(f"\n✅ 디렉터리 동기화 완료{tag}!"))
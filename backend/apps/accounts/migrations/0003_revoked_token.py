@@ -0,0 +1,27 @@
+# Generated by Django 5.0.7 on 2026-10-19 14:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_permissions_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('TOKEN', '토큰(JTI)'), ('USER', '사용자 전체')], max_length=5, verbose_name='유형')),
+                ('key', models.CharField(max_length=64, verbose_name='JTI 또는 사용자 ID')),
+                ('revoked_at', models.DateTimeField(auto_now_add=True, verbose_name='폐기 시간')),
+                ('expires_at', models.DateTimeField(verbose_name='보관 만료')),
+            ],
+            options={
+                'db_table': 'revoked_tokens',
+                'indexes': [models.Index(fields=['key', 'kind'], name='idx_revoked_key'), models.Index(fields=['expires_at'], name='idx_revoked_expires')],
+            },
+        ),
+    ]
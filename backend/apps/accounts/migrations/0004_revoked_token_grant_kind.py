@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-19 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_revoked_token'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='revokedtoken',
+            name='kind',
+            field=models.CharField(choices=[('TOKEN', '토큰(JTI)'), ('USER', '사용자 전체'), ('GRANT', '자산 grant(JTI)')], max_length=5, verbose_name='유형'),
+        ),
+    ]
@@ -6,6 +6,7 @@ import uuid
 
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.db import models
+from django.utils.functional import cached_property
 
 
 # ──────────────────────────────────────────────
@@ -86,6 +87,8 @@ class User(AbstractBaseUser, PermissionsMixin):
         "상태", max_length=10, choices=Status.choices, default=Status.ACTIVE
     )
     roles = models.ManyToManyField(Role, through="UserRole", related_name="users", blank=True)
+    # 역할/상태/프로필 변경 시 +1 → 이전 claims 토큰은 DB 조회로 폴백
+    permissions_version = models.PositiveIntegerField("권한 버전", default=1)
 
     # Django auth 필드
     is_staff = models.BooleanField(default=False)
@@ -107,10 +110,17 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return f"{self.name} ({self.email})"
 
-    @property
+    @cached_property
     def role_codes(self):
+        # 인스턴스당 한 번만 조회, prefetch_related("roles") 가 있으면 쿼리 없음
+        if "roles" in getattr(self, "_prefetched_objects_cache", {}):
+            return [role.code for role in self.roles.all()]
         return list(self.roles.values_list("code", flat=True))
 
+    def set_roles(self, roles):
+        self.roles.set(roles)
+        self.__dict__.pop("role_codes", None)
+
 
 # ──────────────────────────────────────────────
 # User ↔ Role (N:M through table)
@@ -123,3 +133,28 @@ class UserRole(models.Model):
     class Meta:
         db_table = "user_roles"
         unique_together = ("user", "role")
+
+
+# ──────────────────────────────────────────────
+# 폐기된 토큰 (JTI 단위 / 사용자 단위 / 자산 grant)
+# ──────────────────────────────────────────────
+class RevokedToken(models.Model):
+    class Kind(models.TextChoices):
+        TOKEN = "TOKEN", "토큰(JTI)"
+        USER = "USER", "사용자 전체"
+        GRANT = "GRANT", "자산 grant(JTI)"
+
+    kind = models.CharField("유형", max_length=5, choices=Kind.choices)
+    key = models.CharField("JTI 또는 사용자 ID", max_length=64)
+    revoked_at = models.DateTimeField("폐기 시간", auto_now_add=True)
+    expires_at = models.DateTimeField("보관 만료")
+
+    class Meta:
+        db_table = "revoked_tokens"
+        indexes = [
+            models.Index(fields=["key", "kind"], name="idx_revoked_key"),
+            models.Index(fields=["expires_at"], name="idx_revoked_expires"),
+        ]
+
+    def __str__(self):
+        return f"[{self.kind}] {self.key}"
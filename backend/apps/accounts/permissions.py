@@ -0,0 +1,39 @@
+"""
+accounts/permissions.py
+역할 기반 DRF 권한 (User / ClaimsPrincipal 모두 role_codes 를 가진다).
+"""
+from rest_framework.permissions import BasePermission
+
+from .models import Role
+
+
+ADMIN_ROLES = (Role.Code.SUPER_ADMIN, Role.Code.ADMIN)
+
+
+def is_super_admin(user):
+    return bool(
+        user and user.is_authenticated
+        and Role.Code.SUPER_ADMIN in getattr(user, "role_codes", ())
+    )
+
+
+class IsSuperAdmin(BasePermission):
+    message = "슈퍼관리자만 사용할 수 있습니다."
+
+    def has_permission(self, request, view):
+        return is_super_admin(request.user)
+
+
+def is_admin(user):
+    """슈퍼관리자/관리자 — 공유 요청 승인권자와 같은 집합"""
+    return bool(
+        user and user.is_authenticated
+        and set(ADMIN_ROLES) & set(getattr(user, "role_codes", ()))
+    )
+
+
+class IsAdmin(BasePermission):
+    message = "관리자만 사용할 수 있습니다."
+
+    def has_permission(self, request, view):
+        return is_admin(request.user)
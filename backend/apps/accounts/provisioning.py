@@ -0,0 +1,218 @@
+"""
+accounts/provisioning.py
+CSV 기반 사용자 일괄 등록.
+
+  CSV 헤더: email,name,department,position,roles[,password]
+  roles 는 "ADMIN|USER" 처럼 | 또는 ; 로 구분
+  password 열과 기본 비밀번호가 모두 없으면 사용 불가 비밀번호 (공용 기본값 없음 — 재설정 후 로그인)
+
+비밀번호 해시(의도적으로 느림)는 import_users 명령에서 프로세스 풀로 모든 코어에 나눠 계산하고
+(웹 요청 POST /api/users/bulk 는 요청 스레드에서 계산),
+부서/역할은 한 번에 조회, User/UserRole 은 bulk_create 로 배치 저장한다.
+"""
+import csv
+import io
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from .models import Department, Role, User, UserRole
+
+_ROLE_SPLIT = re.compile(r"[|;]")
+
+
+@dataclass
+class ImportReport:
+    total: int = 0
+    created: int = 0
+    password_unset: int = 0  # 사용 불가 비밀번호로 만든 사용자 수
+    errors: list = field(default_factory=list)  # [{"line", "email", "message"}]
+    hash_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        return round(self.created / self.elapsed_seconds, 1) if self.elapsed_seconds else 0.0
+
+    def as_dict(self):
+        return {
+            "total": self.total,
+            "created": self.created,
+            "passwordUnset": self.password_unset,
+            "failed": len(self.errors),
+            "errors": self.errors,
+            "hashSeconds": round(self.hash_seconds, 3),
+            "elapsedSeconds": round(self.elapsed_seconds, 3),
+            "rowsPerSecond": self.rows_per_second,
+        }
+
+
+def split_roles(value):
+    """"ADMIN|USER" → ["ADMIN", "USER"]"""
+    return [c.strip().upper() for c in _ROLE_SPLIT.split(value or "") if c.strip()]
+
+
+def read_csv(fileobj):
+    """bytes/text 파일 객체 → dict 행 목록 (line 번호 포함)."""
+    raw = fileobj.read()
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8-sig")
+    reader = csv.DictReader(io.StringIO(raw))
+    rows = []
+    for line_no, row in enumerate(reader, start=2):
+        row = {(k or "").strip().lower(): (v or "").strip() for k, v in row.items()}
+        row["line"] = line_no
+        rows.append(row)
+    return rows
+
+
+def normalize_row(row, line):
+    """JSON 행 → read_csv 와 같은 형태 (null → "", roles 배열 → "ADMIN|USER")"""
+    normalized = {}
+    for key, value in row.items():
+        if value is None:
+            value = ""
+        elif isinstance(value, (list, tuple)):
+            value = "|".join(str(v).strip() for v in value if v is not None)
+        normalized[str(key).strip().lower()] = str(value).strip()
+    normalized["line"] = line
+    return normalized
+
+
+def _init_worker():
+    # spawn 방식 플랫폼(Windows/macOS)에서는 자식 프로세스에 설정이 없다
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+        django.setup()
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    make_password 를 프로세스 풀에서 병렬 실행. 순서 유지.
+    웹 요청에서는 workers=1 (스레드 워커에서 fork 하지 않는다) — 풀은 import_users 명령 전용.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(passwords) < 2:
+        return [make_password(p) for p in passwords]
+    chunksize = max(len(passwords) // (workers * 4), 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+def import_users(rows, default_password=None, workers=None,
+                 batch_size=1000, create_departments=True, assignable_roles=None):
+    """
+    default_password=None 이면 password 열이 없는 행은 사용 불가 비밀번호 (해시 계산 없음).
+    assignable_roles 를 주면 그 밖의 역할이 든 행은 오류 (웹 요청: 슈퍼관리자만 SUPER_ADMIN 부여).
+    """
+    started = time.perf_counter()
+    report = ImportReport(total=len(rows))
+
+    def fail(row, message):
+        report.errors.append({"line": row.get("line"), "email": row.get("email", ""), "message": message})
+
+    # ── 1) 행 검증 + 파일 내 중복 ──
+    valid, seen = [], set()
+    for row in rows:
+        email = User.objects.normalize_email(row.get("email", ""))
+        row["email"] = email
+        try:
+            validate_email(email)
+        except ValidationError:
+            fail(row, "이메일 형식이 올바르지 않습니다.")
+            continue
+        if not row.get("name"):
+            fail(row, "이름은 필수입니다.")
+            continue
+        if email.lower() in seen:
+            fail(row, "파일 안에서 중복된 이메일입니다.")
+            continue
+        seen.add(email.lower())
+        row["role_codes"] = split_roles(row.get("roles", ""))
+        valid.append(row)
+
+    # ── 2) 기존 사용자 / 부서 / 역할 일괄 조회 ──
+    existing = set()
+    emails = [r["email"] for r in valid]
+    for i in range(0, len(emails), batch_size):
+        existing.update(
+            e.lower() for e in
+            User.objects.filter(email__in=emails[i:i + batch_size]).values_list("email", flat=True)
+        )
+
+    dept_names = {r["department"] for r in valid if r.get("department")}
+    depts = {d.name: d for d in Department.objects.filter(name__in=dept_names)}
+    missing_depts = dept_names - depts.keys()
+    if missing_depts and create_departments:
+        for d in Department.objects.bulk_create([Department(name=n) for n in missing_depts]):
+            depts[d.name] = d
+
+    roles = {r.code: r for r in Role.objects.all()}
+
+    ready = []
+    for row in valid:
+        if row["email"].lower() in existing:
+            fail(row, "이미 등록된 이메일입니다.")
+            continue
+        if row.get("department") and row["department"] not in depts:
+            fail(row, f"부서를 찾을 수 없습니다: {row['department']}")
+            continue
+        unknown = [c for c in row["role_codes"] if c not in roles]
+        if unknown:
+            fail(row, f"알 수 없는 역할: {', '.join(unknown)}")
+            continue
+        if assignable_roles is not None:
+            denied = [c for c in row["role_codes"] if c not in assignable_roles]
+            if denied:
+                fail(row, f"부여할 수 없는 역할: {', '.join(denied)}")
+                continue
+        ready.append(row)
+
+    # ── 3) 비밀번호 해시 (병렬) ──
+    t0 = time.perf_counter()
+    hashes = hash_passwords([r.get("password") or default_password for r in ready], workers)
+    report.hash_seconds = time.perf_counter() - t0
+
+    # ── 4) 배치 저장 ──
+    for i in range(0, len(ready), batch_size):
+        chunk = ready[i:i + batch_size]
+        users = [
+            User(
+                email=row["email"],
+                name=row["name"],
+                department=depts.get(row.get("department")),
+                position=row.get("position", ""),
+                password=pw_hash,
+            )
+            for row, pw_hash in zip(chunk, hashes[i:i + batch_size])
+        ]
+        links = [
+            UserRole(user=user, role=roles[code])
+            for user, row in zip(users, chunk)
+            for code in row["role_codes"]
+        ]
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=batch_size)
+                UserRole.objects.bulk_create(links, batch_size=batch_size)
+        except IntegrityError:
+            # 검증 이후 동시에 등록된 이메일 등 → 해당 배치 전체 실패로 보고
+            for row in chunk:
+                fail(row, "저장 중 충돌이 발생했습니다. 다시 시도해 주세요.")
+            continue
+        report.created += len(users)
+        report.password_unset += sum(not user.has_usable_password() for user in users)
+
+    report.elapsed_seconds = time.perf_counter() - started
+    report.errors.sort(key=lambda e: e["line"] or 0)
+    return report
@@ -0,0 +1,233 @@
+"""
+accounts/revocation.py
+JWT 폐기 확인.
+
+  - 폐기 원본은 revoked_tokens 테이블 (JTI 단위 / 사용자 단위)
+  - 자산 grant(apps/assets/grants.py) 의 조기 폐기도 같은 테이블/필터 사용 (kind=GRANT)
+  - 워커마다 Bloom filter 를 들고 REVOCATION_SYNC_INTERVAL 초마다 새 행만 증분 반영
+    (다른 워커의 폐기는 공유 캐시의 버전 값으로 감지, 공유 캐시가 없으면 매번 새 행 조회)
+  - 운영 워커는 기동 시(gunicorn post_worker_init → registry.start()) 한 번 적재하고
+    이후 동기화는 백그라운드 스레드가 한다 → 요청 경로의 DB 조회는 Bloom 에 걸렸을 때뿐
+    (start() 없이 쓰는 runserver/테스트/관리 명령은 확인 시점에 직접 동기화)
+  - Bloom 에 걸리지 않으면 즉시 통과, 걸렸을 때만 정확 조회
+"""
+import hashlib
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+_VERSION_KEY = "revocation:version"
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.001):
+        capacity = max(int(capacity), 1)
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    @staticmethod
+    def _hashes(item):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add(self, item):
+        h1, h2 = self._hashes(item)
+        for i in range(self.hash_count):
+            pos = (h1 + i * h2) % self.size
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        h1, h2 = self._hashes(item)
+        bits, size = self.bits, self.size
+        for i in range(self.hash_count):
+            pos = (h1 + i * h2) % size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False  # 대부분의 토큰은 첫 비트에서 끝난다
+        return True
+
+
+def _bloom_key(kind, key):
+    return f"{kind}:{key}"
+
+
+class RevocationRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._last_id = 0
+        self._version = None
+        self._checked_at = 0.0
+        self._rebuilt_at = 0.0
+        # 사용자 단위 폐기 시각 (Bloom 적중 시 정확 조회 결과를 워커 로컬에 보관)
+        self._user_revoked_at = {}
+        self._refresher = None
+
+    # ── 동기화 ──
+    def start(self):
+        """워커 기동 시 한 번 — 초기 적재 후 백그라운드 동기화 스레드 시작"""
+        with self._lock:
+            if self._refresher is not None:
+                return
+            if self._bloom is None:
+                self._rebuild()
+            self._refresher = threading.Thread(target=self._refresh_loop, name="revocation-sync", daemon=True)
+            self._refresher.start()
+        connections.close_all()
+
+    def _refresh_loop(self):
+        while True:
+            time.sleep(settings.REVOCATION_SYNC_INTERVAL)
+            try:
+                with self._lock:
+                    self._refresh(time.monotonic())
+            except Exception:
+                # 다음 주기에 다시 시도 (그동안은 마지막으로 적재한 필터로 확인)
+                logger.exception("폐기 목록 동기화 실패")
+            finally:
+                connections.close_all()  # 이 스레드의 연결만 닫힌다
+
+    def _sync(self):
+        if self._refresher is not None:
+            return
+        now = time.monotonic()
+        if self._bloom is not None and now - self._checked_at < settings.REVOCATION_SYNC_INTERVAL:
+            return
+        with self._lock:
+            if self._bloom is not None and now - self._checked_at < settings.REVOCATION_SYNC_INTERVAL:
+                return
+            self._refresh(now)
+
+    def _refresh(self, now):
+        self._checked_at = now
+        if self._bloom is None or now - self._rebuilt_at > settings.REVOCATION_REBUILD_INTERVAL:
+            self._rebuild()
+            return
+        if not settings.SHARED_CACHE:
+            # 프로세스 로컬 캐시에는 다른 워커의 버전 값이 없다 → PK 범위 조회 (보통 0행)
+            self._load_since(self._last_id)
+            return
+        version = cache.get(_VERSION_KEY)
+        if version != self._version:
+            self._version = version
+            self._load_since(self._last_id)
+
+    def _rebuild(self):
+        """만료 행을 걸러내고 Bloom filter 를 새로 만든다 (다 채운 뒤 교체 → 확인 중인 요청은 이전 필터를 본다)."""
+        live = RevokedToken.objects.filter(expires_at__gt=timezone.now())
+        capacity = max(settings.REVOCATION_BLOOM_CAPACITY, live.count() * 2)
+        bloom = BloomFilter(capacity, settings.REVOCATION_BLOOM_ERROR_RATE)
+        version = cache.get(_VERSION_KEY)
+        last_id = self._load_into(bloom, 0)
+        self._bloom, self._last_id, self._version = bloom, last_id, version
+        self._user_revoked_at = {}
+        self._rebuilt_at = time.monotonic()
+
+    def _load_since(self, last_id):
+        self._last_id = max(self._last_id, self._load_into(self._bloom, last_id))
+
+    def _load_into(self, bloom, last_id):
+        rows = (
+            RevokedToken.objects
+            .filter(id__gt=last_id, expires_at__gt=timezone.now())
+            .order_by("id")
+            .values_list("id", "kind", "key")
+        )
+        for row_id, kind, key in rows.iterator(chunk_size=5000):
+            bloom.add(_bloom_key(kind, key))
+            if kind == RevokedToken.Kind.USER:
+                self._user_revoked_at.pop(key, None)
+            last_id = max(last_id, row_id)
+        return last_id
+
+    # ── 확인 ──
+    def is_revoked(self, token):
+        """access/refresh 토큰(validated) 폐기 여부."""
+        self._sync()
+        jti = token.get(api_settings.JTI_CLAIM)
+        if jti and _bloom_key(RevokedToken.Kind.TOKEN, jti) in self._bloom:
+            if RevokedToken.objects.filter(
+                kind=RevokedToken.Kind.TOKEN, key=jti, expires_at__gt=timezone.now(),
+            ).exists():
+                return True
+
+        user_id = str(token.get(api_settings.USER_ID_CLAIM, ""))
+        if user_id and _bloom_key(RevokedToken.Kind.USER, user_id) in self._bloom:
+            revoked_at = self._user_revoked_at.get(user_id)
+            if revoked_at is None:
+                last = (
+                    RevokedToken.objects
+                    .filter(kind=RevokedToken.Kind.USER, key=user_id, expires_at__gt=timezone.now())
+                    .order_by("-revoked_at")
+                    .values_list("revoked_at", flat=True)
+                    .first()
+                )
+                revoked_at = last.timestamp() if last else 0.0
+                self._user_revoked_at[user_id] = revoked_at
+            # 폐기 시점 이전에 발급된 토큰만 거부 (재로그인 토큰은 통과)
+            if token.get("iat", 0) <= revoked_at:
+                return True
+        return False
+
+    def is_grant_revoked(self, jti):
+        """자산 grant 폐기 여부 — Bloom 에 걸렸을 때만 DB 조회."""
+        self._sync()
+        if _bloom_key(RevokedToken.Kind.GRANT, jti) not in self._bloom:
+            return False
+        return RevokedToken.objects.filter(
+            kind=RevokedToken.Kind.GRANT, key=jti, expires_at__gt=timezone.now(),
+        ).exists()
+
+    # ── 폐기 ──
+    def revoke_grant(self, jti, exp):
+        expires_at = datetime.fromtimestamp(exp, tz=dt_timezone.utc)
+        self._record(RevokedToken.Kind.GRANT, jti, expires_at)
+
+    def revoke_token(self, jti, exp):
+        expires_at = datetime.fromtimestamp(exp, tz=dt_timezone.utc)
+        self._record(RevokedToken.Kind.TOKEN, jti, expires_at)
+
+    def revoke_user(self, user_id):
+        # refresh 토큰 수명이 지나면 이전 토큰은 모두 만료되므로 그때까지만 보관
+        expires_at = timezone.now() + api_settings.REFRESH_TOKEN_LIFETIME
+        self._record(RevokedToken.Kind.USER, str(user_id), expires_at)
+
+    def revoke_users(self, user_ids):
+        expires_at = timezone.now() + api_settings.REFRESH_TOKEN_LIFETIME
+        rows = [
+            RevokedToken(kind=RevokedToken.Kind.USER, key=str(uid), expires_at=expires_at)
+            for uid in user_ids
+        ]
+        if rows:
+            self._record_many(rows)
+
+    def _record(self, kind, key, expires_at):
+        self._record_many([RevokedToken(kind=kind, key=key, expires_at=expires_at)])
+
+    def _record_many(self, rows):
+        RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        RevokedToken.objects.bulk_create(rows, batch_size=1000)
+        cache.set(_VERSION_KEY, time.time_ns(), timeout=None)
+        # 이 워커에는 바로 반영 (다른 워커는 다음 동기화 때)
+        bloom = self._bloom
+        if bloom is not None:
+            for row in rows:
+                bloom.add(_bloom_key(row.kind, row.key))
+                if row.kind == RevokedToken.Kind.USER:
+                    self._user_revoked_at.pop(row.key, None)
+        self._checked_at = 0.0
+
+
+registry = RevocationRegistry()
@@ -1,7 +1,12 @@
 from django.contrib.auth import authenticate
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import OuterRef
 from rest_framework import serializers
 
-from .models import Department, Role, User
+from config.projection import Projection
+from . import revocation
+from .models import Department, Role, User, UserRole
+from .tokens import bump_permissions_version
 
 
 # ──────────────────────────────────────────────
@@ -21,6 +26,10 @@ class LoginSerializer(serializers.Serializer):
         return attrs
 
 
+class LogoutSerializer(serializers.Serializer):
+    refreshToken = serializers.CharField(required=False)
+
+
 class UserProfileSerializer(serializers.ModelSerializer):
     roles = serializers.SerializerMethodField()
     dept = serializers.CharField(source="department.name", default=None)
@@ -53,6 +62,14 @@ class UserListSerializer(serializers.ModelSerializer):
         return obj.role_codes
 
 
+# 역할 코드는 사용자별 서브쿼리 배열로 한 번에 (행마다 추가 쿼리 없음)
+user_list_projection = Projection(UserListSerializer, annotations={
+    "roles": ArraySubquery(
+        UserRole.objects.filter(user_id=OuterRef("pk")).values("role__code")
+    ),
+})
+
+
 class UserCreateSerializer(serializers.ModelSerializer):
     deptId = serializers.UUIDField(write_only=True, required=False, allow_null=True)
     roleCodes = serializers.ListField(child=serializers.CharField(), write_only=True)
@@ -74,10 +91,22 @@ class UserCreateSerializer(serializers.ModelSerializer):
         )
         # 역할 연결
         roles = Role.objects.filter(code__in=role_codes)
-        user.roles.set(roles)
+        user.set_roles(roles)
         return user
 
 
+class UserBulkImportSerializer(serializers.Serializer):
+    file = serializers.FileField(required=False)
+    rows = serializers.ListField(child=serializers.DictField(), required=False)
+    # 생략하면 password 열이 없는 행은 사용 불가 비밀번호 (공용 기본 비밀번호 없음)
+    password = serializers.CharField(required=False, write_only=True)
+
+    def validate(self, attrs):
+        if not attrs.get("file") and not attrs.get("rows"):
+            raise serializers.ValidationError("file 또는 rows 가 필요합니다.")
+        return attrs
+
+
 class UserUpdateSerializer(serializers.ModelSerializer):
     roleCodes = serializers.ListField(
         child=serializers.CharField(), write_only=True, required=False
@@ -90,12 +119,22 @@ class UserUpdateSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         role_codes = validated_data.pop("roleCodes", None)
+        changed = any(getattr(instance, attr) != value for attr, value in validated_data.items())
+        status_changed = "status" in validated_data and validated_data["status"] != instance.status
+        roles_changed = False
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         instance.save()
         if role_codes is not None:
             roles = Role.objects.filter(code__in=role_codes)
-            instance.roles.set(roles)
+            roles_changed = set(instance.role_codes) != set(roles.values_list("code", flat=True))
+            instance.set_roles(roles)
+        if changed or roles_changed:
+            # 토큰 claims 무효화 → 다음 요청부터 DB 기준
+            bump_permissions_version(instance)
+        if status_changed or roles_changed:
+            # 상태/역할 변경 → 기존 토큰 전부 폐기 (재로그인 필요)
+            revocation.registry.revoke_user(instance.pk)
         return instance
 
 
@@ -0,0 +1,30 @@
+"""
+엔드포인트별 쿼리 예산 (settings.QUERY_BUDGETS) — 1행/100행, 관리자/일반 사용자.
+
+    python manage.py test apps.accounts.tests.test_query_budgets
+"""
+from django.conf import settings
+from django.test import TestCase
+
+from apps.accounts.management.commands.check_query_budgets import (
+    ENDPOINTS,
+    ROLES,
+    SIZES,
+    budget_environment,
+    measure,
+    problems,
+)
+
+
+class QueryBudgetTests(TestCase):
+
+    def test_every_budget_has_an_endpoint(self):
+        self.assertEqual(set(settings.QUERY_BUDGETS), {name for name, _, _ in ENDPOINTS})
+
+    def test_endpoints_within_budget(self):
+        with budget_environment():
+            results = {size: measure(size) for size in SIZES}
+        for name, _, _ in ENDPOINTS:
+            for role in ROLES:
+                with self.subTest(endpoint=name, role=role):
+                    self.assertEqual(problems(results, role, name), [])
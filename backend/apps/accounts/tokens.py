@@ -0,0 +1,105 @@
+"""
+accounts/tokens.py
+JWT 에 역할/부서/상태/권한 버전(pv) claims 를 담아 읽기 요청이 DB 없이 처리되도록 한다.
+
+권한 버전은 User.permissions_version 이 원본이고, 변경 시 캐시에도 기록한다.
+토큰의 pv 가 캐시 값보다 낮으면 인증 단계에서 DB 조회로 폴백한다.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from rest_framework import exceptions
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import User
+
+_PV_KEY = "perm_version:{}"
+
+
+def user_claims(user):
+    return {
+        "roles": user.role_codes,
+        "deptId": str(user.department_id) if user.department_id else None,
+        "dept": user.department.name if user.department_id else None,
+        "name": user.name,
+        "email": user.email,
+        "position": user.position,
+        "status": user.status,
+        "pv": user.permissions_version,
+    }
+
+
+class PortalRefreshToken(RefreshToken):
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim, value in user_claims(user).items():
+            token[claim] = value
+        return token
+
+
+class PortalTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    토큰 갱신 시 claims 를 DB 기준으로 다시 채운다.
+    (갱신 주기마다 1회 조회 → 갱신된 access 토큰은 항상 최신 pv)
+    """
+    token_class = PortalRefreshToken
+
+    def validate(self, attrs):
+        from .revocation import registry
+
+        refresh = self.token_class(attrs["refresh"])
+        if registry.is_revoked(refresh):
+            raise InvalidToken("폐기된 토큰입니다.")
+        user = (
+            User.objects.select_related("department")
+            .filter(pk=refresh[api_settings.USER_ID_CLAIM], status=User.Status.ACTIVE)
+            .first()
+        )
+        if user is None:
+            raise exceptions.AuthenticationFailed("비활성화된 계정입니다.")
+        for claim, value in user_claims(user).items():
+            refresh[claim] = value
+
+        data = {"access": str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            # 회전된 이전 refresh 토큰은 재사용 불가
+            registry.revoke_token(refresh[api_settings.JTI_CLAIM], refresh["exp"])
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
+
+
+# ──────────────────────────────────────────────
+# 권한 버전
+# ──────────────────────────────────────────────
+def current_permissions_version(user_id):
+    """캐시에 기록된 최신 pv. 변경 이력이 없으면 None (토큰 값 신뢰)."""
+    return cache.get(_PV_KEY.format(user_id))
+
+
+def _pv_timeout():
+    # access 토큰 수명 동안만 유지하면 충분 (갱신 시 claims 재발급)
+    return int(settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"].total_seconds())
+
+
+def bump_permissions_version(user):
+    User.objects.filter(pk=user.pk).update(permissions_version=F("permissions_version") + 1)
+    user.refresh_from_db(fields=["permissions_version"])
+    cache.set(_PV_KEY.format(user.pk), user.permissions_version, timeout=_pv_timeout())
+    return user.permissions_version
+
+
+def bump_permissions_versions(user_ids):
+    """여러 사용자 일괄 (디렉터리 동기화 등)."""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return
+    User.objects.filter(pk__in=user_ids).update(permissions_version=F("permissions_version") + 1)
+    versions = User.objects.filter(pk__in=user_ids).values_list("pk", "permissions_version")
+    cache.set_many({_PV_KEY.format(pk): pv for pk, pv in versions}, timeout=_pv_timeout())
@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import UserListCreateView, UserUpdateView
+from .views import UserBulkImportView, UserListCreateView, UserUpdateView
 
 urlpatterns = [
     path("", UserListCreateView.as_view(), name="user-list-create"),
+    path("bulk", UserBulkImportView.as_view(), name="user-bulk-import"),
     path("<uuid:pk>", UserUpdateView.as_view(), name="user-update"),
 ]
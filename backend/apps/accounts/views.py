@@ -1,18 +1,28 @@
 from django.utils import timezone
 from rest_framework import generics, status
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 
-from .models import User
+from config.projection import ProjectionListMixin
+from .authentication import ClaimsPrincipal
+from .models import Role, User
+from .permissions import IsAdmin, is_super_admin
+from .revocation import registry
 from .serializers import (
     LoginSerializer,
+    LogoutSerializer,
+    UserBulkImportSerializer,
     UserCreateSerializer,
     UserListSerializer,
     UserProfileSerializer,
     UserUpdateSerializer,
+    user_list_projection,
 )
+from .tokens import PortalRefreshToken
 
 
 # ──────────────────────────────────────────────
@@ -30,7 +40,8 @@ class LoginView(APIView):
         user.last_login_at = timezone.now()
         user.save(update_fields=["last_login_at"])
 
-        refresh = RefreshToken.for_user(user)
+        # 역할/부서/상태/pv claims 포함
+        refresh = PortalRefreshToken.for_user(user)
         return Response({
             "accessToken": str(refresh.access_token),
             "refreshToken": str(refresh),
@@ -38,6 +49,28 @@ class LoginView(APIView):
         })
 
 
+# ──────────────────────────────────────────────
+# POST /api/auth/logout   → 현재 access + 전달된 refresh 토큰 폐기
+# ──────────────────────────────────────────────
+class LogoutView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = LogoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        tokens = [request.auth]
+        raw_refresh = serializer.validated_data.get("refreshToken")
+        if raw_refresh:
+            try:
+                tokens.append(PortalRefreshToken(raw_refresh))
+            except TokenError:
+                pass  # 이미 만료/무효 → 폐기할 필요 없음
+        for token in tokens:
+            registry.revoke_token(token[api_settings.JTI_CLAIM], token["exp"])
+        return Response({"loggedOut": True})
+
+
 # ──────────────────────────────────────────────
 # GET /api/auth/me
 # ──────────────────────────────────────────────
@@ -45,6 +78,8 @@ class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        if isinstance(request.user, ClaimsPrincipal):
+            return Response(request.user.profile())
         return Response(UserProfileSerializer(request.user).data)
 
 
@@ -52,8 +87,9 @@ class MeView(APIView):
 # GET  /api/users/          → 목록
 # POST /api/users/          → 생성
 # ──────────────────────────────────────────────
-class UserListCreateView(generics.ListCreateAPIView):
+class UserListCreateView(ProjectionListMixin, generics.ListCreateAPIView):
     queryset = User.objects.select_related("department").prefetch_related("roles").all()
+    projection = user_list_projection
     filterset_fields = ["status"]
     search_fields = ["name", "email"]
 
@@ -81,3 +117,40 @@ class UserUpdateView(generics.UpdateAPIView):
     serializer_class = UserUpdateSerializer
     http_method_names = ["patch"]
     lookup_field = "pk"
+
+
+# 슈퍼관리자가 아니면 SUPER_ADMIN 은 부여할 수 없다
+ASSIGNABLE_BY_ADMIN = {Role.Code.ADMIN, Role.Code.USER}
+
+
+# ──────────────────────────────────────────────
+# POST /api/users/bulk    → CSV 일괄 등록
+#   multipart: file=users.csv  |  JSON: {"rows": [{email, name, department, position, roles}]}
+#   관리자 전용. password 를 주지 않으면 password 열이 없는 행은 사용 불가 비밀번호 (passwordUnset 건수)
+# ──────────────────────────────────────────────
+class UserBulkImportView(APIView):
+    permission_classes = [IsAdmin]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+
+    def post(self, request):
+        # 프로세스 풀(multiprocessing) 을 쓰는 모듈이라 워커 부팅 때는 읽지 않는다
+        from .provisioning import import_users, normalize_row, read_csv
+
+        serializer = UserBulkImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        d = serializer.validated_data
+
+        if d.get("file"):
+            rows = read_csv(d["file"])
+        else:
+            rows = [normalize_row(row, i) for i, row in enumerate(d["rows"], start=1)]
+        # 해시는 요청 스레드에서 — gunicorn 스레드 워커(DB 연결 보유)를 fork 하지 않고,
+        # 동시 업로드마다 CPU 수만큼 프로세스가 늘어나지도 않는다
+        report = import_users(
+            rows, default_password=d.get("password"), workers=1,
+            assignable_roles=None if is_super_admin(request.user) else ASSIGNABLE_BY_ADMIN,
+        )
+        return Response(
+            report.as_dict(),
+            status=status.HTTP_201_CREATED if report.created else status.HTTP_200_OK,
+        )
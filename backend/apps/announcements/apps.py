@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class AnnouncementsConfig(AppConfig):
+    name = "apps.announcements"
+
+    def ready(self):
+        from . import signals  # noqa: F401
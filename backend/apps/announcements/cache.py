@@ -0,0 +1,27 @@
+"""
+announcements/cache.py
+최신 공지 — 포탈 페이지마다 호출되므로 렌더링된 응답 바이트를 통째로 캐시한다.
+적중 시 ORM/Serializer/Renderer 를 모두 건너뛴다.
+공유 캐시(Redis)가 없으면 10분 보관 대신 UNSHARED_CACHE_TTL 초 (config/caching.py).
+"""
+from config.caching import TwoLevelCache
+from config.renderers import FastApiRenderer
+from .models import Announcement
+from .serializers import AnnouncementSerializer
+
+latest_cache = TwoLevelCache("announcements", local_ttl=2, shared_ttl=600)
+
+
+def _render_latest():
+    ann = Announcement.objects.select_related("created_by").first()
+    data = AnnouncementSerializer(ann).data if ann else None
+    return FastApiRenderer().render(data)
+
+
+def latest_body():
+    """{"success": true, "data": {...}, "message": null} 인코딩된 bytes."""
+    return latest_cache.get_or_set("latest", _render_latest)
+
+
+def invalidate():
+    latest_cache.invalidate()
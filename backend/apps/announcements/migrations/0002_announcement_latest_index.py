@@ -0,0 +1,19 @@
+# Generated by Django 5.0.7 on 2026-10-19 14:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(fields=['-is_pinned', '-created_at'], name='idx_ann_pinned_created'),
+        ),
+    ]
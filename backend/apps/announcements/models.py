@@ -21,6 +21,10 @@ class Announcement(models.Model):
     class Meta:
         db_table = "announcements"
         ordering = ["-is_pinned", "-created_at"]
+        indexes = [
+            # 최신 공지 조회 (ORDER BY is_pinned DESC, created_at DESC LIMIT 1)
+            models.Index(fields=["-is_pinned", "-created_at"], name="idx_ann_pinned_created"),
+        ]
 
     def __str__(self):
         return self.title
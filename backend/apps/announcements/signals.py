@@ -0,0 +1,16 @@
+"""
+announcements/signals.py
+생성 API / 관리자 화면 수정·삭제 모두 최신 공지 캐시를 무효화한다.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import cache
+from .models import Announcement
+
+
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def _invalidate_latest(sender, **kwargs):
+    transaction.on_commit(cache.invalidate)
@@ -1,7 +1,13 @@
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.http import HttpResponse
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.events.broker import publish
+from config.async_views import AsyncReadMixin
+from . import cache
 from .models import Announcement
 from .serializers import AnnouncementCreateSerializer, AnnouncementSerializer
 
@@ -9,13 +15,16 @@ from .serializers import AnnouncementCreateSerializer, AnnouncementSerializer
 # ──────────────────────────────────────────────
 # GET /api/announcements/latest
 # ──────────────────────────────────────────────
-class AnnouncementLatestView(APIView):
+class AnnouncementLatestView(AsyncReadMixin, APIView):
 
     def get(self, request):
-        ann = Announcement.objects.select_related("created_by").first()
-        if not ann:
-            return Response(None)
-        return Response(AnnouncementSerializer(ann).data)
+        # 사전 직렬화된 응답 바이트 (캐시 무효화: signals.py)
+        return HttpResponse(cache.latest_body(), content_type="application/json")
+
+    async def aget(self, request):
+        # 로컬 적중은 이벤트 루프에서 바로, 그 외(공유 캐시/DB)만 스레드로
+        body = cache.latest_cache.peek("latest") or await sync_to_async(cache.latest_body)()
+        return HttpResponse(body, content_type="application/json")
 
 
 # ──────────────────────────────────────────────
@@ -38,7 +47,6 @@ class AnnouncementCreateView(APIView):
             is_pinned=d.get("isPinned", False),
             created_by=request.user,
         )
-        return Response(
-            AnnouncementSerializer(ann).data,
-            status=status.HTTP_201_CREATED,
-        )
+        data = AnnouncementSerializer(ann).data
+        transaction.on_commit(lambda: publish("announcement.created", data))
+        return Response(data, status=status.HTTP_201_CREATED)
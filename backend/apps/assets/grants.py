@@ -0,0 +1,82 @@
+"""
+assets/grants.py
+자산 열람/다운로드 grant — 서명된 단기 토큰.
+
+  payload: a=자산 id, v=버전 id, u=사용자 id, s=scope, x=만료(epoch), j=jti, r=소스 URL
+
+발급 시점(공유 승인, 권한 확인된 다운로드 요청)에만 DB 를 보고,
+검증은 SECRET_KEY 서명 + 만료 + 폐기 여부로 끝난다.
+폐기는 토큰 폐기와 같은 RevokedToken 테이블(kind=GRANT)에 기록하고,
+검증 시에는 워커의 Bloom filter 만 본다 (apps/accounts/revocation.py, 걸렸을 때만 DB 확인).
+필터 적재/동기화는 워커 기동 시와 백그라운드 스레드에서 한다 (gunicorn post_worker_init).
+"""
+import secrets
+import time
+
+from django.conf import settings
+from django.core import signing
+
+from apps.accounts.revocation import registry
+
+SALT = "assets.grant"
+SCOPE_VIEW = "view"
+SCOPE_DOWNLOAD = "download"
+SCOPES = (SCOPE_VIEW, SCOPE_DOWNLOAD)
+
+
+class GrantError(Exception):
+    pass
+
+
+def issue(asset, user, scope, version=None, ttl=None):
+    """grant 문자열 발급. version 미지정 시 asset.latest_version 사용."""
+    if scope not in SCOPES:
+        raise ValueError(f"알 수 없는 scope: {scope}")
+    version = version or asset.latest_version
+    if version is None:
+        raise GrantError("등록된 버전이 없습니다.")
+    exp = int(time.time()) + (ttl or settings.ASSET_GRANT_TTL)
+    payload = {
+        "a": str(asset.pk),
+        "v": str(version.pk),
+        "u": str(user.pk),
+        "s": scope,
+        "x": exp,
+        "j": secrets.token_urlsafe(8),
+        "r": version.source_url,
+    }
+    return {
+        "grant": signing.dumps(payload, salt=SALT, compress=True),
+        "expiresAt": exp,
+        "scope": scope,
+    }
+
+
+def decode(token):
+    """서명만 검증하고 payload 반환 (만료/폐기 검사 X)."""
+    try:
+        return signing.loads(token, salt=SALT)
+    except signing.BadSignature:
+        raise GrantError("유효하지 않은 grant 입니다.")
+
+
+def verify(token, asset_id, scopes=SCOPES):
+    """서명/만료/자산/scope/폐기 여부 검사 후 payload 반환. 폐기 필터에 걸릴 때만 DB 조회."""
+    payload = decode(token)
+    if payload["x"] < time.time():
+        raise GrantError("만료된 grant 입니다.")
+    if payload["a"] != str(asset_id):
+        raise GrantError("다른 자산의 grant 입니다.")
+    if payload["s"] not in scopes:
+        raise GrantError("허용되지 않은 scope 입니다.")
+    if registry.is_grant_revoked(payload["j"]):
+        raise GrantError("폐기된 grant 입니다.")
+    return payload
+
+
+def revoke(token):
+    """만료 전 조기 폐기. 만료 시각까지만 테이블에 유지된다 (모든 워커에 전파)."""
+    payload = decode(token)
+    registry.revoke_grant(payload["j"], payload["x"])
+    return payload
+
@@ -1,4 +1,8 @@
 from rest_framework import serializers
+
+from config.projection import Projection, SparseFieldsMixin
+
+from .grants import SCOPES
 from .models import Asset, AssetPermission, AssetVersion, Category, Tag
 
 
@@ -33,6 +37,9 @@ class VersionSerializer(serializers.ModelSerializer):
     sourceFileId = serializers.CharField(source="source_file_id", read_only=True)
 
 
+version_projection = Projection(VersionSerializer)
+
+
 class VersionCreateSerializer(serializers.Serializer):
     sourceType = serializers.ChoiceField(choices=AssetVersion.SourceType.choices)
     sourceUrl = serializers.URLField()
@@ -59,14 +66,22 @@ class AssetListSerializer(serializers.ModelSerializer):
     downloadAllowed = serializers.BooleanField(source="download_allowed", read_only=True)
 
 
+asset_list_projection = Projection(AssetListSerializer)
+
+
 # ──────────────────────────────────────────────
 # Asset 상세
 # ──────────────────────────────────────────────
-class AssetDetailSerializer(serializers.ModelSerializer):
+class AssetDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     category = serializers.CharField(source="category.name", default=None)
     tags = serializers.SerializerMethodField()
     latestVersion = serializers.SerializerMethodField()
 
+    sparse_sources = {
+        "tags": ("prefetch", "tags"),
+        "latestVersion": ("select", "latest_version"),
+    }
+
     class Meta:
         model = Asset
         fields = [
@@ -81,6 +96,9 @@ class AssetDetailSerializer(serializers.ModelSerializer):
     securityLabel = serializers.CharField(source="security_label", read_only=True)
 
     def get_tags(self, obj):
+        # sparse_queryset 의 prefetch 결과가 있으면 추가 쿼리 없이
+        if "tags" in getattr(obj, "_prefetched_objects_cache", {}):
+            return [tag.name for tag in obj.tags.all()]
         return list(obj.tags.values_list("name", flat=True))
 
     def get_latestVersion(self, obj):
@@ -192,3 +210,14 @@ class PermissionSerializer(serializers.ModelSerializer):
 class PermissionBulkSerializer(serializers.Serializer):
     """PUT /api/assets/{id}/permissions → 전체 교체"""
     rules = PermissionSerializer(many=True)
+
+
+# ──────────────────────────────────────────────
+# Grant (열람/다운로드 서명 토큰)
+# ──────────────────────────────────────────────
+class GrantIssueSerializer(serializers.Serializer):
+    scope = serializers.ChoiceField(choices=SCOPES, default="download")
+
+
+class GrantRevokeSerializer(serializers.Serializer):
+    grant = serializers.CharField()
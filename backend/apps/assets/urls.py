@@ -1,14 +1,26 @@
 from django.urls import path
+from .grants import SCOPE_DOWNLOAD
 from .views import (
     AssetDetailView,
+    AssetGrantRedirectView,
+    AssetGrantView,
     AssetListCreateView,
+    GrantRevokeView,
     PermissionView,
     VersionListCreateView,
 )
 
 urlpatterns = [
     path("", AssetListCreateView.as_view(), name="asset-list-create"),
+    path("grants/revoke", GrantRevokeView.as_view(), name="asset-grant-revoke"),
     path("<uuid:pk>", AssetDetailView.as_view(), name="asset-detail"),
     path("<uuid:pk>/versions", VersionListCreateView.as_view(), name="asset-versions"),
     path("<uuid:pk>/permissions", PermissionView.as_view(), name="asset-permissions"),
+    path("<uuid:pk>/grants", AssetGrantView.as_view(), name="asset-grants"),
+    path(
+        "<uuid:pk>/download",
+        AssetGrantRedirectView.as_view(scopes=(SCOPE_DOWNLOAD,)),
+        name="asset-download",
+    ),
+    path("<uuid:pk>/view", AssetGrantRedirectView.as_view(), name="asset-view"),
 ]
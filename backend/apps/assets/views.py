@@ -1,17 +1,28 @@
-from rest_framework import generics, status
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max, Prefetch, Q
+from django.http import HttpResponseRedirect, JsonResponse
+from django.views import View
+from rest_framework import generics, serializers, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from config.async_views import AsyncReadMixin
+from config.projection import ProjectionListMixin, requested_fields
+from . import grants
 from .models import Asset, AssetPermission, AssetVersion
 from .serializers import (
     AssetCreateSerializer,
     AssetDetailSerializer,
     AssetListSerializer,
     AssetUpdateSerializer,
+    GrantIssueSerializer,
+    GrantRevokeSerializer,
     PermissionBulkSerializer,
     PermissionSerializer,
     VersionCreateSerializer,
     VersionSerializer,
+    asset_list_projection,
+    version_projection,
 )
 
 
@@ -19,7 +30,9 @@ from .serializers import (
 # GET  /api/assets/         → 목록
 # POST /api/assets/         → 생성
 # ──────────────────────────────────────────────
-class AssetListCreateView(generics.ListCreateAPIView):
+class AssetListCreateView(AsyncReadMixin, ProjectionListMixin, generics.ListCreateAPIView):
+    projection = asset_list_projection
+    read_replica = True  # GET 은 읽기 복제본 (config/db_router.py)
     queryset = (
         Asset.objects
         .select_related("category", "latest_version")
@@ -75,29 +88,112 @@ class AssetListCreateView(generics.ListCreateAPIView):
 
 
 # ──────────────────────────────────────────────
-# GET    /api/assets/{id}/   → 상세
+# ?include= 관련 데이터 (상세 화면 한 번에 로드)
+# ──────────────────────────────────────────────
+INCLUDES = ("versions", "permissions", "shareRequests", "stats")
+
+
+def _include_prefetches(include):
+    from apps.sharing.models import ShareRequest
+
+    prefetches = []
+    if "versions" in include:
+        prefetches.append(Prefetch(
+            "versions", queryset=AssetVersion.objects.order_by("-version_no"),
+            to_attr="included_versions",
+        ))
+    if "permissions" in include:
+        prefetches.append(Prefetch(
+            "permissions", queryset=AssetPermission.objects.order_by("created_at"),
+            to_attr="included_permissions",
+        ))
+    if "shareRequests" in include:
+        # asset 은 prefetch 가 부모 인스턴스로 채워준다
+        prefetches.append(Prefetch(
+            "share_requests",
+            queryset=ShareRequest.objects.select_related("requested_by", "approved_by").order_by("-created_at"),
+            to_attr="included_share_requests",
+        ))
+    return prefetches
+
+
+def asset_stats(asset_id):
+    """접근 로그 액션별 건수 + 공유 요청 상태별 건수 (각 1쿼리)"""
+    from apps.logs.models import AccessLog
+    from apps.sharing.models import ShareRequest
+
+    Action = AccessLog.Action
+    logs = AccessLog.objects.filter(asset_id=asset_id).aggregate(
+        views=Count("id", filter=Q(action=Action.VIEW)),
+        plays=Count("id", filter=Q(action=Action.PLAY)),
+        downloads=Count("id", filter=Q(action=Action.DOWNLOAD)),
+        denied=Count("id", filter=Q(result=AccessLog.Result.DENIED)),
+        uniqueUsers=Count("user", distinct=True),
+        lastAccessedAt=Max("occurred_at"),
+    )
+    # /api/share-requests/summary 와 같은 모양
+    shares = ShareRequest.objects.filter(asset_id=asset_id).aggregate(
+        **{s: Count("id", filter=Q(status=s)) for s in ShareRequest.Status.values},
+        total=Count("id"),
+    )
+    logs["lastAccessedAt"] = serializers.DateTimeField().to_representation(logs["lastAccessedAt"])
+    return {**logs, "shareRequests": shares}
+
+
+# ──────────────────────────────────────────────
+# GET    /api/assets/{id}/   → 상세 (?fields=, ?include=versions,permissions,shareRequests,stats)
 # PATCH  /api/assets/{id}/   → 수정
 # DELETE /api/assets/{id}/   → 삭제
 # ──────────────────────────────────────────────
-class AssetDetailView(APIView):
-
-    def _get_asset(self, pk):
-        return (
-            Asset.objects
-            .select_related("category", "latest_version")
-            .prefetch_related("tags")
-            .get(pk=pk)
-        )
+class AssetDetailView(AsyncReadMixin, APIView):
+
+    def _asset_queryset(self, fields=None, include=frozenset()):
+        # ?fields= 에 없는 필드의 조인/prefetch 는 생략
+        also = ("title",) if "shareRequests" in include else ()  # 공유 요청의 assetTitle
+        qs = AssetDetailSerializer.sparse_queryset(Asset.objects.all(), fields, also)
+        return qs.prefetch_related(*_include_prefetches(include))
+
+    def _get_asset(self, pk, fields=None, include=frozenset()):
+        return self._asset_queryset(fields, include).get(pk=pk)
+
+    def _detail_data(self, asset, fields, include):
+        from apps.sharing.serializers import ShareRequestListSerializer
+
+        data = AssetDetailSerializer(asset, fields=fields).data
+        if "versions" in include:
+            data["versions"] = VersionSerializer(asset.included_versions, many=True).data
+        if "permissions" in include:
+            data["permissions"] = PermissionSerializer(asset.included_permissions, many=True).data
+        if "shareRequests" in include:
+            data["shareRequests"] = ShareRequestListSerializer(asset.included_share_requests, many=True).data
+        if "stats" in include:
+            data["stats"] = asset_stats(asset.pk)
+        return data
 
     def get(self, request, pk):
+        fields = requested_fields(request, AssetDetailSerializer().fields)
+        include = requested_fields(request, INCLUDES, param="include") or frozenset()
+        try:
+            asset = self._get_asset(pk, fields, include)
+        except Asset.DoesNotExist:
+            return Response(
+                {"detail": "자산을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(self._detail_data(asset, fields, include))
+
+    async def aget(self, request, pk):
+        fields = requested_fields(request, AssetDetailSerializer().fields)
+        include = requested_fields(request, INCLUDES, param="include") or frozenset()
         try:
-            asset = self._get_asset(pk)
+            asset = await self._asset_queryset(fields, include).aget(pk=pk)
         except Asset.DoesNotExist:
             return Response(
                 {"detail": "자산을 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        return Response(AssetDetailSerializer(asset).data)
+        # tags/stats 는 직렬화 중에 쿼리하므로 sync 구간으로
+        return Response(await sync_to_async(self._detail_data)(asset, fields, include))
 
     def patch(self, request, pk):
         try:
@@ -130,8 +226,9 @@ class AssetDetailView(APIView):
 class VersionListCreateView(APIView):
 
     def get(self, request, pk):
+        fields = requested_fields(request, version_projection.field_names)
         versions = AssetVersion.objects.filter(asset_id=pk).order_by("-version_no")
-        return Response(VersionSerializer(versions, many=True).data)
+        return Response(version_projection.map(version_projection.values(versions, fields), fields))
 
     def post(self, request, pk):
         try:
@@ -201,3 +298,106 @@ class PermissionView(APIView):
 
         perms = asset.permissions.all()
         return Response(PermissionSerializer(perms, many=True).data)
+
+
+# ──────────────────────────────────────────────
+# 열람/다운로드 grant
+# ──────────────────────────────────────────────
+def has_access(asset, user, scope):
+    """grant 발급 전 권한 확인: 관리자 / 공개 설정 / ACL / 승인된 공유요청."""
+    from apps.sharing.models import ShareRequest
+
+    role_codes = user.role_codes
+    if {"SUPER_ADMIN", "ADMIN"} & set(role_codes):
+        return True
+
+    public = (
+        asset.publish_status == Asset.PublishStatus.PUBLISHED
+        and asset.view_scope == Asset.ViewScope.ALL_USERS
+    )
+    if public and (scope == grants.SCOPE_VIEW or asset.download_allowed):
+        return True
+
+    subjects = Q(subject_type=AssetPermission.SubjectType.USER, subject_id=str(user.pk))
+    subjects |= Q(subject_type=AssetPermission.SubjectType.ROLE, subject_id__in=role_codes)
+    if user.department_id:
+        subjects |= Q(subject_type=AssetPermission.SubjectType.DEPT, subject_id=str(user.department_id))
+    flag = "can_download" if scope == grants.SCOPE_DOWNLOAD else "can_view"
+    if asset.permissions.filter(subjects, **{flag: True}).exists():
+        return True
+
+    return ShareRequest.objects.filter(
+        asset=asset, requested_by=user, status=ShareRequest.Status.APPROVED,
+    ).exists()
+
+
+# POST /api/assets/{id}/grants   {"scope": "view" | "download"}
+class AssetGrantView(APIView):
+
+    def post(self, request, pk):
+        serializer = GrantIssueSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        scope = serializer.validated_data["scope"]
+
+        try:
+            asset = Asset.objects.select_related("latest_version").get(pk=pk)
+        except Asset.DoesNotExist:
+            return Response(
+                {"detail": "자산을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if not has_access(asset, request.user, scope):
+            return Response({"detail": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+        try:
+            grant = grants.issue(asset, request.user, scope)
+        except grants.GrantError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(grant, status=status.HTTP_201_CREATED)
+
+
+def can_revoke(payload, user):
+    """grant 폐기 권한: 발급받은 본인 / 자산 소유자 / 관리자."""
+    if payload["u"] == str(user.pk):
+        return True
+    if {"SUPER_ADMIN", "ADMIN"} & set(user.role_codes):
+        return True
+    return Asset.objects.filter(pk=payload["a"], owner_id=user.pk).exists()
+
+
+# POST /api/assets/grants/revoke   {"grant": "..."}
+class GrantRevokeView(APIView):
+
+    def post(self, request):
+        serializer = GrantRevokeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        token = serializer.validated_data["grant"]
+        try:
+            payload = grants.decode(token)
+        except grants.GrantError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if not can_revoke(payload, request.user):
+            return Response({"detail": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+        grants.revoke(token)
+        return Response({"revoked": True, "expiresAt": payload["x"]})
+
+
+# ──────────────────────────────────────────────
+# GET /api/assets/{id}/download?grant=   → 소스 URL 로 302
+# GET /api/assets/{id}/view?grant=
+#   DRF/JWT 인증을 거치지 않는 순수 Django 뷰 — grant 서명 + 워커의 폐기 Bloom filter 만 확인
+#   (필터는 gunicorn 워커 기동 시 적재되고 백그라운드에서 동기화 → 폐기된 grant 일 때만 DB 조회)
+# ──────────────────────────────────────────────
+class AssetGrantRedirectView(View):
+    scopes = grants.SCOPES
+
+    def get(self, request, pk):
+        token = request.GET.get("grant", "")
+        try:
+            payload = grants.verify(token, pk, self.scopes)
+        except grants.GrantError as e:
+            return JsonResponse(
+                {"success": False, "data": None, "message": str(e)},
+                status=403,
+                json_dumps_params={"ensure_ascii": False},
+            )
+        return HttpResponseRedirect(payload["r"])
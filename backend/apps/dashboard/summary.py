@@ -0,0 +1,115 @@
+"""
+dashboard/summary.py
+관리자 대시보드 합계.
+
+  - 공유 요청 대기 건수는 counters 테이블 (COUNT(*) 없음)
+  - 나머지는 인덱스를 타는 집계 쿼리 3개 → 결과를 DASHBOARD_CACHE_TTL 초 캐시
+  - 캐시 만료 시 재계산은 한 곳에서만 (single-flight):
+      워커 안에서는 threading.Lock(기다리지 않고 시도), 워커 간에는 cache.add 락
+      락을 못 잡은 요청은 직전 값을 그대로 반환 (직전 값이 없을 때만 대기)
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.assets.models import Asset
+from apps.logs.models import AccessLog
+from apps.sharing import counters
+from apps.sharing.models import ShareRequest
+from config.metrics import cache_requests
+
+_KEY = "dashboard:summary"
+_LOCK_KEY = "dashboard:summary:lock"
+_LOCK_TIMEOUT = 30  # 초 — 재계산 중 워커가 죽어도 락이 풀리도록
+_lock = threading.Lock()
+
+
+def compute():
+    published = dict(
+        Asset.objects
+        .filter(publish_status=Asset.PublishStatus.PUBLISHED)
+        .order_by()
+        .values_list("type")
+        .annotate(n=Count("id"))
+    )
+    assets = {t: published.get(t, 0) for t in Asset.Type.values}
+    assets["total"] = sum(assets.values())
+
+    today_start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = AccessLog.objects.filter(occurred_at__gte=today_start).aggregate(
+        views=Count("id", filter=Q(action=AccessLog.Action.VIEW)),
+        plays=Count("id", filter=Q(action=AccessLog.Action.PLAY)),
+        downloads=Count("id", filter=Q(action=AccessLog.Action.DOWNLOAD)),
+        denied=Count("id", filter=Q(result=AccessLog.Result.DENIED)),
+        activeUsers=Count("user", distinct=True),
+    )
+
+    share_requests = counters.summary()
+    return {
+        "publishedAssets": assets,
+        "pendingShareRequests": share_requests[ShareRequest.Status.PENDING],
+        "shareRequests": share_requests,
+        "today": today,
+        "activeUsers": User.objects.filter(status=User.Status.ACTIVE).count(),
+        "generatedAt": timezone.localtime().isoformat(),
+    }
+
+
+def _store(data):
+    ttl = settings.DASHBOARD_CACHE_TTL
+    # 만료 후에도 재계산 중인 동안 돌려줄 수 있도록 실제 보관은 더 길게
+    cache.set(_KEY, {"data": data, "fresh_until": time.time() + ttl}, timeout=ttl * 10)
+
+
+def get_summary():
+    entry = cache.get(_KEY)
+    if entry and entry["fresh_until"] > time.time():
+        cache_requests.labels("dashboard", "hit").inc()
+        return entry["data"]
+
+    if not _lock.acquire(blocking=False):
+        # 같은 워커의 다른 스레드가 계산 중 → 직전 값, 없으면(첫 계산) 끝날 때까지 대기
+        if entry:
+            cache_requests.labels("dashboard", "stale").inc()
+            return entry["data"]
+        with _lock:
+            pass
+        entry = cache.get(_KEY)
+        if entry:
+            cache_requests.labels("dashboard", "wait").inc()
+            return entry["data"]
+        return get_summary()  # 계산이 실패했으면 이 요청이 다시 시도
+
+    try:
+        # 같은 워커의 다른 스레드가 방금 계산했을 수 있다
+        entry = cache.get(_KEY)
+        if entry and entry["fresh_until"] > time.time():
+            cache_requests.labels("dashboard", "hit").inc()
+            return entry["data"]
+        if cache.add(_LOCK_KEY, 1, timeout=_LOCK_TIMEOUT):
+            cache_requests.labels("dashboard", "miss").inc()
+            try:
+                data = compute()
+                _store(data)
+                return data
+            finally:
+                cache.delete(_LOCK_KEY)
+    finally:
+        _lock.release()
+
+    # 다른 워커가 계산 중
+    cache_requests.labels("dashboard", "stale" if entry else "wait").inc()
+    if entry:
+        return entry["data"]
+    deadline = time.monotonic() + _LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        entry = cache.get(_KEY)
+        if entry:
+            return entry["data"]
+    return compute()
@@ -0,0 +1,16 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.accounts.permissions import IsAdmin
+from .summary import get_summary
+
+
+# ──────────────────────────────────────────────
+# GET /api/dashboard/summary   → 관리자 대시보드 합계 (짧은 TTL 캐시)
+# ──────────────────────────────────────────────
+class DashboardSummaryView(APIView):
+    permission_classes = [IsAdmin]
+    read_replica = True
+
+    def get(self, request):
+        return Response(get_summary())
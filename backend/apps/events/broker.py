@@ -0,0 +1,200 @@
+"""
+events/broker.py
+사용자별 실시간 이벤트 pub/sub.
+
+  - memory : 프로세스 내부 큐 (단일 프로세스/개발용)
+  - redis  : 프로세스당 Redis 구독 1개 → 로컬 큐로 분배 (멀티 워커)
+
+publish(event, data, user_ids=None)  — user_ids 가 None 이면 전체 브로드캐스트
+subscribe(user_id)                   — Subscription.get(timeout) 으로 수신
+subscribe(user_id, asynchronous=True) — (ASGI) await AsyncSubscription.aget(timeout)
+
+구독 큐는 EVENTS_QUEUE_SIZE 개까지 — 못 따라오는 구독(느린 클라이언트)은 가득 차는 순간
+구독을 끊고 get()/aget() 이 OVERFLOW 를 돌려준다 (스트림 종료 → 클라이언트 재연결).
+"""
+import asyncio
+import itertools
+import json
+import logging
+import queue
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW = {"event": "overflow", "data": None, "id": 0}
+
+
+class Subscription:
+    def __init__(self, broker, user_id):
+        self.broker = broker
+        self.user_id = user_id
+        self.queue = queue.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+        self.overflowed = False
+
+    def put(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            self._overflow()
+
+    def _overflow(self):
+        if not self.overflowed:
+            self.overflowed = True
+            self.close()
+            logger.warning("이벤트 구독 큐 초과로 연결 종료: user=%s", self.user_id)
+
+    def get(self, timeout=None):
+        """다음 메시지, timeout 시 None, 큐 초과 시 OVERFLOW."""
+        if self.overflowed:
+            return OVERFLOW
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class AsyncSubscription(Subscription):
+    """이벤트 루프에서 기다리는 구독 — 연결마다 스레드를 붙잡지 않는다."""
+
+    def __init__(self, broker, user_id):
+        super().__init__(broker, user_id)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+
+    def put(self, message):
+        # publish 는 요청 스레드/Redis 리스너 스레드에서 호출된다
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            pass  # 루프 종료 (연결 정리 중)
+
+    def _put(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._overflow()
+
+    def get(self, timeout=None):
+        raise TypeError("AsyncSubscription 은 aget() 으로 수신합니다.")
+
+    async def aget(self, timeout=None):
+        """다음 메시지, timeout 시 None, 큐 초과 시 OVERFLOW."""
+        if self.overflowed:
+            return OVERFLOW
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InProcessBroker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subs = defaultdict(set)
+        self._ids = itertools.count(1)
+
+    @property
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(s) for s in self._subs.values())
+
+    def subscribe(self, user_id, asynchronous=False):
+        sub = (AsyncSubscription if asynchronous else Subscription)(self, str(user_id))
+        with self._lock:
+            self._subs[sub.user_id].add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            subs = self._subs.get(sub.user_id)
+            if subs:
+                subs.discard(sub)
+                if not subs:
+                    del self._subs[sub.user_id]
+
+    def publish(self, event, data, user_ids=None):
+        self._deliver({
+            "event": event,
+            "data": data,
+            "userIds": None if user_ids is None else [str(u) for u in user_ids],
+        })
+
+    def _deliver(self, message):
+        user_ids = message.pop("userIds")
+        message["id"] = next(self._ids)
+        with self._lock:
+            if user_ids is None:
+                targets = [s for subs in self._subs.values() for s in subs]
+            else:
+                targets = [s for u in user_ids for s in self._subs.get(u, ())]
+        for sub in targets:
+            sub.put(message)
+
+
+class RedisBroker(InProcessBroker):
+    CHANNEL = "portal:events"
+
+    def __init__(self, url):
+        import redis
+
+        super().__init__()
+        self._redis = redis.Redis.from_url(url)
+        self._listener = None
+
+    def subscribe(self, user_id, asynchronous=False):
+        self._ensure_listener()
+        return super().subscribe(user_id, asynchronous)
+
+    def publish(self, event, data, user_ids=None):
+        self._redis.publish(self.CHANNEL, json.dumps({
+            "event": event,
+            "data": data,
+            "userIds": None if user_ids is None else [str(u) for u in user_ids],
+        }, default=str))
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener and self._listener.is_alive():
+                return
+            self._listener = threading.Thread(target=self._listen, name="events-redis", daemon=True)
+            self._listener.start()
+
+    def _listen(self):
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.CHANNEL)
+        for raw in pubsub.listen():
+            try:
+                self._deliver(json.loads(raw["data"]))
+            except Exception:
+                logger.exception("이벤트 분배 실패")
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                if settings.EVENTS_BACKEND == "redis":
+                    _broker = RedisBroker(settings.REDIS_URL)
+                else:
+                    _broker = InProcessBroker()
+    return _broker
+
+
+def publish(event, data, user_ids=None):
+    """트랜잭션 커밋 이후 호출할 것 (transaction.on_commit)."""
+    try:
+        get_broker().publish(event, data, user_ids)
+    except Exception:
+        # 알림 실패가 본 요청을 깨뜨리지 않도록
+        logger.exception("이벤트 발행 실패: %s", event)
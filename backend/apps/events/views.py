@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.renderers import BaseRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.accounts.authentication import PortalJWTAuthentication
+from apps.accounts.revocation import registry
+from config.renderers import FastApiRenderer
+from .broker import OVERFLOW, get_broker
+
+# WSGI 스트림은 연결마다 워커 스레드를 끝까지 붙잡는다 → 프로세스당 EVENTS_WSGI_MAX_STREAMS 개까지
+_wsgi_streams = None
+_wsgi_streams_lock = threading.Lock()
+
+
+def _wsgi_slots():
+    global _wsgi_streams
+    with _wsgi_streams_lock:
+        if _wsgi_streams is None:
+            _wsgi_streams = threading.BoundedSemaphore(max(settings.EVENTS_WSGI_MAX_STREAMS, 1))
+    return _wsgi_streams
+
+
+class QueryTokenJWTAuthentication(PortalJWTAuthentication):
+    """EventSource 는 헤더를 못 붙이므로 ?token= 도 허용."""
+
+    def authenticate(self, request):
+        token = request.query_params.get("token")
+        if not token:
+            return super().authenticate(request)
+        self._safe_method = True
+        validated_token = self.get_validated_token(token.encode())
+        return self.get_user(validated_token), validated_token
+
+
+class EventStreamRenderer(BaseRenderer):
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # 인증 실패 등 에러 응답만 여기로 온다
+        return f"event: error\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+# 연결 중 토큰이 만료/폐기(비활성화·역할 변경 포함)되면 보내고 끊는다 → 클라이언트는 새 토큰으로 재연결
+EXPIRED = {"event": "expired", "data": None, "id": 0}
+
+
+def _token_valid(token):
+    return token["exp"] > time.time() and not registry.is_revoked(token)
+
+
+def _sse(message):
+    data = json.dumps(message["data"], ensure_ascii=False, default=str)
+    return f"id: {message['id']}\nevent: {message['event']}\ndata: {data}\n\n"
+
+
+def _stream(user_id, token):
+    # 슬롯/구독은 첫 반복에서 잡는다 → 한 번도 반복되지 않은 응답은 아무것도 붙잡지 않는다
+    slots = _wsgi_slots()
+    if not slots.acquire(blocking=False):
+        yield "retry: 60000\n\n"
+        yield _sse({"event": "error", "data": {"detail": "실시간 이벤트 연결 수 초과"}, "id": 0})
+        return
+    subscription = None
+    try:
+        subscription = get_broker().subscribe(user_id)
+        yield f"retry: {settings.EVENTS_RETRY_MS}\n\n"
+        checked_at = time.monotonic()
+        while True:
+            message = subscription.get(timeout=settings.EVENTS_HEARTBEAT)
+            if message is OVERFLOW:
+                yield _sse(message)
+                return
+            # heartbeat 주기마다 토큰 재확인
+            if time.monotonic() - checked_at >= settings.EVENTS_HEARTBEAT:
+                if not _token_valid(token):
+                    yield _sse(EXPIRED)
+                    return
+                checked_at = time.monotonic()
+            # 유휴 상태에서는 주석 한 줄(heartbeat)만 흘려 연결을 유지
+            yield _sse(message) if message else ": ping\n\n"
+    finally:
+        if subscription is not None:
+            subscription.close()
+        slots.release()
+
+
+async def _astream(user_id, token):
+    # ASGI: 연결마다 스레드 대신 이벤트 루프에서 대기 (구독도 루프 안에서 생성)
+    subscription = get_broker().subscribe(user_id, asynchronous=True)
+    try:
+        yield f"retry: {settings.EVENTS_RETRY_MS}\n\n"
+        checked_at = time.monotonic()
+        while True:
+            message = await subscription.aget(timeout=settings.EVENTS_HEARTBEAT)
+            if message is OVERFLOW:
+                yield _sse(message)
+                return
+            if time.monotonic() - checked_at >= settings.EVENTS_HEARTBEAT:
+                if not await sync_to_async(_token_valid)(token):
+                    yield _sse(EXPIRED)
+                    return
+                checked_at = time.monotonic()
+            yield _sse(message) if message else ": ping\n\n"
+    finally:
+        subscription.close()
+
+
+# ──────────────────────────────────────────────
+# GET /api/events/stream   → Server-Sent Events
+#   event: share_request.created / share_request.updated / announcement.created
+#   event: overflow → 클라이언트가 못 따라와 서버가 끊음 (재연결 후 목록 다시 조회)
+#   event: expired  → 토큰 만료/폐기, heartbeat 주기마다 확인 (새 토큰으로 재연결)
+#   운영은 ASGI 전용: WSGI 에서는 EVENTS_WSGI_MAX_STREAMS 개(기본 0, DEBUG 2)를 넘으면 503
+# ──────────────────────────────────────────────
+class EventStreamView(APIView):
+    authentication_classes = [QueryTokenJWTAuthentication]
+    renderer_classes = [FastApiRenderer, EventStreamRenderer]
+
+    def get(self, request):
+        if isinstance(request._request, ASGIRequest):
+            stream = _astream(request.user.pk, request.auth)
+        else:
+            if settings.EVENTS_WSGI_MAX_STREAMS <= 0:
+                response = Response(
+                    {"detail": "실시간 이벤트는 ASGI 서버에서만 제공합니다."},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                )
+                response["Retry-After"] = "60"
+                return response
+            stream = _stream(request.user.pk, request.auth)
+        response = StreamingHttpResponse(stream, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # nginx 버퍼링 해제
+        return response
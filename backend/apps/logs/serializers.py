@@ -1,4 +1,6 @@
 from rest_framework import serializers
+
+from config.projection import Projection
 from .models import AccessLog
 
 
@@ -13,3 +15,6 @@ class AccessLogSerializer(serializers.ModelSerializer):
             "id", "occurredAt", "userName", "assetTitle",
             "action", "ip", "result", "meta_json",
         ]
+
+
+access_log_projection = Projection(AccessLogSerializer)
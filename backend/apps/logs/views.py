@@ -3,8 +3,10 @@ from django.http import HttpResponse
 from rest_framework import generics
 from rest_framework.views import APIView
 
+from config.async_views import AsyncReadMixin
+from config.projection import ProjectionListMixin
 from .models import AccessLog
-from .serializers import AccessLogSerializer
+from .serializers import AccessLogSerializer, access_log_projection
 
 
 class _LogFilterMixin:
@@ -29,9 +31,11 @@ class _LogFilterMixin:
 # ──────────────────────────────────────────────
 # GET /api/logs/
 # ──────────────────────────────────────────────
-class AccessLogListView(_LogFilterMixin, generics.ListAPIView):
+class AccessLogListView(AsyncReadMixin, _LogFilterMixin, ProjectionListMixin, generics.ListAPIView):
     queryset = AccessLog.objects.select_related("user", "asset").all()
     serializer_class = AccessLogSerializer
+    projection = access_log_projection
+    read_replica = True
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -42,6 +46,7 @@ class AccessLogListView(_LogFilterMixin, generics.ListAPIView):
 # GET /api/logs/export  → CSV 다운로드
 # ──────────────────────────────────────────────
 class AccessLogExportView(_LogFilterMixin, APIView):
+    read_replica = True
 
     def get(self, request):
         qs = AccessLog.objects.select_related("user", "asset").all()
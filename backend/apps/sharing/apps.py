@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class SharingConfig(AppConfig):
+    name = "apps.sharing"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,49 @@
+"""
+sharing/counters.py
+상태별 공유요청 건수를 COUNT(*) 없이 증분으로 유지한다.
+
+생성/상태 변경/삭제 시점에 같은 트랜잭션 안에서 `record()` 를 호출한다.
+"""
+from django.db import transaction
+from django.db.models import Count, F
+
+from .models import ShareRequest, ShareRequestCounter
+
+
+def record(**deltas):
+    """record(PENDING=-1, APPROVED=1) 처럼 상태별 증감을 반영."""
+    for status_code, delta in deltas.items():
+        if not delta:
+            continue
+        updated = ShareRequestCounter.objects.filter(status=status_code).update(
+            count=F("count") + delta,
+        )
+        if not updated:
+            # 카운터 행이 없으면 실제 건수로 초기화 (최초 1회)
+            ShareRequestCounter.objects.get_or_create(
+                status=status_code,
+                defaults={"count": ShareRequest.objects.filter(status=status_code).count()},
+            )
+
+
+def summary():
+    """{"PENDING": n, "APPROVED": n, ..., "total": n}"""
+    counts = dict(ShareRequestCounter.objects.values_list("status", "count"))
+    data = {code: counts.get(code, 0) for code in ShareRequest.Status.values}
+    data["total"] = sum(data.values())
+    return data
+
+
+@transaction.atomic
+def rebuild():
+    """카운터를 실제 건수로 재계산 (불일치 복구용)."""
+    actual = dict(
+        ShareRequest.objects.order_by()
+        .values_list("status")
+        .annotate(n=Count("id"))
+    )
+    for code in ShareRequest.Status.values:
+        ShareRequestCounter.objects.update_or_create(
+            status=code, defaults={"count": actual.get(code, 0)},
+        )
+    return summary()
@@ -0,0 +1,16 @@
+"""
+python manage.py rebuild_share_counters
+→ 상태별 공유요청 카운터를 실제 건수로 재계산
+"""
+from django.core.management.base import BaseCommand
+
+from apps.sharing import counters
+
+
+class Command(BaseCommand):
+    help = "공유요청 상태별 카운터 재계산"
+
+    def handle(self, *args, **options):
+        for code, count in counters.rebuild().items():
+            self.stdout.write(f"  {code}: {count}")
+        self.stdout.write(self.style.SUCCESS("\n✅ 카운터 재계산 완료!"))
@@ -0,0 +1,50 @@
+# Generated by Django 5.0.7 on 2026-10-19 14:13
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_counters(apps, schema_editor):
+    ShareRequest = apps.get_model("sharing", "ShareRequest")
+    ShareRequestCounter = apps.get_model("sharing", "ShareRequestCounter")
+    actual = dict(
+        ShareRequest.objects.order_by().values_list("status").annotate(n=Count("id"))
+    )
+    for code in ("PENDING", "APPROVED", "REJECTED", "CANCELLED"):
+        ShareRequestCounter.objects.create(status=code, count=actual.get(code, 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0001_initial'),
+        ('sharing', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShareRequestCounter',
+            fields=[
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('APPROVED', '승인'), ('REJECTED', '반려'), ('CANCELLED', '취소')], max_length=10, primary_key=True, serialize=False, verbose_name='상태')),
+                ('count', models.BigIntegerField(default=0, verbose_name='건수')),
+            ],
+            options={
+                'db_table': 'share_request_counters',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='sharerequest',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['created_at'], name='idx_share_req_pending'),
+        ),
+        migrations.AddIndex(
+            model_name='sharerequest',
+            index=models.Index(fields=['requested_by', '-created_at'], name='idx_share_req_requester'),
+        ),
+        migrations.AddIndex(
+            model_name='sharerequest',
+            index=models.Index(fields=['asset', 'status', '-created_at'], name='idx_share_req_asset'),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -4,7 +4,34 @@ ERD 섹션 4) 공유요청/반출승인
 """
 import uuid
 from django.conf import settings
-from django.db import models
+from django.db import connections, models, router
+from django.utils import timezone
+
+
+class ShareRequestManager(models.Manager):
+    def transition(self, ids, to_status, approver, comment=""):
+        """
+        PENDING 인 요청만 to_status 로 바꾸는 compare-and-set.
+        단일 UPDATE ... WHERE status='PENDING' RETURNING 으로 처리하므로
+        동시에 승인해도 한 쪽만 성공한다. 실제로 변경된 id 목록을 반환.
+        승인은 요청자 본인이 아닌 건만 (본인 요청은 변경되지 않는다).
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        sql = (
+            f"UPDATE {self.model._meta.db_table} "
+            "SET status = %s, approved_by_id = %s, comment = %s, approved_at = %s "
+            "WHERE id = ANY(%s) AND status = %s"
+        )
+        params = [to_status, approver.pk, comment, timezone.now(), ids, self.model.Status.PENDING]
+        if to_status == self.model.Status.APPROVED:
+            sql += " AND requested_by_id <> %s"
+            params.append(approver.pk)
+        db = router.db_for_write(self.model)
+        with connections[db].cursor() as cursor:
+            cursor.execute(sql + " RETURNING id", params)
+            return [row[0] for row in cursor.fetchall()]
 
 
 class ShareRequest(models.Model):
@@ -35,12 +62,40 @@ class ShareRequest(models.Model):
     approved_at = models.DateTimeField("처리 시간", null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ShareRequestManager()
+
     class Meta:
         db_table = "share_requests"
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["status"], name="idx_share_req_status"),
+            # 승인자 수신함: PENDING 만, 오래된 순
+            models.Index(
+                fields=["created_at"], name="idx_share_req_pending",
+                condition=models.Q(status="PENDING"),
+            ),
+            # 내 요청 목록
+            models.Index(fields=["requested_by", "-created_at"], name="idx_share_req_requester"),
+            # 자산별 요청 (상태 필터 포함)
+            models.Index(fields=["asset", "status", "-created_at"], name="idx_share_req_asset"),
         ]
 
     def __str__(self):
         return f"[{self.status}] {self.asset.title} by {self.requested_by.name}"
+
+
+# ──────────────────────────────────────────────
+# 상태별 건수 (대시보드 요약용, 증분 갱신)
+# ──────────────────────────────────────────────
+class ShareRequestCounter(models.Model):
+    status = models.CharField(
+        "상태", max_length=10, primary_key=True,
+        choices=ShareRequest.Status.choices,
+    )
+    count = models.BigIntegerField("건수", default=0)
+
+    class Meta:
+        db_table = "share_request_counters"
+
+    def __str__(self):
+        return f"{self.status}: {self.count}"
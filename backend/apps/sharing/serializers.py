@@ -1,4 +1,6 @@
 from rest_framework import serializers
+
+from config.projection import Projection
 from .models import ShareRequest
 
 
@@ -17,6 +19,9 @@ class ShareRequestListSerializer(serializers.ModelSerializer):
         ]
 
 
+share_request_list_projection = Projection(ShareRequestListSerializer)
+
+
 class ShareRequestCreateSerializer(serializers.Serializer):
     assetId = serializers.UUIDField()
     reason = serializers.CharField()
@@ -24,3 +29,9 @@ class ShareRequestCreateSerializer(serializers.Serializer):
 
 class ShareRequestActionSerializer(serializers.Serializer):
     comment = serializers.CharField(required=False, default="")
+
+
+class ShareRequestBulkActionSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=500)
+    action = serializers.ChoiceField(choices=["approve", "reject"])
+    comment = serializers.CharField(required=False, default="", allow_blank=True)
@@ -0,0 +1,14 @@
+"""
+sharing/signals.py
+자산 삭제 등으로 공유요청이 CASCADE 삭제될 때 상태별 카운터를 맞춘다.
+"""
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from . import counters
+from .models import ShareRequest
+
+
+@receiver(post_delete, sender=ShareRequest)
+def _decrement_counter(sender, instance, **kwargs):
+    counters.record(**{instance.status: -1})
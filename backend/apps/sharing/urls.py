@@ -1,8 +1,22 @@
 from django.urls import path
-from .views import ShareRequestApproveView, ShareRequestListCreateView, ShareRequestRejectView
+from .views import (
+    AssetShareRequestListView,
+    MyShareRequestListView,
+    ShareRequestApproveView,
+    ShareRequestBulkActionView,
+    ShareRequestInboxView,
+    ShareRequestListCreateView,
+    ShareRequestRejectView,
+    ShareRequestSummaryView,
+)
 
 urlpatterns = [
     path("", ShareRequestListCreateView.as_view(), name="share-request-list-create"),
+    path("inbox", ShareRequestInboxView.as_view(), name="share-request-inbox"),
+    path("mine", MyShareRequestListView.as_view(), name="share-request-mine"),
+    path("assets/<uuid:asset_id>", AssetShareRequestListView.as_view(), name="share-request-by-asset"),
+    path("bulk", ShareRequestBulkActionView.as_view(), name="share-request-bulk"),
+    path("summary", ShareRequestSummaryView.as_view(), name="share-request-summary"),
     path("<uuid:pk>/approve", ShareRequestApproveView.as_view(), name="share-request-approve"),
     path("<uuid:pk>/reject", ShareRequestRejectView.as_view(), name="share-request-reject"),
 ]
@@ -1,29 +1,63 @@
-from django.utils import timezone
-from rest_framework import status
+from django.db import transaction
+from rest_framework import generics, status
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.accounts.models import User
+from apps.accounts.permissions import ADMIN_ROLES, IsAdmin
+from apps.assets import grants
 from apps.assets.models import Asset
+from apps.events.broker import publish
+from config.projection import ProjectionListMixin
+from . import counters
 from .models import ShareRequest
 from .serializers import (
     ShareRequestActionSerializer,
+    ShareRequestBulkActionSerializer,
     ShareRequestCreateSerializer,
     ShareRequestListSerializer,
+    share_request_list_projection,
 )
 
 
+# ──────────────────────────────────────────────
+# 공유요청 목록 공통 (커서 페이지네이션)
+#   - OFFSET/COUNT 없이 인덱스 순서대로 다음 페이지를 읽는다.
+# ──────────────────────────────────────────────
+class ShareRequestCursorPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = "pageSize"
+    max_page_size = 100
+    ordering = "-created_at"
+
+
+class OldestFirstCursorPagination(ShareRequestCursorPagination):
+    ordering = "created_at"
+
+
+class _ShareRequestPageView(ProjectionListMixin, generics.ListAPIView):
+    serializer_class = ShareRequestListSerializer
+    projection = share_request_list_projection
+    pagination_class = ShareRequestCursorPagination
+    filter_backends = []
+
+    def base_queryset(self):
+        return ShareRequest.objects.select_related("asset", "requested_by", "approved_by")
+
+
 # ──────────────────────────────────────────────
 # POST /api/share-requests/          → 생성
-# GET  /api/share-requests/?status=  → 목록
+# GET  /api/share-requests/?status=  → 전체 목록 (최신순, 커서 페이지)
 # ──────────────────────────────────────────────
-class ShareRequestListCreateView(APIView):
+class ShareRequestListCreateView(_ShareRequestPageView):
 
-    def get(self, request):
-        qs = ShareRequest.objects.select_related("asset", "requested_by", "approved_by")
-        req_status = request.query_params.get("status")
+    def get_queryset(self):
+        qs = self.base_queryset()
+        req_status = self.request.query_params.get("status")
         if req_status:
             qs = qs.filter(status=req_status.upper())
-        return Response(ShareRequestListSerializer(qs, many=True).data)
+        return qs
 
     def post(self, request):
         serializer = ShareRequestCreateSerializer(data=request.data)
@@ -38,64 +72,163 @@ class ShareRequestListCreateView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        sr = ShareRequest.objects.create(
-            asset=asset,
-            requested_by=request.user,
-            reason=d["reason"],
-        )
-        return Response(
-            ShareRequestListSerializer(sr).data,
-            status=status.HTTP_201_CREATED,
-        )
+        with transaction.atomic():
+            sr = ShareRequest.objects.create(
+                asset=asset,
+                requested_by=request.user,
+                reason=d["reason"],
+            )
+            counters.record(PENDING=1)
+
+        data = ShareRequestListSerializer(sr).data
+        transaction.on_commit(lambda: publish("share_request.created", data, _approver_ids()))
+        return Response(data, status=status.HTTP_201_CREATED)
 
 
 # ──────────────────────────────────────────────
-# POST /api/share-requests/{id}/approve
+# 승인/반려 공통: PENDING → APPROVED/REJECTED (compare-and-set)
 # ──────────────────────────────────────────────
-class ShareRequestApproveView(APIView):
+def _transition(ids, to_status, approver, comment):
+    with transaction.atomic():
+        updated = ShareRequest.objects.transition(ids, to_status, approver, comment)
+        counters.record(**{ShareRequest.Status.PENDING: -len(updated), to_status: len(updated)})
+    return updated
+
+
+def _approver_ids():
+    return list(
+        User.objects.filter(
+            status=User.Status.ACTIVE,
+            roles__code__in=ADMIN_ROLES,
+        ).values_list("pk", flat=True).distinct()
+    )
+
+
+def _action_data(rows):
+    """
+    승인된 건에는 요청자용 다운로드 grant 를 함께 내려준다.
+    처리 결과는 요청자에게 실시간 이벤트로도 전달.
+    """
+    data = ShareRequestListSerializer(rows, many=True).data
+    for sr, item in zip(rows, data):
+        item["grant"] = None
+        if sr.status == ShareRequest.Status.APPROVED and sr.asset.latest_version_id:
+            item["grant"] = grants.issue(sr.asset, sr.requested_by, grants.SCOPE_DOWNLOAD)
+        transaction.on_commit(
+            lambda item=item, uid=sr.requested_by_id: publish("share_request.updated", item, [uid])
+        )
+    return data
 
-    def post(self, request, pk):
-        try:
-            sr = ShareRequest.objects.get(pk=pk)
-        except ShareRequest.DoesNotExist:
-            return Response({"detail": "요청을 찾을 수 없습니다."}, status=404)
 
-        if sr.status != ShareRequest.Status.PENDING:
-            return Response({"detail": "이미 처리된 요청입니다."}, status=400)
+_ACTION_RELATED = ("asset__latest_version", "requested_by", "approved_by")
 
+
+class _ShareRequestActionView(APIView):
+    permission_classes = [IsAdmin]
+    target_status = None
+
+    def post(self, request, pk):
         serializer = ShareRequestActionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        sr.status = ShareRequest.Status.APPROVED
-        sr.approved_by = request.user
-        sr.comment = serializer.validated_data.get("comment", "")
-        sr.approved_at = timezone.now()
-        sr.save()
+        updated = _transition(
+            [pk], self.target_status, request.user,
+            serializer.validated_data.get("comment", ""),
+        )
+        if not updated:
+            current = ShareRequest.objects.filter(pk=pk).values("status", "requested_by_id").first()
+            if current is None:
+                return Response({"detail": "요청을 찾을 수 없습니다."}, status=404)
+            if current["status"] == ShareRequest.Status.PENDING:
+                return Response({"detail": "본인 요청은 승인할 수 없습니다."}, status=403)
+            return Response({"detail": "이미 처리된 요청입니다."}, status=400)
 
-        return Response(ShareRequestListSerializer(sr).data)
+        rows = list(ShareRequest.objects.select_related(*_ACTION_RELATED).filter(pk=pk))
+        return Response(_action_data(rows)[0])
+
+
+# POST /api/share-requests/{id}/approve
+class ShareRequestApproveView(_ShareRequestActionView):
+    target_status = ShareRequest.Status.APPROVED
 
 
-# ──────────────────────────────────────────────
 # POST /api/share-requests/{id}/reject
-# ──────────────────────────────────────────────
-class ShareRequestRejectView(APIView):
+class ShareRequestRejectView(_ShareRequestActionView):
+    target_status = ShareRequest.Status.REJECTED
 
-    def post(self, request, pk):
-        try:
-            sr = ShareRequest.objects.get(pk=pk)
-        except ShareRequest.DoesNotExist:
-            return Response({"detail": "요청을 찾을 수 없습니다."}, status=404)
 
-        if sr.status != ShareRequest.Status.PENDING:
-            return Response({"detail": "이미 처리된 요청입니다."}, status=400)
+# ──────────────────────────────────────────────
+# POST /api/share-requests/bulk
+#   {"ids": [...], "action": "approve" | "reject", "comment": ""}
+# ──────────────────────────────────────────────
+class ShareRequestBulkActionView(APIView):
+    permission_classes = [IsAdmin]
+    ACTION_STATUS = {
+        "approve": ShareRequest.Status.APPROVED,
+        "reject": ShareRequest.Status.REJECTED,
+    }
 
-        serializer = ShareRequestActionSerializer(data=request.data)
+    def post(self, request):
+        serializer = ShareRequestBulkActionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        d = serializer.validated_data
+
+        ids = list(dict.fromkeys(d["ids"]))
+        updated = set(_transition(ids, self.ACTION_STATUS[d["action"]], request.user, d["comment"]))
+
+        # 변경되지 않은 id → 본인 요청(승인 불가) / 이미 처리됨 / 존재하지 않음 구분
+        rest = [i for i in ids if i not in updated]
+        existing = dict(
+            ShareRequest.objects.filter(pk__in=rest).values_list("pk", "status")
+        ) if rest else {}
+        pending = ShareRequest.Status.PENDING
+
+        rows = list(ShareRequest.objects.select_related(*_ACTION_RELATED).filter(pk__in=updated))
+        return Response({
+            "updated": _action_data(rows),
+            "ownRequests": [i for i in rest if existing.get(i) == pending],
+            "alreadyHandled": [i for i in rest if i in existing and existing[i] != pending],
+            "notFound": [i for i in rest if i not in existing],
+        })
+
+
+# GET /api/share-requests/inbox   → 승인 대기 (오래된 순)
+class ShareRequestInboxView(_ShareRequestPageView):
+    permission_classes = [IsAdmin]
+    pagination_class = OldestFirstCursorPagination
+
+    def get_queryset(self):
+        # idx_share_req_pending (partial index) 사용
+        return self.base_queryset().filter(status=ShareRequest.Status.PENDING)
 
-        sr.status = ShareRequest.Status.REJECTED
-        sr.approved_by = request.user
-        sr.comment = serializer.validated_data.get("comment", "")
-        sr.approved_at = timezone.now()
-        sr.save()
 
-        return Response(ShareRequestListSerializer(sr).data)
+# GET /api/share-requests/mine?status=   → 내가 요청한 건
+class MyShareRequestListView(_ShareRequestPageView):
+
+    def get_queryset(self):
+        qs = self.base_queryset().filter(requested_by_id=self.request.user.pk)
+        req_status = self.request.query_params.get("status")
+        if req_status:
+            qs = qs.filter(status=req_status.upper())
+        return qs
+
+
+# GET /api/share-requests/assets/{assetId}?status=   → 자산별
+class AssetShareRequestListView(_ShareRequestPageView):
+    permission_classes = [IsAdmin]
+
+    def get_queryset(self):
+        qs = self.base_queryset().filter(asset_id=self.kwargs["asset_id"])
+        req_status = self.request.query_params.get("status")
+        if req_status:
+            qs = qs.filter(status=req_status.upper())
+        return qs
+
+
+# ──────────────────────────────────────────────
+# GET /api/share-requests/summary   → 상태별 건수
+# ──────────────────────────────────────────────
+class ShareRequestSummaryView(APIView):
+
+    def get(self, request):
+        return Response(counters.summary())
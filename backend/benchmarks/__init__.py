@@ -0,0 +1,13 @@
+"""
+성능 측정 스크립트 모음.  backend/ 에서 실행:
+
+    python -m benchmarks.renderers
+"""
+import os
+
+
+def setup_django():
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
@@ -0,0 +1,109 @@
+"""
+DB 연결 방식별 작은 요청 지연 비교 (PostgreSQL 필요).
+
+    python -m benchmarks.connections [--requests 500] [--clients 8]
+
+방식마다 settings.py 의 연결 설정을 환경 변수로 바꾼 하위 프로세스에서 Django ORM 으로 측정한다.
+  - new        : 요청마다 새 연결 (DB_POOL=False, DB_CONN_MAX_AGE=0)
+  - persistent : 스레드별 지속 연결 + 재사용 전 상태 확인 (DB_POOL=False, DB_CONN_MAX_AGE=60)
+  - pool       : Django 5.1 의 psycopg 커넥션 풀 (DB_POOL=True, 최소/최대 = --clients)
+
+요청 하나 = request_started → ORM 쿼리 1개(/api/auth/me 수준) → request_finished
+(연결 반납/종료는 핸들러와 같이 close_old_connections 신호 수신자가 처리)
+의 p50/p95/p99 지연과 처리량을 출력한다.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import setup_django
+
+MODES = {
+    "new": {"DB_POOL": "False", "DB_CONN_MAX_AGE": "0"},
+    "persistent": {"DB_POOL": "False", "DB_CONN_MAX_AGE": "60"},
+    "pool": {"DB_POOL": "True"},
+}
+
+
+def run(requests, clients):
+    """현재 프로세스의 설정으로 측정 (하위 프로세스에서 실행)"""
+    from django.core.signals import request_finished, request_started
+    from django.db import connections
+
+    from apps.accounts.models import User
+
+    def one_request(_):
+        t0 = time.perf_counter()
+        request_started.send(sender=None)
+        try:
+            list(User.objects.order_by("-created_at").values("id", "name", "email")[:1])
+        finally:
+            request_finished.send(sender=None)
+        return time.perf_counter() - t0
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        samples = sorted(executor.map(one_request, range(requests)))
+    elapsed = time.perf_counter() - started
+    connections.close_all()
+
+    def pct(p):
+        return samples[min(int(len(samples) * p), len(samples) - 1)] * 1000
+
+    return {
+        "p50": statistics.median(samples) * 1000, "p95": pct(0.95), "p99": pct(0.99),
+        "rps": requests / elapsed,
+    }
+
+
+def measure(mode, requests, clients):
+    env = {
+        **os.environ, **MODES[mode],
+        "DB_POOL_MIN_SIZE": str(clients), "DB_POOL_MAX_SIZE": str(clients),
+    }
+    cmd = [
+        sys.executable, "-m", "benchmarks.connections", "--child", mode,
+        "--requests", str(requests), "--clients", str(clients),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        raise SystemExit(f"{mode} 측정 실패:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    setup_django()
+    if args.child:
+        from django.conf import settings
+
+        if (args.child == "pool") != settings.DB_POOL:
+            raise SystemExit("DB_POOL 설정이 적용되지 않았습니다 (psycopg[pool] 필요)")
+        print(json.dumps(run(args.requests, args.clients)))
+        return
+
+    modes = ["new", "persistent"]
+    if importlib.util.find_spec("psycopg_pool"):
+        modes.append("pool")
+    else:
+        print("psycopg_pool 미설치 → pool 측정 생략 (pip install 'psycopg[pool]')")
+
+    print(f"{'mode':<12}{'p50(ms)':>9}{'p95(ms)':>9}{'p99(ms)':>9}{'req/s':>9}")
+    for mode in modes:
+        r = measure(mode, args.requests, args.clients)
+        print(f"{mode:<12}{r['p50']:>9.2f}{r['p95']:>9.2f}{r['p99']:>9.2f}{r['rps']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
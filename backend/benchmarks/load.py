@@ -0,0 +1,324 @@
+"""
+HTTP 부하 테스트 — 실행 중인 서버의 엔드포인트를 동시 클라이언트로 호출.
+
+    python manage.py seed_bench --scale 0.01            # 데이터 준비
+    QUERY_COUNT_HEADERS=True python manage.py runserver  # 또는 uvicorn/gunicorn
+    python -m benchmarks.load [--base-url http://127.0.0.1:8000] [--clients 16] [--requests 500]
+                              [--only assets] [--compare benchmarks/results/load-이전.json]
+
+엔드포인트별 p50/p95/p99 지연, 처리량(req/s), 요청당 쿼리 수/시간(X-Query-Count, X-Query-Time-Ms 헤더)을
+출력하고 benchmarks/results/load-<커밋>-<시각>.json 으로 저장한다 (--compare 로 커밋 간 비교).
+config/urls.py 의 URL 중 시나리오도 SKIPPED 도 아닌 것이 있으면 경고한다.
+"""
+import argparse
+import http.client
+import json
+import statistics
+import subprocess
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from . import setup_django
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+REFRESH = object()  # 본문 자리표시: 가상 사용자별 refresh 토큰 체인 (RefreshChain)
+
+# (url name, 이름, 메서드, 경로, 본문) — {asset}/{grant}/{today} 등은 prepare() 에서 채운다
+SCENARIOS = [
+    ("auth-login", "login", "POST", "/api/auth/login", {"email": "{email}", "password": "{password}"}),
+    ("token-refresh", "token refresh", "POST", "/api/auth/token/refresh", REFRESH),
+    ("auth-me", "me", "GET", "/api/auth/me", None),
+    ("user-list-create", "users", "GET", "/api/users/", None),
+    ("asset-list-create", "assets", "GET", "/api/assets/", None),
+    ("asset-list-create", "assets ?type", "GET", "/api/assets/?type=VIDEO&page=5", None),
+    ("asset-list-create", "assets ?q", "GET", "/api/assets/?q=%EB%B2%A4%EC%B9%98%20%EC%9E%90%EC%82%B0%2012", None),
+    ("asset-list-create", "assets ?tag", "GET", "/api/assets/?tag=bench-00042", None),
+    ("asset-list-create", "assets ?fields", "GET", "/api/assets/?fields=id,title,updatedAt", None),
+    ("asset-detail", "asset", "GET", "/api/assets/{asset}", None),
+    ("asset-detail", "asset ?include", "GET",
+     "/api/assets/{asset}?include=versions,permissions,shareRequests,stats", None),
+    ("asset-versions", "versions", "GET", "/api/assets/{asset}/versions", None),
+    ("asset-permissions", "permissions", "GET", "/api/assets/{asset}/permissions", None),
+    ("asset-grants", "grant issue", "POST", "/api/assets/{asset}/grants", {"scope": "view"}),
+    ("asset-view", "grant redirect", "GET", "/api/assets/{asset}/view?grant={grant}", None),
+    ("share-request-list-create", "share requests", "GET", "/api/share-requests/", None),
+    ("share-request-inbox", "inbox", "GET", "/api/share-requests/inbox", None),
+    ("share-request-mine", "mine", "GET", "/api/share-requests/mine", None),
+    ("share-request-by-asset", "by asset", "GET", "/api/share-requests/assets/{asset}", None),
+    ("share-request-summary", "share summary", "GET", "/api/share-requests/summary", None),
+    ("log-list", "logs", "GET", "/api/logs/", None),
+    ("log-list", "logs ?action", "GET", "/api/logs/?action=DOWNLOAD&from={today}", None),
+    ("log-export", "logs export", "GET", "/api/logs/export?from={today}", None),
+    ("announcement-latest", "announcement", "GET", "/api/announcements/latest", None),
+    ("dashboard-summary", "dashboard", "GET", "/api/dashboard/summary", None),
+    ("batch", "batch", "POST", "/api/batch", {"parallel": True, "requests": [
+        {"id": "me", "path": "/api/auth/me"},
+        {"id": "ann", "path": "/api/announcements/latest"},
+        {"id": "assets", "path": "/api/assets/?fields=id,title"},
+        {"id": "summary", "path": "/api/share-requests/summary"},
+    ]}),
+    ("schema", "openapi schema", "GET", "/api/schema/", None),
+]
+
+# 반복 호출하면 데이터가 바뀌거나 측정 의미가 없는 URL
+SKIPPED = {
+    "auth-logout": "토큰 폐기",
+    "user-bulk-import": "사용자 생성",
+    "announcement-create": "공지 생성",
+    "user-update": "쓰기",
+    "asset-grant-revoke": "grant 폐기",
+    "asset-download": "asset-view 와 같은 경로",
+    "share-request-bulk": "상태 변경",
+    "share-request-approve": "상태 변경",
+    "share-request-reject": "상태 변경",
+    "event-stream": "장기 연결 (SSE)",
+    "swagger": "정적 HTML",
+    "metrics": "모니터링 scrape",
+    "profile-list": "관리 도구",
+    "profile-detail": "관리 도구",
+    "profile-download": "관리 도구",
+}
+
+
+# ──────────────────────────────────────────────
+# HTTP
+# ──────────────────────────────────────────────
+class Client:
+    """스레드별 keep-alive 연결"""
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        self.https = parts.scheme == "https"
+        self.netloc = parts.netloc
+        self.token = None
+        self._local = threading.local()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            conn = self._local.conn = cls(self.netloc, timeout=60)
+        return conn
+
+    def request(self, method, path, body=None):
+        headers = {"Accept": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        for attempt in range(2):
+            conn = self._conn()
+            try:
+                conn.request(method, path, payload, headers)
+                response = conn.getresponse()
+                content = response.read()
+                return response, content
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise
+
+    def json(self, method, path, body=None):
+        response, content = self.request(method, path, body)
+        if response.status >= 400:
+            raise SystemExit(f"{method} {path} → {response.status}: {content[:200]!r}")
+        return json.loads(content)["data"]
+
+
+class RefreshChain:
+    """
+    refresh 토큰 회전(ROTATE_REFRESH_TOKENS): 갱신하면 이전 토큰은 폐기되므로
+    가상 사용자(스레드)마다 로그인 한 번 → 이후에는 직전 응답의 refresh 를 다음 요청에 쓴다.
+    로그인은 측정 시간에 넣지 않는다 (본문을 만든 뒤 타이머 시작).
+    """
+
+    def __init__(self, client, email, password):
+        self.client = client
+        self.credentials = {"email": email, "password": password}
+        self._local = threading.local()
+
+    def __call__(self):
+        token = getattr(self._local, "refresh", None)
+        if token is None:
+            token = self.client.json("POST", "/api/auth/login", self.credentials)["refreshToken"]
+        return {"refresh": token}
+
+    def update(self, response, content):
+        # 실패하면 다음 요청에서 다시 로그인
+        self._local.refresh = json.loads(content)["data"]["refresh"] if response.status < 400 else None
+
+
+def prepare(client, email, password):
+    """로그인 + 경로에 넣을 id/토큰 수집"""
+    login = client.json("POST", "/api/auth/login", {"email": email, "password": password})
+    client.token = login["accessToken"]
+    assets = client.json("GET", "/api/assets/?fields=id")["results"]
+    if not assets:
+        raise SystemExit("게시된 자산이 없습니다. python manage.py seed_bench 를 먼저 실행하세요.")
+    asset = assets[0]["id"]
+    grant = client.json("POST", f"/api/assets/{asset}/grants", {"scope": "view"})["grant"]
+    return {
+        "email": email, "password": password, "refresh": RefreshChain(client, email, password),
+        "asset": asset, "grant": grant, "today": date.today().isoformat(),
+    }
+
+
+def _fill(value, params):
+    if value is REFRESH:
+        return params["refresh"]
+    if isinstance(value, str):
+        return value.format(**params)
+    if isinstance(value, dict):
+        return {k: _fill(v, params) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, params) for v in value]
+    return value
+
+
+# ──────────────────────────────────────────────
+# 측정
+# ──────────────────────────────────────────────
+def run(client, executor, method, path, body, requests, warmup):
+    def one(_):
+        payload = body() if callable(body) else body
+        t0 = time.perf_counter()
+        response, content = client.request(method, path, payload)
+        elapsed = time.perf_counter() - t0
+        if callable(body):
+            body.update(response, content)
+        return (
+            elapsed, response.status,
+            response.getheader("X-Query-Count"), response.getheader("X-Query-Time-Ms"),
+        )
+
+    list(executor.map(one, range(warmup)))
+    started = time.perf_counter()
+    samples = list(executor.map(one, range(requests)))
+    wall = time.perf_counter() - started
+
+    latencies = sorted(s[0] * 1000 for s in samples)
+    queries = [int(s[2]) for s in samples if s[2] is not None]
+    query_ms = [float(s[3]) for s in samples if s[3] is not None]
+
+    def pct(p):
+        return latencies[min(int(len(latencies) * p), len(latencies) - 1)]
+
+    return {
+        "method": method,
+        "path": path,
+        "requests": requests,
+        "status": dict(Counter(str(s[1]) for s in samples)),
+        "errors": sum(1 for s in samples if s[1] >= 400),
+        "p50": statistics.median(latencies),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+        "mean": statistics.fmean(latencies),
+        "rps": requests / wall,
+        "queries": statistics.fmean(queries) if queries else None,
+        "queryMs": statistics.fmean(query_ms) if query_ms else None,
+    }
+
+
+def uncovered_urls():
+    """config/urls.py 에서 시나리오/SKIPPED 어느 쪽에도 없는 URL 이름"""
+    setup_django()
+    from django.urls import URLPattern, URLResolver, get_resolver
+
+    names = set()
+
+    def walk(patterns):
+        for p in patterns:
+            if isinstance(p, URLResolver):
+                if p.namespace != "admin":
+                    walk(p.url_patterns)
+            elif isinstance(p, URLPattern):
+                names.add(p.name or p.lookup_str)
+
+    walk(get_resolver().url_patterns)
+    return sorted(names - {s[0] for s in SCENARIOS} - set(SKIPPED))
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _fmt(value, spec):
+    return "-" if value is None else format(value, spec)
+
+
+def print_table(results, previous=None):
+    header = f"{'scenario':<18}{'p50':>8}{'p95':>8}{'p99':>8}{'req/s':>8}{'queries':>9}{'q ms':>7}{'err':>5}"
+    if previous:
+        header += f"{'Δp95':>9}{'Δreq/s':>9}"
+    print(header)
+    for name, r in results.items():
+        line = (
+            f"{name:<18}{r['p50']:>8.1f}{r['p95']:>8.1f}{r['p99']:>8.1f}{r['rps']:>8.0f}"
+            f"{_fmt(r['queries'], '.1f'):>9}{_fmt(r['queryMs'], '.1f'):>7}{r['errors']:>5}"
+        )
+        old = (previous or {}).get(name)
+        if old:
+            line += f"{(r['p95'] / old['p95'] - 1) * 100:>+8.0f}%{(r['rps'] / old['rps'] - 1) * 100:>+8.0f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", default="admin@company.com")
+    parser.add_argument("--password", default="admin1234")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="시나리오당 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--only", nargs="+", default=None, help="시나리오 이름에 이 문자열이 들어간 것만")
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None, help="이전 결과 JSON")
+    args = parser.parse_args()
+
+    for name in uncovered_urls():
+        print(f"경고: 부하 시나리오가 없는 URL — {name}")
+
+    client = Client(args.base_url)
+    params = prepare(client, args.email, args.password)
+    results = {}
+    with ThreadPoolExecutor(max_workers=args.clients) as executor:
+        for _, name, method, path, body in SCENARIOS:
+            if args.only and not any(o in name for o in args.only):
+                continue
+            results[name] = run(
+                client, executor, method, _fill(path, params), _fill(body, params),
+                args.requests, args.warmup,
+            )
+            print(f"  {name}: p95 {results[name]['p95']:.1f}ms", flush=True)
+
+    previous = json.loads(args.compare.read_text())["results"] if args.compare else None
+    print_table(results, previous)
+
+    commit = git_commit()
+    output = args.output or RESULTS_DIR / f"load-{commit}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "meta": {
+            "commit": commit, "createdAt": datetime.now().isoformat(timespec="seconds"),
+            "baseUrl": args.base_url, "clients": args.clients, "requests": args.requests,
+        },
+        "results": results,
+    }, ensure_ascii=False, indent=2))
+    print(f"저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
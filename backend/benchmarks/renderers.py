@@ -0,0 +1,98 @@
+"""
+ApiRenderer(표준 json) vs FastApiRenderer(orjson) 렌더링 시간 비교.
+
+    python -m benchmarks.renderers [--rows 1000 10000] [--repeat 20]
+
+자산/로그 목록 응답과 같은 모양의 페이로드를 만들어 측정한다 (DB 불필요).
+  - serialized : Serializer 를 거친 값 (문자열화된 UUID/일시)
+  - native     : UUID/datetime/Decimal 객체 그대로
+두 렌더러의 출력 바이트가 같은지도 함께 검사한다.
+"""
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from . import setup_django
+
+
+def asset_rows(n, native=False):
+    base = datetime(2026, 1, 1, 9, 0, tzinfo=timezone(timedelta(hours=9)))
+    rows = []
+    for i in range(n):
+        updated = base + timedelta(minutes=i)
+        rows.append({
+            "id": uuid.uuid4() if native else str(uuid.uuid4()),
+            "type": ("VIDEO", "DOCUMENT", "LINK")[i % 3],
+            "category": "제안서" if i % 4 else None,
+            "title": f"영업 제안서 {i} — 2026 상반기",
+            "publishStatus": "PUBLISHED",
+            "viewScope": "ALL_USERS",
+            "downloadAllowed": bool(i % 2),
+            "updatedAt": updated if native else updated.isoformat(),
+        })
+    return rows
+
+
+def log_rows(n, native=False):
+    base = datetime(2026, 1, 1, 9, 0, tzinfo=timezone(timedelta(hours=9)))
+    rows = []
+    for i in range(n):
+        occurred = base + timedelta(seconds=i)
+        rows.append({
+            "id": uuid.uuid4() if native else str(uuid.uuid4()),
+            "occurredAt": occurred if native else occurred.isoformat(),
+            "userName": f"사용자{i % 50}",
+            "assetTitle": f"자산 {i % 200}",
+            "action": ("VIEW", "DOWNLOAD", "PLAY")[i % 3],
+            "ip": f"10.0.{i % 255}.{i % 7}",
+            "result": "SUCCESS",
+            "meta_json": {"durationMs": Decimal("12.5") if native else 12.5, "page": i % 10},
+        })
+    return rows
+
+
+def paginated(rows):
+    return {"count": len(rows), "next": None, "previous": None, "results": rows}
+
+
+def measure(renderer, payload, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        renderer.render(payload)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    from config.renderers import ApiRenderer, FastApiRenderer, orjson
+
+    if orjson is None:
+        print("orjson 이 설치되어 있지 않아 FastApiRenderer 가 표준 json 으로 동작합니다.")
+
+    std, fast = ApiRenderer(), FastApiRenderer()
+    print(f"{'payload':<22}{'rows':>7}{'json(ms)':>11}{'orjson(ms)':>12}{'speedup':>9}  same")
+    for name, factory in (("assets", asset_rows), ("logs", log_rows)):
+        for n in args.rows:
+            for variant in ("serialized", "native"):
+                payload = paginated(factory(n, native=variant == "native"))
+                t_std = measure(std, payload, args.repeat)
+                t_fast = measure(fast, payload, args.repeat)
+                same = "yes" if std.render(payload) == fast.render(payload) else "no"
+                print(
+                    f"{name + '/' + variant:<22}{n:>7}{t_std * 1000:>11.2f}"
+                    f"{t_fast * 1000:>12.2f}{t_std / t_fast:>8.1f}x  {same}"
+                )
+
+
+if __name__ == "__main__":
+    main()
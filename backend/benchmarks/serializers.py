@@ -0,0 +1,180 @@
+"""
+ModelSerializer vs Projection(values() + row mapper) 목록 직렬화 비교.
+
+    python -m benchmarks.serializers [--rows 1000 10000] [--repeat 5]
+
+DB 없이 드라이버가 돌려주는 것과 같은 행 튜플을 만들어 두고
+  - serializer : Model.from_db (+ select_related 객체) → Serializer(many=True).data
+  - projection : values() 가 만드는 dict 행 → Projection.map
+의 행당 CPU 시간과 최대 메모리(tracemalloc)를 잰다.
+두 경로의 렌더링 결과 바이트가 같은지도 검사한다.
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from . import setup_django
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _attach(instance, field_name, related):
+    instance._meta.get_field(field_name).set_cached_value(instance, related)
+
+
+# ──────────────────────────────────────────────
+# 시나리오: (values 컬럼 튜플 생성, ORM 인스턴스 생성)
+# ──────────────────────────────────────────────
+def asset_case(n):
+    from apps.assets.models import Asset, Category
+    from apps.assets.serializers import AssetListSerializer, asset_list_projection
+
+    categories = [(uuid.uuid4(), f"카테고리{i}") for i in range(10)]
+    raw = []
+    for i in range(n):
+        cat = categories[i % 10] if i % 4 else None
+        raw.append({
+            "id": uuid.uuid4(), "type": "DOCUMENT", "category_id": cat and cat[0],
+            "category__name": cat and cat[1], "title": f"영업 제안서 {i}",
+            "description": "설명 " * 20, "publish_status": "PUBLISHED", "view_scope": "ALL_USERS",
+            "download_allowed": bool(i % 2), "security_label": "L2", "owner_id": uuid.uuid4(),
+            "latest_version_id": uuid.uuid4(), "created_at": BASE, "updated_at": BASE + timedelta(minutes=i),
+        })
+
+    asset_fields = [f.attname for f in Asset._meta.concrete_fields]
+
+    def objects():
+        out = []
+        for r in raw:
+            obj = Asset.from_db("default", asset_fields, [r[f] for f in asset_fields])
+            cat = Category.from_db("default", ["id", "name", "parent_id", "sort_order", "is_active"],
+                                   [r["category_id"], r["category__name"], None, 0, True]) if r["category_id"] else None
+            _attach(obj, "category", cat)
+            out.append(obj)
+        return out
+
+    return AssetListSerializer, asset_list_projection, raw, objects
+
+
+def log_case(n):
+    from apps.accounts.models import User
+    from apps.assets.models import Asset
+    from apps.logs.models import AccessLog
+    from apps.logs.serializers import AccessLogSerializer, access_log_projection
+
+    raw = []
+    for i in range(n):
+        raw.append({
+            "id": uuid.uuid4(), "occurred_at": BASE + timedelta(seconds=i),
+            "user_id": uuid.uuid4(), "user__name": f"사용자{i % 50}",
+            "asset_id": uuid.uuid4(), "asset__title": f"자산 {i % 200}",
+            "action": "VIEW", "ip": f"10.0.{i % 255}.1", "user_agent": "Mozilla/5.0",
+            "result": "SUCCESS", "meta_json": {"page": i % 10},
+        })
+
+    log_fields = [f.attname for f in AccessLog._meta.concrete_fields]
+
+    def objects():
+        out = []
+        for r in raw:
+            obj = AccessLog.from_db("default", log_fields, [r[f] for f in log_fields])
+            _attach(obj, "user", User.from_db("default", ["id", "name"], [r["user_id"], r["user__name"]]))
+            _attach(obj, "asset", Asset.from_db("default", ["id", "title"], [r["asset_id"], r["asset__title"]]))
+            out.append(obj)
+        return out
+
+    return AccessLogSerializer, access_log_projection, raw, objects
+
+
+def share_request_case(n):
+    from apps.accounts.models import User
+    from apps.assets.models import Asset
+    from apps.sharing.models import ShareRequest
+    from apps.sharing.serializers import ShareRequestListSerializer, share_request_list_projection
+
+    raw = []
+    for i in range(n):
+        approved = i % 3 == 0
+        raw.append({
+            "id": uuid.uuid4(), "asset_id": uuid.uuid4(), "asset__title": f"자산 {i % 200}",
+            "requested_by_id": uuid.uuid4(), "requested_by__name": f"사용자{i % 50}",
+            "reason": "고객사 미팅 자료", "status": "APPROVED" if approved else "PENDING",
+            "approved_by_id": uuid.uuid4() if approved else None,
+            "approved_by__name": "관리자" if approved else None,
+            "comment": "", "approved_at": BASE if approved else None,
+            "created_at": BASE + timedelta(seconds=i),
+        })
+
+    sr_fields = [f.attname for f in ShareRequest._meta.concrete_fields]
+
+    def objects():
+        out = []
+        for r in raw:
+            obj = ShareRequest.from_db("default", sr_fields, [r[f] for f in sr_fields])
+            _attach(obj, "asset", Asset.from_db("default", ["id", "title"], [r["asset_id"], r["asset__title"]]))
+            _attach(obj, "requested_by", User.from_db(
+                "default", ["id", "name"], [r["requested_by_id"], r["requested_by__name"]]))
+            _attach(obj, "approved_by", User.from_db(
+                "default", ["id", "name"], [r["approved_by_id"], r["approved_by__name"]],
+            ) if r["approved_by_id"] else None)
+            out.append(obj)
+        return out
+
+    return ShareRequestListSerializer, share_request_list_projection, raw, objects
+
+
+# ──────────────────────────────────────────────
+# 측정
+# ──────────────────────────────────────────────
+def measure(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(samples), peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from config.renderers import FastApiRenderer
+
+    renderer = FastApiRenderer()
+    print(f"{'case':<16}{'rows':>7}{'serializer µs/row':>19}{'projection µs/row':>19}"
+          f"{'cpu':>7}{'serializer KiB':>16}{'projection KiB':>16}  same")
+    for name, case in (("assets", asset_case), ("logs", log_case), ("shareRequests", share_request_case)):
+        for n in args.rows:
+            serializer_class, projection, raw, objects = case(n)
+            columns = [column for _, column, _ in projection.entries]
+            db_rows = [tuple(r[c] for c in columns) for r in raw]
+
+            def via_serializer():
+                return serializer_class(objects(), many=True).data
+
+            def via_projection():
+                # ValuesIterable 과 같은 방식으로 dict 행 생성 후 매핑
+                return projection.map([dict(zip(columns, row)) for row in db_rows])
+
+            same = renderer.render(via_serializer()) == renderer.render(via_projection())
+            t_ser, m_ser = measure(via_serializer, args.repeat)
+            t_proj, m_proj = measure(via_projection, args.repeat)
+            print(
+                f"{name:<16}{n:>7}{t_ser / n * 1e6:>19.2f}{t_proj / n * 1e6:>19.2f}"
+                f"{t_ser / t_proj:>6.1f}x{m_ser / 1024:>16.0f}{m_proj / 1024:>16.0f}  {'yes' if same else 'NO'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+ASGI 배포용 async 읽기 경로.
+
+DRF 3.15 의 APIView 는 async 핸들러를 지원하지 않으므로 GET/HEAD 만 직접 디스패치한다.
+  - 인증/권한/스로틀(initial) → 기존 sync 코드를 sync_to_async 로 (JWT 사용자 조회 포함)
+  - 조회 → aget() 핸들러 안에서 async ORM (acount / async for / aget)
+  - 예외 처리, 렌더러 결정(finalize_response) → DRF 그대로
+  - 그 외 메서드(POST/PATCH/...)는 기존 sync dispatch 를 스레드에서 실행
+
+ASYNC_VIEWS=False(기본, WSGI) 이면 as_view() 는 기존 sync 뷰를 그대로 돌려준다.
+WSGI 에서 async 뷰는 요청마다 이벤트 루프를 새로 만들어 오히려 느리다.
+
+프로젝트 미들웨어는 HybridMiddleware 로 sync/async 양쪽을 지원한다
+(sync 전용 미들웨어가 체인에 하나라도 있으면 Django 가 요청마다 스레드로 전환해 async 경로가 무의미해진다).
+"""
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.utils.decorators import classonlymethod
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+class HybridMiddleware:
+    """
+    sync/async 겸용 미들웨어 (django.utils.deprecation.MiddlewareMixin 과 같은 방식).
+    하위 클래스는 handle(request) 와 ahandle(request) 를 구현한다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.ahandle(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        raise NotImplementedError
+
+    async def ahandle(self, request):
+        raise NotImplementedError
+
+
+class _Window:
+    """async 로 미리 읽은 한 페이지 + 전체 건수 → Django Paginator 가 쓰는 모양."""
+
+    def __init__(self, count, offset=0, rows=()):
+        self._count = count
+        self._offset = offset
+        self._rows = list(rows)
+
+    def count(self):
+        return self._count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, key):
+        return self._rows[key.start - self._offset:key.stop - self._offset]
+
+
+class AsyncReadMixin:
+    """
+    APIView 믹스인: aget() 을 정의하면 ASGI 에서 GET/HEAD 를 async 로 처리한다.
+    aget() 이 없는 뷰에 붙이면 아무 효과 없음.
+    """
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        if not settings.ASYNC_VIEWS or not hasattr(cls, "aget"):
+            return view
+        sync_view = sync_to_async(view)
+
+        async def async_view(request, *args, **kwargs):
+            if request.method not in SAFE_METHODS:
+                return await sync_view(request, *args, **kwargs)
+            self = cls(**initkwargs)
+            self.setup(request, *args, **kwargs)
+            return await self.adispatch(request, *args, **kwargs)
+
+        markcoroutinefunction(async_view)
+        # ReplicaRoutingMiddleware / 스키마 생성이 보는 속성
+        async_view.cls = async_view.view_class = cls
+        async_view.initkwargs = async_view.view_initkwargs = initkwargs
+        async_view.csrf_exempt = True
+        return async_view
+
+    async def adispatch(self, request, *args, **kwargs):
+        """APIView.dispatch 와 같은 순서, 핸들러만 await."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            response = await self.aget(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def apaginate_queryset(self, queryset):
+        """
+        paginate_queryset 의 async 판. PageNumberPagination 은 count/페이지 조회를 async ORM 으로,
+        그 외 페이지네이션은 기존 sync 구현을 스레드에서 실행한다.
+        """
+        paginator = self.paginator
+        if paginator is None:
+            return None
+        if not isinstance(paginator, PageNumberPagination):
+            return await sync_to_async(self.paginate_queryset)(queryset)
+
+        request = self.request
+        page_size = paginator.get_page_size(request)
+        if not page_size:
+            return None
+        count = await queryset.acount()
+        probe = paginator.django_paginator_class(_Window(count), page_size)
+        number = request.query_params.get(paginator.page_query_param) or 1
+        if number in paginator.last_page_strings:
+            number = probe.num_pages
+        try:
+            number = probe.validate_number(number)
+        except InvalidPage as exc:
+            raise NotFound(paginator.invalid_page_message.format(page_number=number, message=str(exc)))
+
+        bottom = (number - 1) * page_size
+        top = count if bottom + page_size + probe.orphans >= count else bottom + page_size
+        rows = [row async for row in queryset[bottom:top]]
+        django_paginator = paginator.django_paginator_class(_Window(count, bottom, rows), page_size)
+        # get_paginated_response() 가 보는 상태 (DRF paginate_queryset 과 동일)
+        paginator.page = django_paginator.page(number)
+        paginator.request = request
+        return list(paginator.page)
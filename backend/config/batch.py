@@ -0,0 +1,171 @@
+"""
+POST /api/batch — 여러 API 호출을 한 번의 HTTP 요청으로.
+
+  요청:
+    {"requests": [{"id": "assets", "method": "GET", "path": "/api/assets/?type=VIDEO"},
+                  {"id": "pending", "path": "/api/share-requests/summary"},
+                  {"id": "ann", "method": "POST", "path": "/api/announcements/", "body": {...}}],
+     "parallel": true}
+  응답 data:
+    {"responses": [{"id": "assets", "status": 200, "body": {"success": true, "data": ..., "message": null}}, ...]}
+
+  - 인증은 바깥 요청에서 한 번만 (하위 요청은 같은 사용자로 강제 인증)
+  - 하위 요청은 미들웨어/HTTP 없이 URL resolver 로 바로 뷰를 호출
+  - 하위 응답 본문(렌더링된 JSON 바이트)은 다시 파싱하지 않고 그대로 이어붙인다
+  - parallel=true 이고 모두 GET/HEAD 이면 스레드 풀에서 동시에 실행
+"""
+import io
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.exceptions import BadRequest, PermissionDenied, SuspiciousOperation
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.urls import Resolver404, resolve
+from rest_framework import serializers
+from rest_framework.views import APIView
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ("GET", "HEAD")
+_EXCLUDED_PREFIXES = ("/api/batch", "/api/events/")  # 재귀 / 스트리밍 응답
+
+
+class SubRequestSerializer(serializers.Serializer):
+    id = serializers.CharField(required=False, allow_blank=True, max_length=100)
+    method = serializers.ChoiceField(choices=["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"], default="GET")
+    path = serializers.CharField(max_length=2000)
+    body = serializers.JSONField(required=False, default=None)
+
+    def validate_path(self, value):
+        path = urlsplit(value).path
+        if not path.startswith("/api/") or path.startswith(_EXCLUDED_PREFIXES):
+            raise serializers.ValidationError("배치로 호출할 수 없는 경로입니다.")
+        return value
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = SubRequestSerializer(many=True, allow_empty=False)
+    parallel = serializers.BooleanField(default=False)
+
+    def validate_requests(self, value):
+        if len(value) > settings.BATCH_MAX_REQUESTS:
+            raise serializers.ValidationError(f"한 번에 최대 {settings.BATCH_MAX_REQUESTS}개까지 요청할 수 있습니다.")
+        return value
+
+
+def _item(sub_id, status, body):
+    return b'{"id":%s,"status":%d,"body":%s}' % (
+        json.dumps(sub_id, ensure_ascii=False).encode(), status, body,
+    )
+
+
+def _error(sub_id, status, message):
+    body = json.dumps({"success": False, "data": None, "message": message}, ensure_ascii=False)
+    return _item(sub_id, status, body.encode())
+
+
+def _resolve(path):
+    try:
+        return resolve(path)
+    except Resolver404:
+        if settings.APPEND_SLASH and not path.endswith("/"):
+            return resolve(path + "/")
+        raise
+
+
+def _build_request(request, sub):
+    parts = urlsplit(sub["path"])
+    body = b"" if sub["body"] is None else json.dumps(sub["body"]).encode()
+    environ = {
+        # 원 요청의 헤더/서버 정보를 물려받고 메서드/경로/본문만 교체
+        **{k: v for k, v in request.META.items() if isinstance(v, str)},
+        "REQUEST_METHOD": sub["method"],
+        "PATH_INFO": parts.path,
+        "QUERY_STRING": parts.query,
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.url_scheme": request.scheme,
+    }
+    sub_request = WSGIRequest(environ)
+    # DRF Request 가 authenticators 대신 이 사용자/토큰을 그대로 쓴다 (JWT 재검증 없음)
+    sub_request._force_auth_user = request.user
+    sub_request._force_auth_token = request.auth
+    return sub_request
+
+
+def _dispatch(request, sub):
+    sub_id = sub.get("id", "")
+    try:
+        match = _resolve(urlsplit(sub["path"]).path)
+    except Resolver404:
+        return _error(sub_id, 404, "경로를 찾을 수 없습니다.")
+
+    sub_request = _build_request(request, sub)
+    sub_request.resolver_match = match
+    try:
+        response = match.func(sub_request, *match.args, **match.kwargs)
+        if hasattr(response, "render") and not response.is_rendered:
+            response.render()
+    # DRF 밖의 Django 뷰가 던지는 예외는 Django 핸들러와 같은 상태 코드로
+    except Http404:
+        return _error(sub_id, 404, "찾을 수 없습니다.")
+    except PermissionDenied:
+        return _error(sub_id, 403, "권한이 없습니다.")
+    except (BadRequest, SuspiciousOperation):
+        return _error(sub_id, 400, "잘못된 요청입니다.")
+    except Exception:
+        # 한 하위 요청의 오류가 배치 전체를 실패시키지 않도록
+        logger.exception("batch sub-request failed: %s %s", sub["method"], sub["path"])
+        return _error(sub_id, 500, "서버 오류가 발생했습니다.")
+
+    if isinstance(response, StreamingHttpResponse):
+        return _error(sub_id, 400, "스트리밍 응답은 배치로 받을 수 없습니다.")
+    content = response.content
+    if not content:
+        body = b"null"
+    elif response.get("Content-Type", "").startswith("application/json"):
+        body = content
+    else:
+        body = json.dumps(content.decode(response.charset, "replace"), ensure_ascii=False).encode()
+    return _item(sub_id, response.status_code, body)
+
+
+def _dispatch_in_thread(request, sub):
+    try:
+        return _dispatch(request, sub)
+    finally:
+        # 작업 스레드가 연 DB 연결은 여기서 닫는다 (스레드마다 별도 연결)
+        connections.close_all()
+
+
+# ──────────────────────────────────────────────
+# POST /api/batch
+# ──────────────────────────────────────────────
+class BatchView(APIView):
+
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        subs = serializer.validated_data["requests"]
+
+        parallel = (
+            serializer.validated_data["parallel"]
+            and settings.BATCH_MAX_WORKERS > 1
+            and len(subs) > 1
+            and all(sub["method"] in SAFE_METHODS for sub in subs)
+        )
+        if parallel:
+            with ThreadPoolExecutor(max_workers=min(settings.BATCH_MAX_WORKERS, len(subs))) as pool:
+                items = list(pool.map(lambda sub: _dispatch_in_thread(request, sub), subs))
+        else:
+            # 쓰기가 섞이면 순서대로 (앞 요청의 결과를 뒤 요청이 볼 수 있게)
+            items = [_dispatch(request, sub) for sub in subs]
+
+        body = b'{"success":true,"data":{"responses":[%s]},"message":null}' % b",".join(items)
+        return HttpResponse(body, content_type="application/json")
@@ -0,0 +1,82 @@
+"""
+프로세스 로컬 + 공유 캐시(Django cache) 2단 캐시.
+
+  - 로컬 적중: 네트워크/ORM 없이 바로 반환 (LOCAL_TTL 초 동안)
+  - 로컬 만료: 공유 캐시의 세대(generation) 번호만 확인 → 같으면 로컬 값 재사용
+  - 무효화: 세대 번호 +1 → 다른 워커도 LOCAL_TTL 안에 새 값으로 전환
+  - 공유 캐시가 없으면(SHARED_CACHE=False, LocMem) 세대 번호가 워커마다 따로라 무효화가 전달되지 않는다
+    → 세대 확인을 건너뛰고 값 보관을 UNSHARED_CACHE_TTL 초로 줄여 다른 워커의 지연을 그만큼으로 제한
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .metrics import cache_requests
+
+
+class TwoLevelCache:
+    def __init__(self, name, local_ttl=2, shared_ttl=300):
+        self.name = name
+        self.local_ttl = local_ttl
+        self.shared_ttl = shared_ttl
+        self._local = {}  # key → (generation, value, expires_at)
+        self._lock = threading.Lock()
+
+    def _gen_key(self):
+        return f"{self.name}:gen"
+
+    def _value_key(self, gen, key):
+        return f"{self.name}:{gen}:{key}"
+
+    def _generation(self):
+        gen = cache.get(self._gen_key())
+        if gen is None:
+            cache.add(self._gen_key(), 1, timeout=None)
+            gen = cache.get(self._gen_key(), 1)
+        return gen
+
+    def get_or_set(self, key, builder):
+        now = time.monotonic()
+        entry = self._local.get(key)
+        if entry and entry[2] > now:
+            cache_requests.labels(self.name, "local").inc()
+            return entry[1]
+
+        gen = self._generation()
+        if entry and entry[0] == gen and settings.SHARED_CACHE:
+            result = "revalidated"
+            value = entry[1]
+        else:
+            result = "shared"
+            value = cache.get(self._value_key(gen, key))
+            if value is None:
+                result = "miss"
+                value = builder()
+                cache.set(self._value_key(gen, key), value, timeout=self._ttl())
+        cache_requests.labels(self.name, result).inc()
+        with self._lock:
+            self._local[key] = (gen, value, now + self.local_ttl)
+        return value
+
+    def _ttl(self):
+        if settings.SHARED_CACHE:
+            return self.shared_ttl
+        return min(self.shared_ttl, settings.UNSHARED_CACHE_TTL)
+
+    def peek(self, key):
+        """로컬 적중이면 값, 아니면 None (I/O 없음 — async 뷰에서 바로 호출 가능)"""
+        entry = self._local.get(key)
+        if entry and entry[2] > time.monotonic():
+            cache_requests.labels(self.name, "local").inc()
+            return entry[1]
+        return None
+
+    def invalidate(self):
+        try:
+            cache.incr(self._gen_key())
+        except ValueError:
+            cache.set(self._gen_key(), 2, timeout=None)
+        with self._lock:
+            self._local.clear()
@@ -0,0 +1,190 @@
+"""
+읽기 복제본(replica) 라우팅.
+
+  - read_replica = True 로 표시한 뷰의 GET/HEAD 요청만 replica 에서 읽는다
+  - 쓰기, 트랜잭션 안의 읽기, 같은 요청에서 쓰기 이후의 읽기 → primary(default)
+  - 쓰기에 성공한 사용자는 READ_YOUR_WRITES_SECONDS 동안 primary 에서 읽는다
+    (복제 지연 때문에 방금 만든/고친 데이터가 안 보이는 일 방지)
+  - replica 지연은 REPLICA_LAG_CHECK_INTERVAL 초마다 측정, REPLICA_MAX_LAG 초를 넘거나
+    연결이 안 되면 그 replica 는 제외 → 남은 replica 가 없으면 primary
+  - 측정은 한 스레드만 (연결 시도는 REPLICA_CONNECT_TIMEOUT 초까지), 그동안 다른 요청은 직전 결과 사용
+
+설정: DB_REPLICA_HOSTS="127.0.0.1:5434,10.0.0.12:5432" (settings.py 에서 replica1, replica2 ... 로 등록)
+"""
+import random
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+
+from .async_views import HybridMiddleware
+
+PRIMARY = "default"
+SAFE_METHODS = ("GET", "HEAD")
+
+_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+def _pin_key(user_id):
+    return f"dbpin:{user_id}"
+
+
+# ──────────────────────────────────────────────
+# replica 상태 (워커 단위로 주기 측정)
+# ──────────────────────────────────────────────
+class ReplicaMonitor:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._healthy = []
+        self._lags = {}
+        self._checked_at = 0.0
+
+    @staticmethod
+    def aliases():
+        return [alias for alias in settings.DATABASES if alias.startswith("replica")]
+
+    def _measure(self, alias):
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute(_LAG_SQL)
+                lag = cursor.fetchone()[0]
+            return float(lag or 0)
+        except DatabaseError:
+            connections[alias].close()
+            return None  # 연결 불가 → 제외
+
+    def healthy(self):
+        now = time.monotonic()
+        if now - self._checked_at < settings.REPLICA_LAG_CHECK_INTERVAL:
+            return self._healthy
+        if not self._lock.acquire(blocking=False):
+            return self._healthy  # 다른 스레드가 측정 중
+        try:
+            if now - self._checked_at >= settings.REPLICA_LAG_CHECK_INTERVAL:
+                self._lags = {alias: self._measure(alias) for alias in self.aliases()}
+                self._healthy = [
+                    alias for alias, lag in self._lags.items()
+                    if lag is not None and lag <= settings.REPLICA_MAX_LAG
+                ]
+                self._checked_at = time.monotonic()
+        finally:
+            self._lock.release()
+        return self._healthy
+
+    def lags(self):
+        self.healthy()
+        return dict(self._lags)
+
+
+monitor = ReplicaMonitor()
+
+
+# ──────────────────────────────────────────────
+# 요청 단위 상태 (contextvar)
+# ──────────────────────────────────────────────
+class _RequestRouting:
+    def __init__(self, request):
+        self.request = request
+        self._eligible = None
+        self.pinned = None  # None → 아직 판단 전 (인증 전)
+        self.alias = None
+
+    def eligible(self):
+        # process_view 대신 URL 매칭 결과로 판단 (async 체인에서 요청마다 스레드 전환이 없도록)
+        if self._eligible is None:
+            match = getattr(self.request, "resolver_match", None)
+            if match is None:
+                return False  # URL 매칭 전 (미들웨어 단계의 조회)
+            view_class = getattr(match.func, "cls", None) or getattr(match.func, "view_class", None)
+            self._eligible = self.request.method in SAFE_METHODS and getattr(view_class, "read_replica", False)
+        return self._eligible
+
+    def replica(self):
+        if not self.eligible() or self.pinned:
+            return None
+        if self.pinned is None:
+            # JWT 인증은 DRF 뷰 안에서 끝나므로 첫 조회 시점에 사용자를 확인한다
+            user = getattr(self.request, "user", None)
+            if user is not None and user.is_authenticated:
+                self.pinned = bool(cache.get(_pin_key(user.pk)))
+                if self.pinned:
+                    return None
+        if self.alias is None:
+            healthy = monitor.healthy()
+            # 한 요청의 읽기는 같은 replica 에서 (페이지 count/목록 일관성)
+            self.alias = random.choice(healthy) if healthy else PRIMARY
+        return None if self.alias == PRIMARY else self.alias
+
+
+_routing = ContextVar("db_routing", default=None)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        if state is None or connections[PRIMARY].in_atomic_block:
+            return PRIMARY
+        return state.replica() or PRIMARY
+
+    def db_for_write(self, model, **hints):
+        state = _routing.get()
+        if state is not None:
+            state.pinned = True  # 이 요청의 이후 읽기는 primary
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True  # 모두 같은 데이터베이스의 복제본
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY
+
+
+class ReplicaRoutingMiddleware(HybridMiddleware):
+    # async 에서도 contextvar 는 sync_to_async 스레드로 복사되므로 ORM 라우팅은 그대로 동작한다
+
+    def handle(self, request):
+        token = _routing.set(_RequestRouting(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+        user = self._writer(request, response)
+        if user is not None:
+            cache.set(_pin_key(user.pk), 1, timeout=settings.READ_YOUR_WRITES_SECONDS)
+        return response
+
+    async def ahandle(self, request):
+        token = _routing.set(_RequestRouting(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing.reset(token)
+        if request.method in SAFE_METHODS:
+            return response
+        # request.user 가 세션 기반 지연 객체면 DB 를 보므로 스레드에서 (쓰기 요청만)
+        user = await sync_to_async(self._writer)(request, response)
+        if user is not None:
+            await cache.aset(_pin_key(user.pk), 1, timeout=settings.READ_YOUR_WRITES_SECONDS)
+        return response
+
+    @staticmethod
+    def _writer(request, response):
+        """쓰기에 성공한 사용자 → 잠시 primary 고정 (DRF 가 인증 후 request.user 를 채워 둔다)"""
+        user = getattr(request, "user", None)
+        if (
+            request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and user is not None and user.is_authenticated
+        ):
+            return user
+        return None
@@ -0,0 +1,219 @@
+"""
+Prometheus 메트릭 (prometheus_client, 미설치 시 모든 메트릭이 no-op).
+
+GET /metrics  (text exposition, Authorization: Bearer <METRICS_TOKEN> — 토큰 미설정 시 DEBUG 에서만 공개)
+
+  portal_http_request_duration_seconds{view,method,status}   요청 지연 히스토그램 (p99 알림)
+  portal_http_requests_in_progress                            처리 중 요청 수
+  portal_db_queries_per_request{view}                         요청당 쿼리 수 히스토그램
+  portal_db_query_seconds_per_request{view}                   요청당 DB 시간 히스토그램
+  portal_cache_requests_total{cache,result}                   캐시 결과 (local / revalidated / shared / hit / stale / wait / miss)
+  portal_db_pool_connections{alias,state}                     커넥션 풀 크기/유휴/대기 요청 (DB_POOL)
+  portal_db_pool_max_connections{alias}                       풀 최대치 → 포화도 = size / max
+  portal_events_subscribers                                   SSE 연결 수
+  portal_replica_lag_seconds{alias}                           읽기 복제본 지연 (연결될 때만 갱신, 워커 중 최대)
+  portal_replica_up{alias}                                    복제본 연결 가능 1 / 불가 0 (워커 중 최소)
+
+멀티 프로세스(gunicorn): PROMETHEUS_MULTIPROC_DIR 를 워커 시작 전에 지정하면
+워커별 값이 파일로 모여 /metrics 한 번에 합산된다 (gunicorn.conf.py 의 child_exit 참고).
+게이지(풀/구독자/지연)는 요청 처리 중 METRICS_GAUGE_INTERVAL 초마다 각 워커가 갱신한다.
+"""
+import hmac
+import logging
+import os
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+from .async_views import HybridMiddleware
+
+try:
+    import prometheus_client
+    from prometheus_client import Counter, Gauge, Histogram
+except ImportError:  # prometheus_client 미설치 → 계측 코드는 그대로 두고 아무것도 하지 않음
+    prometheus_client = None
+
+logger = logging.getLogger(__name__)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144)
+
+
+class _Noop:
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def dec(self, amount=1):
+        pass
+
+    def set(self, value):
+        pass
+
+    def observe(self, value):
+        pass
+
+
+if prometheus_client is not None:
+    request_duration = Histogram(
+        "portal_http_request_duration_seconds", "요청 처리 시간",
+        ["view", "method", "status"], buckets=LATENCY_BUCKETS,
+    )
+    requests_in_progress = Gauge(
+        "portal_http_requests_in_progress", "처리 중 요청 수", multiprocess_mode="livesum",
+    )
+    queries_per_request = Histogram(
+        "portal_db_queries_per_request", "요청당 SQL 실행 수", ["view"], buckets=QUERY_BUCKETS,
+    )
+    query_seconds_per_request = Histogram(
+        "portal_db_query_seconds_per_request", "요청당 SQL 실행 시간", ["view"], buckets=LATENCY_BUCKETS,
+    )
+    cache_requests = Counter(
+        "portal_cache_requests", "캐시 조회 결과", ["cache", "result"],
+    )
+    pool_connections = Gauge(
+        "portal_db_pool_connections", "커넥션 풀 상태", ["alias", "state"], multiprocess_mode="livesum",
+    )
+    pool_max_connections = Gauge(
+        "portal_db_pool_max_connections", "커넥션 풀 최대 크기", ["alias"], multiprocess_mode="livesum",
+    )
+    events_subscribers = Gauge(
+        "portal_events_subscribers", "SSE 구독 수", multiprocess_mode="livesum",
+    )
+    # 살아 있는 워커 값만 합산 — 종료된 워커의 마지막 값이 남지 않도록
+    replica_lag = Gauge(
+        "portal_replica_lag_seconds", "읽기 복제본 지연", ["alias"], multiprocess_mode="livemax",
+    )
+    replica_up = Gauge(
+        "portal_replica_up", "읽기 복제본 연결 가능 여부", ["alias"], multiprocess_mode="livemin",
+    )
+else:
+    request_duration = requests_in_progress = queries_per_request = query_seconds_per_request = _Noop()
+    cache_requests = pool_connections = pool_max_connections = events_subscribers = _Noop()
+    replica_lag = replica_up = _Noop()
+
+
+# ──────────────────────────────────────────────
+# 게이지 갱신 (워커별, 주기적)
+# ──────────────────────────────────────────────
+_gauges_at = 0.0
+
+
+def _refresh_gauges():
+    from django.db import connections
+
+    from apps.events import broker
+
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)  # OPTIONS["pool"] (settings.DB_POOL)
+        if pool is None:
+            continue
+        stats = pool.get_stats()
+        pool_connections.labels(alias, "size").set(stats.get("pool_size", 0))
+        pool_connections.labels(alias, "available").set(stats.get("pool_available", 0))
+        pool_connections.labels(alias, "waiting").set(stats.get("requests_waiting", 0))
+        pool_max_connections.labels(alias).set(stats.get("pool_max", 0))
+
+    if broker._broker is not None:
+        events_subscribers.set(broker._broker.subscriber_count)
+
+    if "config.db_router.ReplicaRouter" in getattr(settings, "DATABASE_ROUTERS", ()):
+        from config.db_router import monitor
+
+        for alias, lag in monitor.lags().items():
+            replica_up.labels(alias).set(0 if lag is None else 1)
+            if lag is not None:
+                replica_lag.labels(alias).set(lag)
+
+
+def gauges_due():
+    return time.monotonic() - _gauges_at >= settings.METRICS_GAUGE_INTERVAL
+
+
+def refresh_gauges(force=False):
+    global _gauges_at
+    now = time.monotonic()
+    if force or now - _gauges_at >= settings.METRICS_GAUGE_INTERVAL:
+        _gauges_at = now
+        try:
+            _refresh_gauges()
+        except Exception:
+            # 메트릭 수집 실패가 요청을 깨뜨리지 않도록
+            logger.exception("메트릭 게이지 갱신 실패")
+
+
+# ──────────────────────────────────────────────
+# 미들웨어
+# ──────────────────────────────────────────────
+class MetricsMiddleware(HybridMiddleware):
+    """settings.METRICS=True 일 때 MIDDLEWARE 맨 앞에 등록된다."""
+
+    def __init__(self, get_response):
+        from .querycount import count_queries
+
+        super().__init__(get_response)
+        self.count_queries = count_queries
+
+    def handle(self, request):
+        started = time.perf_counter()
+        requests_in_progress.inc()
+        try:
+            with self.count_queries() as counter:
+                response = self.get_response(request)
+        finally:
+            requests_in_progress.dec()
+        self._observe(request, response, counter, started)
+        refresh_gauges()
+        return response
+
+    async def ahandle(self, request):
+        started = time.perf_counter()
+        requests_in_progress.inc()
+        try:
+            with self.count_queries() as counter:
+                response = await self.get_response(request)
+        finally:
+            requests_in_progress.dec()
+        self._observe(request, response, counter, started)
+        if gauges_due():
+            # 복제본 지연 측정 등 DB 를 볼 수 있으므로 이벤트 루프 밖에서 (주기당 한 번)
+            await sync_to_async(refresh_gauges)()
+        return response
+
+    @staticmethod
+    def _observe(request, response, counter, started):
+        match = getattr(request, "resolver_match", None)
+        # 매칭되지 않은 경로(404 스캔 등)는 한 라벨로 묶어 시계열 폭증 방지
+        view = match.view_name if match else "unmatched"
+        request_duration.labels(view, request.method, str(response.status_code)).observe(
+            time.perf_counter() - started
+        )
+        queries_per_request.labels(view).observe(counter.count)
+        query_seconds_per_request.labels(view).observe(counter.duration)
+
+
+# ──────────────────────────────────────────────
+# GET /metrics
+# ──────────────────────────────────────────────
+def metrics_view(request):
+    if prometheus_client is None:
+        return HttpResponse("prometheus_client 가 설치되어 있지 않습니다.\n", status=503, content_type="text/plain")
+    token = settings.METRICS_TOKEN
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponseForbidden("METRICS_TOKEN 이 설정되지 않았습니다.\n", content_type="text/plain")
+    elif not hmac.compare_digest(request.META.get("HTTP_AUTHORIZATION", "").encode(), f"Bearer {token}".encode()):
+        return HttpResponseForbidden()
+
+    refresh_gauges(force=True)
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return HttpResponse(prometheus_client.generate_latest(registry), content_type=prometheus_client.CONTENT_TYPE_LATEST)
@@ -0,0 +1,243 @@
+"""
+요청 단위 온디맨드 프로파일링 (SUPER_ADMIN 전용).
+
+    curl -H "Authorization: Bearer <슈퍼관리자 토큰>" -H "X-Profile: 1" .../api/assets/
+    → 응답 헤더 X-Profile-Id, 결과는 PROFILE_DIR 에 저장
+
+  - X-Profile: 1 | cprofile   → cProfile (결정적, .prof — snakeviz / pstats 로 열기)
+  - X-Profile: sample         → pyinstrument (통계적 샘플링, .html) — 미설치 시 cProfile
+  - 쿼리 로그(SQL/파라미터/시간)와 URL 이름을 메타 정보(.json)로 함께 저장
+  - 헤더가 없는 요청은 META 조회 1번 외에 추가 비용 없음
+  - 헤더가 있어도 슈퍼관리자가 아니면 조용히 일반 요청으로 처리
+  - 동시에 한 요청만 프로파일링 (프로파일러는 프로세스 전역 자원)
+  - 미들웨어 스레드에서 실행된 코드만 잡힌다 (배치 병렬 실행의 다른 스레드는 제외)
+    ASGI 에서는 프로파일 요청만 스레드로 옮겨 나머지 체인을 async_to_sync 로 실행한다
+    → sync 뷰/ORM 은 같은 스레드에서 돌아 잡히고, async 뷰 본문은 이벤트 루프에서 돌아 빠진다
+
+GET /api/admin/profiles                  → 목록
+GET /api/admin/profiles/{id}             → 메타 + 쿼리 로그 + 상위 함수 요약
+GET /api/admin/profiles/{id}/download    → 원본 파일
+"""
+import io
+import json
+import logging
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.http import FileResponse
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.accounts.authentication import PortalJWTAuthentication
+from apps.accounts.permissions import IsSuperAdmin, is_super_admin
+from .async_views import HybridMiddleware
+from .querycount import count_queries
+
+logger = logging.getLogger(__name__)
+
+_ID_RE = re.compile(r"^[0-9]{8}-[0-9]{6}-[0-9a-f]{8}$")
+_SUMMARY_LINES = 40
+
+
+# ──────────────────────────────────────────────
+# 프로파일러
+# ──────────────────────────────────────────────
+def _cprofile(call):
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    response = profiler.runcall(call)
+
+    def save(path):
+        profiler.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(_SUMMARY_LINES)
+        return out.getvalue()
+    return response, "cprofile", ".prof", save
+
+
+def _sampling(call):
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        return _cprofile(call)
+
+    profiler = Profiler(interval=0.001, async_mode="disabled")
+    profiler.start()
+    try:
+        response = call()
+    finally:
+        profiler.stop()
+
+    def save(path):
+        path.write_text(profiler.output_html(), encoding="utf-8")
+        return profiler.output_text(unicode=True)
+    return response, "pyinstrument", ".html", save
+
+
+PROFILERS = {"1": _cprofile, "cprofile": _cprofile, "sample": _sampling, "pyinstrument": _sampling}
+
+
+# ──────────────────────────────────────────────
+# 저장소 (로컬 디스크, 최근 PROFILE_MAX_FILES 건)
+# ──────────────────────────────────────────────
+class ProfileStore:
+    @property
+    def directory(self):
+        return Path(settings.PROFILE_DIR)
+
+    def new_id(self):
+        return f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}"
+
+    def save(self, profile_id, meta, suffix, write):
+        directory = self.directory
+        directory.mkdir(parents=True, exist_ok=True)
+        meta["file"] = f"{profile_id}{suffix}"
+        meta["summary"] = write(directory / meta["file"])
+        (directory / f"{profile_id}.json").write_text(
+            json.dumps(meta, ensure_ascii=False, default=str), encoding="utf-8",
+        )
+        self._prune()
+
+    def _prune(self):
+        metas = sorted(self.directory.glob("*.json"), reverse=True)
+        for path in metas[settings.PROFILE_MAX_FILES:]:
+            for related in self.directory.glob(f"{path.stem}.*"):
+                related.unlink(missing_ok=True)
+
+    def get(self, profile_id):
+        if not _ID_RE.match(profile_id):
+            return None
+        path = self.directory / f"{profile_id}.json"
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def list(self):
+        if not self.directory.exists():
+            return []
+        items = []
+        for path in sorted(self.directory.glob("*.json"), reverse=True):
+            meta = json.loads(path.read_text(encoding="utf-8"))
+            meta.pop("queries", None)
+            meta.pop("summary", None)
+            items.append(meta)
+        return items
+
+
+store = ProfileStore()
+
+
+# ──────────────────────────────────────────────
+# 미들웨어
+# ──────────────────────────────────────────────
+def _super_admin(request):
+    # DRF 인증은 뷰 안에서 일어나므로 여기서 토큰을 한 번 더 확인한다 (헤더가 있을 때만)
+    try:
+        result = PortalJWTAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return None
+    user = result[0] if result else None
+    return user if is_super_admin(user) else None
+
+
+class ProfilingMiddleware(HybridMiddleware):
+    _busy = threading.Lock()
+
+    def handle(self, request):
+        mode = request.META.get("HTTP_X_PROFILE")
+        if mode is None:
+            return self.get_response(request)
+        return self._profile(request, mode.strip().lower(), self.get_response)
+
+    async def ahandle(self, request):
+        mode = request.META.get("HTTP_X_PROFILE")
+        if mode is None:
+            return await self.get_response(request)
+        return await sync_to_async(self._profile)(
+            request, mode.strip().lower(), async_to_sync(self.get_response),
+        )
+
+    def _profile(self, request, mode, get_response):
+        user = _super_admin(request)
+        if user is None or not self._busy.acquire(blocking=False):
+            return get_response(request)
+        try:
+            started = time.perf_counter()
+            with count_queries(capture=True) as counter:
+                response, profiler, suffix, write = PROFILERS.get(mode, _cprofile)(
+                    lambda: get_response(request)
+                )
+            elapsed = time.perf_counter() - started
+        finally:
+            self._busy.release()
+
+        profile_id = store.new_id()
+        match = getattr(request, "resolver_match", None)
+        meta = {
+            "id": profile_id,
+            "createdAt": datetime.now().astimezone().isoformat(timespec="seconds"),
+            "method": request.method,
+            "path": request.get_full_path(),
+            "urlName": match.view_name if match else None,
+            "status": response.status_code,
+            "durationMs": round(elapsed * 1000, 2),
+            "profiler": profiler,
+            "user": getattr(user, "email", None) or str(user.pk),
+            "queryCount": counter.count,
+            "queryMs": round(counter.duration * 1000, 2),
+            "queries": counter.statements,
+        }
+        try:
+            store.save(profile_id, meta, suffix, write)
+        except OSError:
+            logger.exception("프로파일 저장 실패: %s", profile_id)
+            return response
+        response["X-Profile-Id"] = profile_id
+        return response
+
+
+# ──────────────────────────────────────────────
+# GET /api/admin/profiles
+# ──────────────────────────────────────────────
+class ProfileListView(APIView):
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request):
+        return Response(store.list())
+
+
+# ──────────────────────────────────────────────
+# GET /api/admin/profiles/{id}
+# ──────────────────────────────────────────────
+class ProfileDetailView(APIView):
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request, profile_id):
+        meta = store.get(profile_id)
+        if meta is None:
+            return Response({"detail": "프로파일을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(meta)
+
+
+# ──────────────────────────────────────────────
+# GET /api/admin/profiles/{id}/download
+# ──────────────────────────────────────────────
+class ProfileDownloadView(APIView):
+    permission_classes = [IsSuperAdmin]
+
+    def get(self, request, profile_id):
+        meta = store.get(profile_id)
+        path = meta and store.directory / meta["file"]
+        if path is None or not path.exists():
+            return Response({"detail": "프로파일을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(path.open("rb"), as_attachment=True, filename=meta["file"])
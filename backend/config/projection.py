@@ -0,0 +1,246 @@
+"""
+목록 응답 고속 경로: ModelSerializer 정의 → values() 컬럼 + 미리 컴파일한 row mapper.
+
+  - 모델 인스턴스를 만들지 않고 응답에 필요한 컬럼만 SELECT (select_related/prefetch 불필요)
+  - 필드별 source 경로/변환 규칙은 처음 한 번만 해석해 dict 생성 코드로 컴파일
+  - 출력은 Serializer(many=True).data 와 같은 값 → 렌더링 결과 바이트도 동일
+
+사용:
+    asset_list_projection = Projection(AssetListSerializer)
+    rows = asset_list_projection.values(queryset)
+    data = asset_list_projection.map(rows)
+
+SerializerMethodField 처럼 컬럼이 아닌 필드는 annotations 로 DB 표현식을 지정한다.
+
+?fields=id,title 을 주면 응답 필드뿐 아니라 SELECT 컬럼/조인도 그만큼 줄어든다.
+목록이 아닌 Serializer 는 SparseFieldsMixin 으로 only()/select_related/prefetch 를 줄인다.
+"""
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.response import Response
+from rest_framework.settings import ISO_8601, api_settings
+
+
+def _uuid(value):
+    return None if value is None else str(value)
+
+
+def _datetime(value, tz):
+    # DRF DateTimeField.to_representation (ISO 8601, 현재 타임존) 과 동일
+    if not value:
+        return None
+    value = value.astimezone(tz).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def _fallback(field):
+    to_representation = field.to_representation
+
+    def convert(value):
+        return None if value is None else to_representation(value)
+    return convert
+
+
+# DB 값이 이미 응답 값과 같은 필드 (str/bool/int/dict)
+_IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.BooleanField,
+    serializers.IntegerField,
+)
+
+
+def _converter(field):
+    """None → 변환 없음, _datetime → 타임존 인자 필요, 그 외 → 1인자 함수."""
+    if isinstance(field, serializers.UUIDField) and field.uuid_format == "hex_verbose":
+        return _uuid
+    if isinstance(field, serializers.DateTimeField):
+        fmt = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if fmt is not None and fmt.lower() == ISO_8601 and settings.USE_TZ and not hasattr(field, "timezone"):
+            return _datetime
+        return _fallback(field)
+    if isinstance(field, serializers.JSONField) and not field.binary:
+        return None
+    if isinstance(field, _IDENTITY_FIELDS):
+        return None
+    return _fallback(field)
+
+
+def requested_fields(request, available, param="fields"):
+    """?fields=id,title → frozenset (지정 없으면 None). 알 수 없는 값은 400."""
+    raw = request.query_params.get(param)
+    if not raw:
+        return None
+    fields = [f.strip() for f in raw.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in available]
+    if unknown:
+        raise ParseError(f"알 수 없는 {param} 값: {', '.join(unknown)}")
+    return frozenset(fields) or None
+
+
+class Projection:
+    def __init__(self, serializer_class, annotations=None):
+        self.serializer_class = serializer_class
+        self.annotations = annotations or {}
+        self._entries = None  # [(api 필드명, 컬럼, 변환)]
+        self._mappers = {}
+        self._lock = threading.Lock()
+
+    # ── 필드 해석 (첫 사용 시 1회) ──
+    @property
+    def entries(self):
+        if self._entries is None:
+            entries = []
+            for name, field in self.serializer_class().fields.items():
+                if field.write_only:
+                    continue
+                if name in self.annotations:
+                    entries.append((name, f"api_{name}", None))
+                    continue
+                if isinstance(field, (serializers.SerializerMethodField, serializers.BaseSerializer,
+                                      serializers.RelatedField, serializers.ManyRelatedField)):
+                    raise ImproperlyConfigured(
+                        f"{self.serializer_class.__name__}.{name}: annotations 로 컬럼을 지정해야 합니다."
+                    )
+                entries.append((name, "__".join(field.source_attrs), _converter(field)))
+            self._entries = entries
+        return self._entries
+
+    @property
+    def field_names(self):
+        return [name for name, _, _ in self.entries]
+
+    # ── 쿼리 ──
+    def values(self, queryset, fields=None, extra=()):
+        """
+        queryset → 필요한 컬럼만 읽는 values() queryset.
+        fields: 응답 필드 부분집합 (None 이면 전체) → 쓰지 않는 조인/서브쿼리는 SQL 에서 빠진다
+        extra: 응답에는 없지만 필요한 컬럼 (예: 커서 페이지네이션 정렬 키)
+        """
+        entries = [e for e in self.entries if fields is None or e[0] in fields]
+        columns = [column for _, column, _ in entries]
+        # DISTINCT 가 걸린 목록에서 같은 값의 다른 행이 합쳐지지 않도록 pk 는 항상 포함
+        for column in (queryset.model._meta.pk.name, *extra):
+            if column not in columns:
+                columns.append(column)
+        qs = queryset.select_related(None).prefetch_related(None)
+        annotations = {
+            f"api_{name}": expr for name, expr in self.annotations.items()
+            if fields is None or name in fields
+        }
+        if annotations:
+            qs = qs.annotate(**annotations)
+        return qs.values(*columns)
+
+    # ── 매핑 ──
+    def _mapper(self, names):
+        mapper = self._mappers.get(names)
+        if mapper is None:
+            with self._lock:
+                mapper = self._mappers.get(names) or self._compile(names)
+                self._mappers[names] = mapper
+        return mapper
+
+    def _compile(self, names):
+        namespace = {"_datetime": _datetime}
+        items = []
+        for i, (name, column, convert) in enumerate(self.entries):
+            if name not in names:
+                continue
+            expr = f"row[{column!r}]"
+            if convert is _datetime:
+                expr = f"_datetime({expr}, tz)"
+            elif convert is not None:
+                namespace[f"_c{i}"] = convert
+                expr = f"_c{i}({expr})"
+            items.append(f"{name!r}: {expr}")
+        source = "def mapper(rows, tz):\n    return [{%s} for row in rows]\n" % ", ".join(items)
+        exec(compile(source, f"<projection {self.serializer_class.__name__}>", "exec"), namespace)
+        return namespace["mapper"]
+
+    def map(self, rows, fields=None):
+        """values() 행 목록 → API 응답 dict 목록"""
+        names = frozenset(self.field_names) if fields is None else fields
+        return self._mapper(names)(rows, timezone.get_current_timezone())
+
+
+class ProjectionListMixin:
+    """
+    generics.ListAPIView 용: list() 를 Projection 으로 처리.
+    필터/검색/정렬/페이지네이션은 그대로 queryset 에 적용된다.
+    """
+    projection = None
+
+    def _cursor_columns(self):
+        # CursorPagination 은 마지막 행의 정렬 키로 다음 커서를 만든다
+        ordering = getattr(self.paginator, "ordering", None) or ()
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        return [o.lstrip("-") for o in ordering]
+
+    def list(self, request, *args, **kwargs):
+        fields = requested_fields(request, self.projection.field_names)
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = self.projection.values(queryset, fields, extra=self._cursor_columns())
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.projection.map(page, fields))
+        return Response(self.projection.map(rows, fields))
+
+    async def aget(self, request, *args, **kwargs):
+        # ASGI 경로 (config/async_views.AsyncReadMixin 과 함께 사용)
+        fields = requested_fields(request, self.projection.field_names)
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = self.projection.values(queryset, fields, extra=self._cursor_columns())
+        page = await self.apaginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.projection.map(page, fields))
+        return Response(self.projection.map([row async for row in rows], fields))
+
+
+class SparseFieldsMixin:
+    """
+    단건/소량 응답용 ModelSerializer 믹스인.
+      - Serializer(obj, fields=...) → 지정한 필드만 출력
+      - sparse_queryset(qs, fields) → 그 필드에 필요한 컬럼/조인/prefetch 만 읽기
+    컬럼에서 바로 나오지 않는 필드는 sparse_sources 에 지정:
+      {"필드명": ("select" | "prefetch" | "only", 경로)}
+    """
+    sparse_sources = {}
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def sparse_queryset(cls, queryset, fields=None, also=()):
+        """also: 응답 필드와 별개로 읽어 둘 컬럼"""
+        only, select, prefetch = {queryset.model._meta.pk.name, *also}, set(), set()
+        for name, field in cls(fields=fields).fields.items():
+            if field.write_only:
+                continue
+            kind, path = cls.sparse_sources.get(name, (None, None))
+            if kind == "select":
+                select.add(path)
+                only.add(path)
+            elif kind == "prefetch":
+                prefetch.add(path)
+            elif kind == "only":
+                only.add(path)
+            else:
+                attrs = field.source_attrs
+                if len(attrs) > 1:
+                    select.add("__".join(attrs[:-1]))
+                only.add("__".join(attrs))
+        if select:  # select_related() 인자 없이 부르면 모든 FK 를 조인한다
+            queryset = queryset.select_related(*select)
+        return queryset.prefetch_related(*prefetch).only(*only)
@@ -0,0 +1,84 @@
+"""
+쿼리 예산 + N+1 감지.
+
+  settings.QUERY_BUDGETS = {"asset-list-create": 4, ...}   URL 이름별 GET/HEAD 최대 쿼리 수 (인증 포함)
+  - 예산 초과: 그 요청의 쿼리 수 > 예산
+  - N+1 의심: 같은 모양의 SQL 이 QUERY_N_PLUS_ONE_THRESHOLD 번 이상 (IN (...) 목록 길이는 무시)
+    → 쓰기 요청도 N+1 은 검사한다
+
+  - QueryBudgetMiddleware (QUERY_BUDGET_CHECK, 기본 DEBUG): 위반 시 경고 로그 + X-Query-Budget 헤더
+  - manage.py test (apps/accounts/tests/test_query_budgets.py): 1행/100행 데이터로 모든 엔드포인트 검사 (CI)
+  - manage.py check_query_budgets: 같은 측정을 표로 출력
+"""
+import logging
+import re
+from collections import Counter
+
+from django.conf import settings
+
+from .async_views import HybridMiddleware
+from .querycount import count_queries
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ("GET", "HEAD")
+_IN_LIST = re.compile(r"IN \((?:%s, )*%s\)")
+_SPACES = re.compile(r"\s+")
+
+
+def shape(sql):
+    """파라미터 개수와 공백 차이를 없앤 SQL 모양"""
+    return _IN_LIST.sub("IN (...)", _SPACES.sub(" ", sql.strip()))
+
+
+class BudgetReport:
+    def __init__(self, view, statements, check_budget=True):
+        self.view = view
+        self.count = len(statements)
+        self.budget = settings.QUERY_BUDGETS.get(view) if check_budget else None
+        threshold = settings.QUERY_N_PLUS_ONE_THRESHOLD
+        shapes = Counter(shape(s["sql"]) for s in statements)
+        self.repeated = [(sql, n) for sql, n in shapes.most_common() if n >= threshold]
+
+    @property
+    def over_budget(self):
+        return self.budget is not None and self.count > self.budget
+
+    @property
+    def problems(self):
+        problems = []
+        if self.over_budget:
+            problems.append(f"쿼리 {self.count}개 > 예산 {self.budget}개")
+        for sql, n in self.repeated:
+            problems.append(f"N+1 의심 ({n}회): {sql[:200]}")
+        return problems
+
+
+class QueryBudgetMiddleware(HybridMiddleware):
+    """settings.QUERY_BUDGET_CHECK=True 일 때 등록된다 (개발용 — 모든 SQL 문장을 모은다)."""
+
+    def handle(self, request):
+        with count_queries(capture=True) as counter:
+            response = self.get_response(request)
+        return self._check(request, response, counter)
+
+    async def ahandle(self, request):
+        with count_queries(capture=True) as counter:
+            response = await self.get_response(request)
+        return self._check(request, response, counter)
+
+    @staticmethod
+    def _check(request, response, counter):
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return response
+
+        report = BudgetReport(match.view_name, counter.statements, request.method in SAFE_METHODS)
+        if report.problems:
+            logger.warning(
+                "쿼리 예산 위반 %s %s [%s]\n  %s",
+                request.method, request.get_full_path(), match.view_name, "\n  ".join(report.problems),
+            )
+            budget = "-" if report.budget is None else report.budget
+            response["X-Query-Budget"] = f"{report.count}/{budget} n+1={len(report.repeated)}"
+        return response
@@ -0,0 +1,91 @@
+"""
+요청별 SQL 실행 횟수/시간 집계.
+
+  - DB 연결이 열릴 때(connection_created) execute_wrapper 를 붙여 모든 쿼리를 센다
+    (DEBUG 의 connection.queries 와 달리 운영 설정에서도 동작, 기본은 건수/시간만 기록)
+  - 집계 대상은 contextvar 로 요청마다 분리 → ASGI 의 sync_to_async 스레드에서 실행된 쿼리도 포함
+  - QueryCountMiddleware: 응답 헤더 X-Query-Count / X-Query-Time-Ms (benchmarks/load.py 가 읽는다)
+
+    with count_queries() as counter:
+        ...
+    counter.count, counter.duration
+    count_queries(capture=True) → counter.statements 에 SQL/파라미터/시간도 기록 (프로파일링용)
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from .async_views import HybridMiddleware
+
+_current = ContextVar("query_counters", default=())  # 중첩 가능 (헤더 집계 + 프로파일링)
+
+
+class QueryCounter:
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self, capture=False):
+        self.count = 0
+        self.duration = 0.0  # 초
+        self.statements = [] if capture else None
+
+
+def _count(execute, sql, params, many, context):
+    counters = _current.get()
+    if not counters:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        for counter in counters:
+            counter.count += 1
+            counter.duration += elapsed
+            if counter.statements is not None:
+                counter.statements.append({
+                    "sql": sql,
+                    "params": None if params is None else repr(params)[:500],
+                    "many": many,
+                    "db": context["connection"].alias,
+                    "ms": round(elapsed * 1000, 3),
+                })
+
+
+@receiver(connection_created)
+def _install(sender, connection, **kwargs):
+    # 재연결 때도 신호가 오므로 한 번만
+    if _count not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count)
+
+
+@contextmanager
+def count_queries(capture=False):
+    counter = QueryCounter(capture)
+    token = _current.set((*_current.get(), counter))
+    try:
+        yield counter
+    finally:
+        _current.reset(token)
+
+
+class QueryCountMiddleware(HybridMiddleware):
+    """settings.QUERY_COUNT_HEADERS=True 일 때 MIDDLEWARE 맨 앞에 등록된다."""
+
+    def handle(self, request):
+        with count_queries() as counter:
+            response = self.get_response(request)
+        return self._headers(response, counter)
+
+    async def ahandle(self, request):
+        with count_queries() as counter:
+            response = await self.get_response(request)
+        return self._headers(response, counter)
+
+    @staticmethod
+    def _headers(response, counter):
+        response["X-Query-Count"] = str(counter.count)
+        response["X-Query-Time-Ms"] = f"{counter.duration * 1000:.2f}"
+        return response
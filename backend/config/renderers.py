@@ -4,6 +4,14 @@
   실패 → {"success": false, "data": null, "message": "에러 메시지"}
 """
 from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+
+    _OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+except ImportError:  # orjson 미설치 → 표준 json 으로 동작
+    orjson = None
 
 
 class ApiRenderer(JSONRenderer):
@@ -16,3 +24,30 @@ class ApiRenderer(JSONRenderer):
         else:
             payload = {"success": True, "data": data, "message": None}
         return super().render(payload, accepted_media_type, renderer_context)
+
+
+# ──────────────────────────────────────────────
+# orjson 기반 렌더러
+#   - 성공 응답은 envelope 를 상수 바이트로 두고 data 만 인코딩해 이어붙인다
+#   - UUID/datetime 은 orjson 이 직접, 그 외(Decimal, lazy str 등)는 DRF 인코더 규칙을 그대로 따른다
+# ──────────────────────────────────────────────
+_SUCCESS_HEAD = b'{"success":true,"data":'
+_SUCCESS_TAIL = b',"message":null}'
+_default = JSONEncoder().default
+
+
+def _dumps(obj):
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+class FastApiRenderer(ApiRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        response = renderer_context.get("response") if renderer_context else None
+        if response and response.status_code >= 400:
+            message = data.get("detail", data) if isinstance(data, dict) else data
+            return _dumps({"success": False, "data": None, "message": message})
+        return _SUCCESS_HEAD + _dumps(data) + _SUCCESS_TAIL
@@ -0,0 +1,114 @@
+"""
+OpenAPI 스키마 — 배포 시 한 번 생성한 파일을 그대로 서빙.
+
+    python manage.py build_schema          # 배포 단계에서 (SCHEMA_FILE 에 기록)
+    python manage.py build_schema --check  # CI: 파일이 코드와 다르면 실패
+
+GET /api/schema/
+  - SCHEMA_LIVE=False (기본, 운영): SCHEMA_FILE 을 파일 그대로 응답 + ETag (If-None-Match → 304)
+    → 요청마다 뷰/Serializer 를 훑지 않고, 워커에 스키마를 올려 두지도 않는다 (파일 해시만 기억)
+    → 파일이 없으면 첫 요청에서 한 번 생성해 기록 (경고 로그)
+  - SCHEMA_LIVE=True (기본 DEBUG, 개발): 요청마다 drf_spectacular 로 다시 생성 (?format=yaml 등 그대로)
+  - drf_spectacular 는 생성할 때만 import 한다 (GET /api/docs/ 도 첫 요청 때)
+"""
+import hashlib
+import logging
+import os
+import tempfile
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse
+from django.views.decorators.http import condition, require_safe
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/vnd.oai.openapi+json"
+
+_etags = {}  # (경로, mtime, 크기) → 내용 해시
+
+
+def render_schema():
+    """drf_spectacular 스키마 → JSON bytes (SpectacularAPIView 와 같은 생성기/설정)"""
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+    from drf_spectacular.settings import spectacular_settings
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS(urlconf=spectacular_settings.SERVE_URLCONF)
+    schema = generator.get_schema(request=None, public=spectacular_settings.SERVE_PUBLIC)
+    return OpenApiJsonRenderer().render(schema, renderer_context={})
+
+
+def write_schema(path=None, content=None):
+    """임시 파일에 쓰고 교체 → 서빙 중인 워커가 반쯤 쓴 파일을 읽지 않는다"""
+    path = Path(path or settings.SCHEMA_FILE)
+    content = render_schema() if content is None else content
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+
+def _schema_path():
+    path = Path(settings.SCHEMA_FILE)
+    if not path.exists():
+        logger.warning("스키마 파일이 없어 생성합니다 (배포 단계에서 build_schema 를 실행하세요): %s", path)
+        write_schema(path)
+    return path
+
+
+def _etag(request):
+    if settings.SCHEMA_LIVE:
+        return None
+    path = _schema_path()
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    etag = _etags.get(key)
+    if etag is None:
+        etag = hashlib.sha256(path.read_bytes()).hexdigest()[:32]
+        _etags.clear()
+        _etags[key] = etag
+    return etag
+
+
+@cache
+def _live_view():
+    from drf_spectacular.views import SpectacularAPIView
+
+    return SpectacularAPIView.as_view()
+
+
+# ──────────────────────────────────────────────
+# GET /api/schema/
+# ──────────────────────────────────────────────
+@require_safe
+@condition(etag_func=_etag)
+def schema_view(request):
+    if settings.SCHEMA_LIVE:
+        return _live_view()(request)
+    response = FileResponse(_schema_path().open("rb"), content_type=CONTENT_TYPE)
+    # 매번 ETag 로 재검증 (배포 직후 바로 새 스키마)
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+@cache
+def _swagger_view():
+    from drf_spectacular.views import SpectacularSwaggerView
+
+    return SpectacularSwaggerView.as_view(url_name="schema")
+
+
+# ──────────────────────────────────────────────
+# GET /api/docs/
+# ──────────────────────────────────────────────
+@require_safe
+def swagger_view(request):
+    return _swagger_view()(request)
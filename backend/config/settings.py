@@ -1,6 +1,7 @@
 """
 Django settings for Sales Asset Portal.
 """
+import importlib.util
 import os
 from datetime import timedelta
 from pathlib import Path
@@ -20,7 +21,6 @@ ALLOWED_HOSTS = config("ALLOWED_HOSTS", default="*", cast=Csv())
 # Apps
 # ──────────────────────────────────────────────
 INSTALLED_APPS = [
-    "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
@@ -38,7 +38,13 @@ INSTALLED_APPS = [
     "apps.sharing",
     "apps.logs",
     "apps.announcements",
+    "apps.events",
+    "apps.dashboard",
 ]
+# Django admin — API 전용 워커에서 끄면 admin/폼 모듈과 각 앱 admin.py 를 부팅 때 읽지 않는다
+ADMIN_ENABLED = config("ADMIN_ENABLED", default=True, cast=bool)
+if ADMIN_ENABLED:
+    INSTALLED_APPS.insert(0, "django.contrib.admin")
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
@@ -50,6 +56,48 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
+# 응답 헤더에 요청별 쿼리 수/시간 (X-Query-Count, X-Query-Time-Ms) — 부하 테스트용
+QUERY_COUNT_HEADERS = config("QUERY_COUNT_HEADERS", default=DEBUG, cast=bool)
+if QUERY_COUNT_HEADERS:
+    MIDDLEWARE.insert(0, "config.querycount.QueryCountMiddleware")
+# X-Profile 헤더 + 슈퍼관리자 → 그 요청만 프로파일링 (config/profiling.py)
+PROFILING = config("PROFILING", default=True, cast=bool)
+if PROFILING:
+    MIDDLEWARE.insert(0, "config.profiling.ProfilingMiddleware")
+# Prometheus /metrics (prometheus_client 설치 시, config/metrics.py)
+METRICS = config("METRICS", default=importlib.util.find_spec("prometheus_client") is not None, cast=bool)
+if METRICS:
+    MIDDLEWARE.insert(0, "config.metrics.MetricsMiddleware")
+METRICS_TOKEN = config("METRICS_TOKEN", default="")  # scrape 에 Bearer 토큰 필요 (미설정 시 DEBUG 에서만 공개)
+METRICS_GAUGE_INTERVAL = config("METRICS_GAUGE_INTERVAL", default=5, cast=int)  # 초
+# URL 이름별 GET 쿼리 예산 (인증 포함) + N+1 감지 (config/querybudget.py, manage.py check_query_budgets)
+QUERY_BUDGET_CHECK = config("QUERY_BUDGET_CHECK", default=DEBUG, cast=bool)
+if QUERY_BUDGET_CHECK:
+    MIDDLEWARE.insert(0, "config.querybudget.QueryBudgetMiddleware")
+QUERY_N_PLUS_ONE_THRESHOLD = config("QUERY_N_PLUS_ONE_THRESHOLD", default=5, cast=int)
+# 값은 check_query_budgets 실측치 (PostgreSQL 16, 1행/100행 동일, 관리자/일반 사용자 동일)
+QUERY_BUDGETS = {
+    "auth-me": 3,
+    "user-list-create": 3,
+    "asset-list-create": 3,
+    "asset-detail": 8,  # ?include=versions,permissions,shareRequests,stats
+    "asset-versions": 2,
+    "asset-permissions": 2,
+    "asset-view": 0,  # grant 서명만 검증 (폐기 필터는 워커 기동 시 적재 + 백그라운드 동기화)
+    "asset-download": 0,
+    "share-request-list-create": 2,
+    "share-request-inbox": 3,  # + 역할 확인 (IsAdmin, claims 인증이면 0)
+    "share-request-mine": 2,
+    "share-request-by-asset": 3,
+    "share-request-summary": 2,
+    "log-list": 3,
+    "log-export": 2,
+    "announcement-latest": 2,
+    "dashboard-summary": 6,  # 캐시가 빈 상태 + 역할 확인 (IsAdmin)
+    "schema": 0,  # 빌드된 파일 (SCHEMA_LIVE=False)
+}
+PROFILE_DIR = config("PROFILE_DIR", default=str(BASE_DIR / "var" / "profiles"))
+PROFILE_MAX_FILES = config("PROFILE_MAX_FILES", default=200, cast=int)
 
 ROOT_URLCONF = "config.urls"
 
@@ -70,6 +118,9 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
+# ASGI 서버(uvicorn)로 띄울 때 True → 읽기 뷰를 async 로 처리 (config/async_views.py)
+ASYNC_VIEWS = config("ASYNC_VIEWS", default=False, cast=bool)
 
 # ──────────────────────────────────────────────
 # Database  (PostgreSQL 17)
@@ -85,6 +136,73 @@ DATABASES = {
     }
 }
 
+# 연결 재사용
+#   - psycopg 커넥션 풀 (Django 5.1 OPTIONS["pool"], psycopg_pool 이 있을 때): 워커 프로세스마다 풀 1개
+#     → 전체 연결 수 = 워커 수 × DB_POOL_MAX_SIZE 가 PostgreSQL max_connections 를 넘지 않게
+#   - 그 외: 지속 연결(CONN_MAX_AGE) + 재사용 전 상태 확인(CONN_HEALTH_CHECKS)
+#     ASGI(ASYNC_VIEWS)에서는 요청마다 스레드/컨텍스트가 달라 지속 연결이 쌓이므로 CONN_MAX_AGE=0
+#   - 풀에서 꺼낼 때 끊긴 연결 확인도 CONN_HEALTH_CHECKS 로 켠다 (Django 가 check 로 전달)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+DB_POOL = (
+    config("DB_POOL", default=True, cast=bool)
+    and importlib.util.find_spec("psycopg_pool") is not None
+)
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),  # 워커당 스레드 수 이상
+            "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),  # 빈 연결 대기(초)
+            "max_idle": config("DB_POOL_MAX_IDLE", default=300, cast=float),  # 유휴 연결 정리(초)
+            "max_lifetime": config("DB_POOL_MAX_LIFETIME", default=3600, cast=float),
+        },
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0 if ASYNC_VIEWS else config("DB_CONN_MAX_AGE", default=60, cast=int)
+
+# 읽기 복제본: "host:port,host:port" → replica1, replica2 ... (config/db_router.py)
+DB_REPLICA_HOSTS = config("DB_REPLICA_HOSTS", default="", cast=Csv())
+# 죽은 replica 에 연결을 시도하는 요청(지연 측정 포함)이 OS 기본 TCP 타임아웃까지 묶이지 않도록
+REPLICA_CONNECT_TIMEOUT = config("REPLICA_CONNECT_TIMEOUT", default=2, cast=int)  # 초
+for _i, _host in enumerate(DB_REPLICA_HOSTS, start=1):
+    _name, _, _port = _host.partition(":")
+    _options = {**DATABASES["default"].get("OPTIONS", {}), "connect_timeout": REPLICA_CONNECT_TIMEOUT}
+    if "pool" in _options:
+        _options["pool"] = {**_options["pool"], "timeout": REPLICA_CONNECT_TIMEOUT}
+    DATABASES[f"replica{_i}"] = {
+        **DATABASES["default"],
+        "HOST": _name,
+        "PORT": _port or DATABASES["default"]["PORT"],
+        "OPTIONS": _options,
+        "TEST": {"MIRROR": "default"},
+    }
+if DB_REPLICA_HOSTS:
+    DATABASE_ROUTERS = ["config.db_router.ReplicaRouter"]
+    MIDDLEWARE.append("config.db_router.ReplicaRoutingMiddleware")
+REPLICA_MAX_LAG = config("REPLICA_MAX_LAG", default=5.0, cast=float)  # 초, 넘으면 primary 로
+REPLICA_LAG_CHECK_INTERVAL = config("REPLICA_LAG_CHECK_INTERVAL", default=5, cast=int)  # 초
+READ_YOUR_WRITES_SECONDS = config("READ_YOUR_WRITES_SECONDS", default=10, cast=int)  # 쓰기 후 primary 고정
+
+# ──────────────────────────────────────────────
+# Cache  (REDIS_URL 미설정 시 프로세스 로컬 메모리)
+# ──────────────────────────────────────────────
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+# 캐시가 워커 간에 공유되는가 — False 면 다른 워커의 무효화/폐기는 캐시로 전달되지 않는다
+SHARED_CACHE = bool(REDIS_URL)
+# 공유 캐시가 없을 때 TwoLevelCache 값 보관 시간(초) = 다른 워커에 무효화가 늦게 보이는 최대 시간
+UNSHARED_CACHE_TTL = config("UNSHARED_CACHE_TTL", default=10, cast=int)
+
 # ──────────────────────────────────────────────
 # Custom User Model
 # ──────────────────────────────────────────────
@@ -118,7 +236,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # ──────────────────────────────────────────────
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.PortalJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
@@ -132,7 +250,7 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 20,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_RENDERER_CLASSES": (
-        "config.renderers.ApiRenderer",
+        "config.renderers.FastApiRenderer",
     ),
     "EXCEPTION_HANDLER": "config.exceptions.custom_exception_handler",
 }
@@ -147,7 +265,46 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
+    "TOKEN_REFRESH_SERIALIZER": "apps.accounts.tokens.PortalTokenRefreshSerializer",
 }
+# 읽기 요청은 토큰 claims 로 처리 (User 조회 생략).
+# 권한 버전 캐시가 워커 간에 공유되어야 하므로 기본값은 Redis 사용 여부를 따른다.
+JWT_CLAIMS_AUTH = config("JWT_CLAIMS_AUTH", default=bool(REDIS_URL), cast=bool)
+
+# 토큰 폐기 목록 (워커별 Bloom filter)
+REVOCATION_SYNC_INTERVAL = config("REVOCATION_SYNC_INTERVAL", default=5, cast=int)  # 초
+REVOCATION_REBUILD_INTERVAL = config("REVOCATION_REBUILD_INTERVAL", default=3600, cast=int)
+REVOCATION_BLOOM_CAPACITY = config("REVOCATION_BLOOM_CAPACITY", default=100_000, cast=int)
+REVOCATION_BLOOM_ERROR_RATE = config("REVOCATION_BLOOM_ERROR_RATE", default=0.001, cast=float)
+
+# 디렉터리 동기화 기본 소스 (파일 경로 또는 HR 서비스 URL)
+DIRECTORY_SYNC_SOURCE = config("DIRECTORY_SYNC_SOURCE", default="")
+
+# ──────────────────────────────────────────────
+# 자산 열람/다운로드 grant (서명 토큰, DB 조회 없이 검증)
+# ──────────────────────────────────────────────
+ASSET_GRANT_TTL = config("ASSET_GRANT_TTL", default=600, cast=int)  # 초
+
+# ──────────────────────────────────────────────
+# 실시간 이벤트 (SSE)  memory | redis
+# ──────────────────────────────────────────────
+EVENTS_BACKEND = config("EVENTS_BACKEND", default="redis" if REDIS_URL else "memory")
+EVENTS_HEARTBEAT = config("EVENTS_HEARTBEAT", default=15, cast=int)  # 초
+EVENTS_RETRY_MS = config("EVENTS_RETRY_MS", default=5000, cast=int)
+EVENTS_QUEUE_SIZE = config("EVENTS_QUEUE_SIZE", default=100, cast=int)  # 구독당 미전송 이벤트, 넘으면 연결 종료
+# WSGI(스레드 워커)에서 동시에 열 수 있는 스트림 수 (프로세스당) — 운영은 ASGI 로 서빙
+EVENTS_WSGI_MAX_STREAMS = config("EVENTS_WSGI_MAX_STREAMS", default=2 if DEBUG else 0, cast=int)
+
+# ──────────────────────────────────────────────
+# 배치 API (/api/batch)
+# ──────────────────────────────────────────────
+BATCH_MAX_REQUESTS = config("BATCH_MAX_REQUESTS", default=20, cast=int)
+BATCH_MAX_WORKERS = config("BATCH_MAX_WORKERS", default=4, cast=int)  # parallel=true 인 GET 묶음
+
+# ──────────────────────────────────────────────
+# 대시보드 합계 캐시
+# ──────────────────────────────────────────────
+DASHBOARD_CACHE_TTL = config("DASHBOARD_CACHE_TTL", default=30, cast=int)  # 초
 
 # ──────────────────────────────────────────────
 # CORS
@@ -167,3 +324,6 @@ SPECTACULAR_SETTINGS = {
     "DESCRIPTION": "Sales Asset Portal — REST API",
     "VERSION": "1.0.0",
 }
+# /api/schema/: 배포 시 build_schema 로 만든 파일을 서빙, SCHEMA_LIVE=True 면 요청마다 생성 (config/schema.py)
+SCHEMA_FILE = config("SCHEMA_FILE", default=str(BASE_DIR / "var" / "openapi.json"))
+SCHEMA_LIVE = config("SCHEMA_LIVE", default=DEBUG, cast=bool)
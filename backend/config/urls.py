@@ -1,10 +1,13 @@
-from django.contrib import admin
+from django.conf import settings
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from rest_framework_simplejwt.views import TokenRefreshView  # ← 추가
 
+from config.batch import BatchView
+from config.metrics import metrics_view
+from config.profiling import ProfileDetailView, ProfileDownloadView, ProfileListView
+from config.schema import schema_view, swagger_view
+
 urlpatterns = [
-    path("admin/", admin.site.urls),
     # API
     path("api/auth/", include("apps.accounts.urls")),
     path("api/auth/token/refresh", TokenRefreshView.as_view(), name="token-refresh"),  # ← 추가
@@ -13,7 +16,19 @@ urlpatterns = [
     path("api/share-requests/", include("apps.sharing.urls")),
     path("api/logs/", include("apps.logs.urls")),
     path("api/announcements/", include("apps.announcements.urls")),
+    path("api/events/", include("apps.events.urls")),
+    path("api/dashboard/", include("apps.dashboard.urls")),
+    path("api/batch", BatchView.as_view(), name="batch"),
+    path("api/admin/profiles", ProfileListView.as_view(), name="profile-list"),
+    path("api/admin/profiles/<str:profile_id>", ProfileDetailView.as_view(), name="profile-detail"),
+    path("api/admin/profiles/<str:profile_id>/download", ProfileDownloadView.as_view(), name="profile-download"),
+    path("metrics", metrics_view, name="metrics"),
     # Swagger
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger"),
-]
\ No newline at end of file
+    path("api/schema/", schema_view, name="schema"),  # 빌드된 파일 (config/schema.py)
+    path("api/docs/", swagger_view, name="swagger"),
+]
+
+if settings.ADMIN_ENABLED:
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
\ No newline at end of file
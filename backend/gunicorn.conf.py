@@ -0,0 +1,39 @@
+"""
+gunicorn -c gunicorn.conf.py config.wsgi                 # WSGI
+ASYNC_VIEWS=True gunicorn -c gunicorn.conf.py config.asgi  # ASGI (uvicorn 워커)
+
+PROMETHEUS_MULTIPROC_DIR 를 지정하면 워커별 메트릭 파일을 모아 /metrics 에서 합산한다.
+"""
+import os
+import shutil
+
+from decouple import config
+
+bind = config("GUNICORN_BIND", default="0.0.0.0:8000")
+workers = config("GUNICORN_WORKERS", default=4, cast=int)
+threads = config("GUNICORN_THREADS", default=8, cast=int)
+if config("ASYNC_VIEWS", default=False, cast=bool):
+    worker_class = "uvicorn.workers.UvicornWorker"
+
+_multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+def on_starting(server):
+    # 이전 실행의 메트릭 파일이 남아 있으면 카운터가 이어서 합산되므로 비운다
+    if _multiproc_dir:
+        shutil.rmtree(_multiproc_dir, ignore_errors=True)
+        os.makedirs(_multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if _multiproc_dir:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def post_worker_init(worker):
+    # 토큰/grant 폐기 목록을 요청 전에 적재하고 이후 동기화는 백그라운드 스레드로 (요청 경로 DB 조회 제거)
+    from apps.accounts.revocation import registry
+
+    registry.start()
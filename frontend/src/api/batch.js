@@ -0,0 +1,30 @@
+import client from "./client";
+
+/**
+ * POST /api/batch — 여러 API 호출을 한 번의 요청으로
+ * requests: [{ id, method = "GET", path, body }]
+ * 반환: { [id]: data }  (실패한 하위 요청은 Error 객체)
+ *
+ * 예) const { assets, summary } = await batch([
+ *       { id: "assets", path: "/api/assets/?type=VIDEO" },
+ *       { id: "summary", path: "/api/share-requests/summary" },
+ *     ], { parallel: true });
+ */
+export async function batch(requests, { parallel = false } = {}) {
+  const res = await client.post("/api/batch", { requests, parallel });
+  const result = {};
+  for (const { id, status, body } of res.data.responses) {
+    if (body && typeof body === "object" && "success" in body) {
+      result[id] = body.success ? body.data : new Error(stringifyMessage(body.message, status));
+    } else {
+      result[id] = status < 400 ? body : new Error(`요청 실패 (${status})`);
+    }
+  }
+  return result;
+}
+
+function stringifyMessage(message, status) {
+  if (typeof message === "string") return message;
+  if (message) return Object.values(message).flat().join(" / ");
+  return `요청 실패 (${status})`;
+}
@@ -0,0 +1,23 @@
+/**
+ * src/api/events.js
+ * GET /api/events/stream (Server-Sent Events)
+ * 공유요청 처리/공지 등록을 폴링 없이 수신
+ */
+const BASE_URL = import.meta.env.VITE_API_URL || "http://localhost:8000";
+
+/**
+ * subscribeEvents({ "share_request.updated": (data) => ..., "announcement.created": ... })
+ * → 구독 해제 함수 반환
+ */
+export function subscribeEvents(handlers = {}) {
+  const token = localStorage.getItem("accessToken");
+  if (!token) return () => {};
+
+  const source = new EventSource(
+    `${BASE_URL}/api/events/stream?token=${encodeURIComponent(token)}`
+  );
+  Object.entries(handlers).forEach(([event, handler]) => {
+    source.addEventListener(event, (e) => handler(JSON.parse(e.data)));
+  });
+  return () => source.close();
+}
@@ -3,9 +3,14 @@
  */
 import api from './client';
 
+/**
+ * GET /share-requests/?status=&cursor=&pageSize=
+ * Response: 커서 페이지 { next, previous, results } → 다음 페이지는 next URL 의 cursor 로 요청
+ */
 export async function getShareRequests(params = {}) {
   const { data } = await api.get('/share-requests/', { params });
-  return data.data;
+  const cursor = data?.next ? new URL(data.next).searchParams.get('cursor') : null;
+  return { results: data?.results ?? [], nextCursor: cursor };
 }
 
 export async function createShareRequest(assetId, reason) {